@@ -0,0 +1,34 @@
+"""Add resume ingestion status and source file
+
+Revision ID: 0a6c4e9d7f21
+Revises: f17b3d08a6c2
+Create Date: 2026-10-17 16:31:44.508126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a6c4e9d7f21'
+down_revision: Union[str, Sequence[str], None] = 'f17b3d08a6c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('resumes', sa.Column('status', sa.String(), server_default='ready', nullable=True))
+    op.add_column('resumes', sa.Column('error', sa.Text(), nullable=True))
+    op.add_column('resumes', sa.Column('source_filename', sa.String(), nullable=True))
+    op.add_column('resumes', sa.Column('source_file', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('resumes', 'source_file')
+    op.drop_column('resumes', 'source_filename')
+    op.drop_column('resumes', 'error')
+    op.drop_column('resumes', 'status')
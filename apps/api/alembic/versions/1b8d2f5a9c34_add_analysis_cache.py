@@ -0,0 +1,40 @@
+"""Add resume analysis cache table
+
+Revision ID: 1b8d2f5a9c34
+Revises: 0a6c4e9d7f21
+Create Date: 2026-10-17 17:06:52.871203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b8d2f5a9c34'
+down_revision: Union[str, Sequence[str], None] = '0a6c4e9d7f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('analysis_cache',
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('prompt_version', sa.String(), nullable=False),
+    sa.Column('text_hash', sa.String(length=64), nullable=False),
+    sa.Column('structured_data', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('last_used_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('model', 'prompt_version', 'text_hash')
+    )
+    op.create_index(op.f('ix_analysis_cache_created_at'), 'analysis_cache', ['created_at'], unique=False)
+    op.create_index(op.f('ix_analysis_cache_last_used_at'), 'analysis_cache', ['last_used_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_analysis_cache_last_used_at'), table_name='analysis_cache')
+    op.drop_index(op.f('ix_analysis_cache_created_at'), table_name='analysis_cache')
+    op.drop_table('analysis_cache')
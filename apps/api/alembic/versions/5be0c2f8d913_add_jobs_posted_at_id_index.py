@@ -0,0 +1,33 @@
+"""Add jobs (posted_at, id) index for keyset pagination
+
+Revision ID: 5be0c2f8d913
+Revises: 3a9d5e1c7b42
+Create Date: 2026-10-17 10:02:15.530871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5be0c2f8d913'
+down_revision: Union[str, Sequence[str], None] = '3a9d5e1c7b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_jobs_posted_at_id',
+        'jobs',
+        [sa.text('posted_at DESC NULLS LAST'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_posted_at_id', table_name='jobs')
@@ -0,0 +1,107 @@
+"""Add precomputed job location classification
+
+Revision ID: 9f4e6a0b2d57
+Revises: 5be0c2f8d913
+Create Date: 2026-10-17 11:20:47.904412
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f4e6a0b2d57'
+down_revision: Union[str, Sequence[str], None] = '5be0c2f8d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of services/jobs/location.py as of this revision, so later
+# changes to the live classifier don't change what this backfill writes.
+WORLDWIDE_TERMS = ["worldwide", "anywhere", "global", "international", "distributed"]
+RESTRICTION_SEPARATORS = [" - ", ", ", "/", ":"]
+REGION_ALIASES = {
+    "united states of america": "usa",
+    "united states": "usa",
+    "u.s.a.": "usa",
+    "u.s.": "usa",
+    "us": "usa",
+    "united kingdom": "uk",
+    "great britain": "uk",
+    "gb": "uk",
+    "united arab emirates": "uae",
+    "european union": "eu",
+}
+_ALIAS_PATTERN = re.compile(
+    r"(?<![\w.])(" + "|".join(
+        re.escape(alias) for alias in sorted(REGION_ALIASES, key=len, reverse=True)
+    ) + r")(?![\w])"
+)
+_TOKEN_SPLIT = re.compile(r"[^\w]+")
+
+
+def _location_tokens(location):
+    if not location:
+        return []
+    text = _ALIAS_PATTERN.sub(lambda m: REGION_ALIASES[m.group(1)], location.lower())
+    return sorted({t for t in _TOKEN_SPLIT.split(text) if len(t) > 1})
+
+
+def _classify_location(location):
+    """(is_worldwide, remote_kind, regions)"""
+    if location is None or location == "":
+        return True, "unspecified", []
+    regions = _location_tokens(location)
+    if any(term in location.lower() for term in WORLDWIDE_TERMS):
+        return True, "worldwide", regions
+    if "remote" in location.lower():
+        if any(sep in location for sep in RESTRICTION_SEPARATORS):
+            return False, "remote_restricted", regions
+        return True, "remote", regions
+    return False, "onsite", regions
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('location_is_worldwide', sa.Boolean(), nullable=True))
+    op.add_column('jobs', sa.Column('location_remote_kind', sa.String(), nullable=True))
+    op.add_column('jobs', sa.Column('location_regions', postgresql.ARRAY(sa.String()), nullable=True))
+
+    # Backfill: classify each distinct location string once in Python and
+    # apply it to every row sharing it (far fewer distinct locations than jobs).
+    bind = op.get_bind()
+    jobs = sa.table(
+        'jobs',
+        sa.column('location', sa.String()),
+        sa.column('location_is_worldwide', sa.Boolean()),
+        sa.column('location_remote_kind', sa.String()),
+        sa.column('location_regions', postgresql.ARRAY(sa.String())),
+    )
+    locations = [row[0] for row in bind.execute(sa.select(jobs.c.location).distinct())]
+    for location in locations:
+        is_worldwide, remote_kind, regions = _classify_location(location)
+        match = jobs.c.location.is_(None) if location is None else jobs.c.location == location
+        bind.execute(
+            jobs.update().where(match).values(
+                location_is_worldwide=is_worldwide,
+                location_remote_kind=remote_kind,
+                location_regions=regions,
+            )
+        )
+
+    op.create_index(op.f('ix_jobs_location_is_worldwide'), 'jobs', ['location_is_worldwide'], unique=False)
+    op.create_index(op.f('ix_jobs_location_remote_kind'), 'jobs', ['location_remote_kind'], unique=False)
+    op.create_index('ix_jobs_location_regions', 'jobs', ['location_regions'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_location_regions', table_name='jobs', postgresql_using='gin')
+    op.drop_index(op.f('ix_jobs_location_remote_kind'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_location_is_worldwide'), table_name='jobs')
+    op.drop_column('jobs', 'location_regions')
+    op.drop_column('jobs', 'location_remote_kind')
+    op.drop_column('jobs', 'location_is_worldwide')
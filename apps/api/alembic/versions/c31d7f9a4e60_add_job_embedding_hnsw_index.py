@@ -0,0 +1,38 @@
+"""Add HNSW index on job embeddings
+
+Revision ID: c31d7f9a4e60
+Revises: 9f4e6a0b2d57
+Create Date: 2026-10-17 12:41:09.226318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c31d7f9a4e60'
+down_revision: Union[str, Sequence[str], None] = '9f4e6a0b2d57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # HNSW needs pgvector >= 0.5. Unlike IVFFlat it needs no training data,
+    # so it can be built on an empty or still-growing table.
+    op.create_index(
+        'ix_jobs_embedding_hnsw',
+        'jobs',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_embedding_hnsw', table_name='jobs', postgresql_using='hnsw')
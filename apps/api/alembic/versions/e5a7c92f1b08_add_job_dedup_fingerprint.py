@@ -0,0 +1,208 @@
+"""Add job dedup key and content simhash
+
+Revision ID: e5a7c92f1b08
+Revises: d84b1e27c5f3
+Create Date: 2026-10-17 15:02:18.337410
+
+"""
+import hashlib
+import re
+from typing import Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c92f1b08'
+down_revision: Union[str, Sequence[str], None] = 'd84b1e27c5f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Frozen copy of the URL canonicalization and fingerprinting in
+# services/jobs/dedup.py as of this revision, so later changes there don't
+# change what this backfill writes.
+TRACKING_PARAMS = {
+    "ref", "referrer", "source", "src", "campaign", "gclid", "fbclid",
+    "mc_cid", "mc_eid", "igshid", "trk", "trackingid", "refid", "from",
+}
+TRACKING_PARAM_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+COMPANY_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "gmbh", "corp",
+    "corporation", "co", "plc", "sa", "ag", "bv", "srl", "pty",
+}
+PLACEHOLDER_PREFIXES = ("job scraped from ", "scraped from ")
+PLACEHOLDER_COMPANIES = {"", "unknown", "company", "startup"}
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _canonicalize_url(url):
+    if not url:
+        return url
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "https").lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    netloc = host
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{parts.port}"
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def _words(text):
+    return _WORD_RE.findall(_TAG_RE.sub(" ", text or "").lower())
+
+
+def _normalize_company(company):
+    words = _words(company)
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def _dedup_key(title, company):
+    company = _normalize_company(company)
+    if company in PLACEHOLDER_COMPANIES:
+        return None
+    return hashlib.sha1(f"{' '.join(_words(title))}|{company}".encode("utf-8")).hexdigest()
+
+
+def _content_simhash(title, company, description):
+    text = (description or "").strip().lower()
+    if not text or text.startswith(PLACEHOLDER_PREFIXES):
+        return None
+    words = _words(title) + _words(_normalize_company(company)) + _words(description)
+    if len(words) < SHINGLE_SIZE:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    value = sum(1 << bit for bit in range(SIMHASH_BITS) if weights[bit] > 0)
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('jobs', sa.Column('dedup_key', sa.String(length=40), nullable=True))
+    op.add_column('jobs', sa.Column('content_simhash', sa.BigInteger(), nullable=True))
+
+    # Backfill in id order, a batch at a time. Near-duplicates already stored
+    # are left in place; the fingerprints only stop new ones from being
+    # ingested. Exact duplicates by canonical URL are merged below.
+    bind = op.get_bind()
+    jobs = sa.table(
+        'jobs',
+        sa.column('id', sa.Integer()),
+        sa.column('title', sa.String()),
+        sa.column('company', sa.String()),
+        sa.column('description', sa.Text()),
+        sa.column('dedup_key', sa.String()),
+        sa.column('content_simhash', sa.BigInteger()),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(jobs.c.id, jobs.c.title, jobs.c.company, jobs.c.description)
+            .where(jobs.c.id > last_id)
+            .order_by(jobs.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            jobs.update().where(jobs.c.id == sa.bindparam('job_id')).values(
+                dedup_key=sa.bindparam('key'), content_simhash=sa.bindparam('simhash'),
+            ),
+            [
+                {
+                    'job_id': row.id,
+                    'key': _dedup_key(row.title, row.company),
+                    'simhash': _content_simhash(row.title, row.company, row.description),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+    _canonicalize_stored_urls(bind)
+
+    op.create_index(op.f('ix_jobs_dedup_key'), 'jobs', ['dedup_key'], unique=False)
+
+
+def _canonicalize_stored_urls(bind):
+    """
+    Rewrites jobs.url into the canonical form ingest now writes, so
+    ON CONFLICT (url) keeps matching stored rows. Rows whose URLs collapse
+    onto the same canonical URL are merged into the lowest id: applications
+    are re-pointed to it and the other rows deleted, before any rename (the
+    url column is unique).
+    """
+    jobs = sa.table('jobs', sa.column('id', sa.Integer()), sa.column('url', sa.String()))
+    applications = sa.table('applications', sa.column('job_id', sa.Integer()))
+
+    owners = {}  # canonical url -> lowest id
+    renames = []  # (id, canonical url)
+    merges = []  # (duplicate id, kept id)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(jobs.c.id, jobs.c.url)
+            .where(jobs.c.id > last_id)
+            .order_by(jobs.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        for row in rows:
+            canonical = _canonicalize_url(row.url)
+            if not canonical:
+                continue
+            if canonical in owners:
+                merges.append((row.id, owners[canonical]))
+                continue
+            owners[canonical] = row.id
+            if canonical != row.url:
+                renames.append((row.id, canonical))
+        last_id = rows[-1].id
+
+    for start in range(0, len(merges), BACKFILL_BATCH_SIZE):
+        batch = merges[start:start + BACKFILL_BATCH_SIZE]
+        bind.execute(
+            applications.update().where(applications.c.job_id == sa.bindparam('duplicate_id'))
+            .values(job_id=sa.bindparam('kept_id')),
+            [{'duplicate_id': duplicate_id, 'kept_id': kept_id} for duplicate_id, kept_id in batch],
+        )
+        bind.execute(jobs.delete().where(jobs.c.id.in_([duplicate_id for duplicate_id, _ in batch])))
+
+    for start in range(0, len(renames), BACKFILL_BATCH_SIZE):
+        bind.execute(
+            jobs.update().where(jobs.c.id == sa.bindparam('job_id')).values(url=sa.bindparam('canonical')),
+            [{'job_id': job_id, 'canonical': url} for job_id, url in renames[start:start + BACKFILL_BATCH_SIZE]],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema. Canonicalized URLs and merged duplicates are not restored."""
+    op.drop_index(op.f('ix_jobs_dedup_key'), table_name='jobs')
+    op.drop_column('jobs', 'content_simhash')
+    op.drop_column('jobs', 'dedup_key')
@@ -0,0 +1,39 @@
+"""Add scrape state table
+
+Revision ID: f17b3d08a6c2
+Revises: e5a7c92f1b08
+Create Date: 2026-10-17 15:48:06.219873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f17b3d08a6c2'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c92f1b08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('scrape_state',
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('query', sa.String(), nullable=False),
+    sa.Column('newest_posted_at', sa.DateTime(), nullable=True),
+    sa.Column('newest_url', sa.String(), nullable=True),
+    sa.Column('recent_urls', postgresql.ARRAY(sa.String()), nullable=True),
+    sa.Column('etag', sa.String(), nullable=True),
+    sa.Column('last_modified', sa.String(), nullable=True),
+    sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('source', 'query')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('scrape_state')
@@ -0,0 +1,89 @@
+"""
+Micro-benchmark for the scraper parsing path (services/browser/html_parsing.py).
+
+Compares, on the saved pages in tests/fixtures/:
+  - listing pages: the previous approach (BeautifulSoup "html.parser", selector
+    chains re-parsed per card) vs JobScraper._parse_<source>
+  - descriptions: BeautifulSoup(...).get_text(...) vs strip_html
+
+Usage: python bench_html_parsing.py [rounds]
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from services.browser.html_parsing import SOUP_FEATURES, strip_html
+from services.browser.job_scraper import JobScraper
+
+FIXTURES = Path(__file__).parent / "tests" / "fixtures"
+
+# fixture → (parse method, extra args, card chain, per-card field chains)
+LISTINGS = {
+    "weworkremotely.html": ("_parse_weworkremotely", ("python",), "WWR_ITEMS",
+                            ("WWR_TITLE", "WWR_COMPANY", "WWR_REGION", "WWR_LINK")),
+    "wellfound.html": ("_parse_wellfound", ("software-engineer", "fixture"), "WELLFOUND_CARDS",
+                       ("WELLFOUND_TITLE", "WELLFOUND_COMPANY", "WELLFOUND_LOCATION", "WELLFOUND_LINK")),
+    "monster.html": ("_parse_monster", ("python developer", "remote"), "MONSTER_CARDS",
+                     ("MONSTER_TITLE", "MONSTER_COMPANY", "MONSTER_LOCATION", "MONSTER_LINK")),
+    "naukri.html": ("_parse_naukri", ("python developer", ""), "NAUKRI_CARDS",
+                    ("NAUKRI_TITLE", "NAUKRI_COMPANY", "NAUKRI_LOCATION")),
+}
+
+
+def legacy_parse(html: str, cards_chain, field_chains) -> int:
+    """The old shape: html.parser tree, `select(a) or select(b)` chains as raw strings."""
+    soup = BeautifulSoup(html, "html.parser")
+    cards = []
+    for selector in cards_chain.selectors:
+        cards = soup.select(selector)
+        if cards:
+            break
+    for card in cards:
+        for chain in field_chains:
+            for selector in chain.selectors:
+                if card.select_one(selector) is not None:
+                    break
+    return len(cards)
+
+
+def timed(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main(rounds: int = 20):
+    scraper = JobScraper(db=None)
+    print(f"Tree builder: {SOUP_FEATURES}, {rounds} rounds\n")
+    print(f"{'fixture':<24}{'jobs':>6}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+
+    for name, (method, args, cards_attr, field_attrs) in LISTINGS.items():
+        html = (FIXTURES / name).read_text()
+        cards_chain = getattr(JobScraper, cards_attr)
+        field_chains = [getattr(JobScraper, attr) for attr in field_attrs]
+        parse = getattr(scraper, method)
+
+        jobs = parse(html, *args)
+        before = timed(lambda: legacy_parse(html, cards_chain, field_chains), rounds)
+        after = timed(lambda: parse(html, *args), rounds)
+        print(f"{name:<24}{len(jobs):>6}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+
+    descriptions = json.loads((FIXTURES / "job_descriptions.json").read_text())
+    mismatches = sum(
+        strip_html(d) != BeautifulSoup(d, "html.parser").get_text(separator=" ", strip=True)[:2000]
+        for d in descriptions
+    )
+    before = timed(lambda: [
+        BeautifulSoup(d, "html.parser").get_text(separator=" ", strip=True)[:2000] for d in descriptions
+    ], rounds)
+    after = timed(lambda: [strip_html(d) for d in descriptions], rounds)
+    print(f"{'descriptions (x' + str(len(descriptions)) + ')':<24}{'':>6}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+    print(f"\nstrip_html output differs from get_text on {mismatches}/{len(descriptions)} descriptions")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -14,7 +14,7 @@ celery_app = Celery(
     "aijobapplyportal",
     broker=REDIS_URL,
     backend=REDIS_URL,
-    include=["tasks.scraping_tasks"],
+    include=["tasks.scraping_tasks", "tasks.embedding_tasks", "tasks.resume_tasks"],
 )
 
 celery_app.conf.update(
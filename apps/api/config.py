@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -10,6 +11,42 @@ class Settings(BaseSettings):
     CLERK_ISSUER: str = os.getenv("CLERK_ISSUER", "") # e.g., https://clerk.your-domain.com
     CLERK_API_KEY: str = os.getenv("CLERK_API_KEY", "") 
     
+    # Vector search: HNSW candidate list size per query. Higher = better
+    # recall, slower queries. Overridable per request on /matches.
+    VECTOR_EF_SEARCH: int = int(os.getenv("VECTOR_EF_SEARCH", "40"))
+    
+    # Embedding backend: "auto" (OpenAI if OPENAI_API_KEY is set, else local),
+    # "openai", or "local" (deterministic offline hashing embeddings)
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "auto")
+    
+    # Browser scraping engine: "sync" (one page per worker thread) or
+    # "async" (many pages per source from one event loop)
+    SCRAPER_ENGINE: str = os.getenv("SCRAPER_ENGINE", "sync")
+    
+    # Abort image/font/media and off-domain requests in scraping browser
+    # contexts (services/browser/resource_blocking.py)
+    SCRAPER_BLOCK_RESOURCES: bool = os.getenv("SCRAPER_BLOCK_RESOURCES", "1") == "1"
+    
+    # Incremental scraping: skip listing items already seen on earlier runs
+    # and send conditional requests to the JSON APIs (0 forces a full re-scrape)
+    SCRAPE_INCREMENTAL: bool = os.getenv("SCRAPE_INCREMENTAL", "1") == "1"
+    
+    # Worker processes for resume text extraction (pdfminer, docx, ...)
+    RESUME_PARSER_PROCESSES: int = int(os.getenv("RESUME_PARSER_PROCESSES", "2"))
+    
+    # Content-hash embedding cache (0 entries disables it)
+    EMBEDDING_CACHE_MAX_ENTRIES: int = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "200000"))
+    
+    # LLM resume analysis cache (0 entries disables it); entries expire after the TTL
+    ANALYSIS_CACHE_MAX_ENTRIES: int = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "20000"))
+    ANALYSIS_CACHE_TTL_DAYS: int = int(os.getenv("ANALYSIS_CACHE_TTL_DAYS", "90"))
+    
+    # Tailored resume cache (structured data + PDF on disk, LRU). Holds
+    # resume PII, so it defaults outside the repo; 0 entries disables it.
+    TAILOR_CACHE_DIR: str = os.getenv("TAILOR_CACHE_DIR", os.path.join(tempfile.gettempdir(), "aijobapply-tailor-cache"))
+    TAILOR_CACHE_MAX_ENTRIES: int = int(os.getenv("TAILOR_CACHE_MAX_ENTRIES", "500"))
+    TAILOR_CACHE_MAX_MB: int = int(os.getenv("TAILOR_CACHE_MAX_MB", "200"))
+    
     class Config:
         env_file = ".env"
         extra = "ignore"
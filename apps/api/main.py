@@ -1,10 +1,13 @@
 import os
-from typing import List
-from fastapi import Depends, FastAPI, HTTPException
+from typing import List, Optional
+from fastapi import Depends, FastAPI, HTTPException, Response
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from database import get_db
 from models import Job
+from services.jobs.pagination import (
+    JOB_LISTING_ORDER, InvalidCursorError, encode_cursor, fetch_page_after
+)
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -31,7 +34,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["Content-Disposition"],
+    expose_headers=["Content-Disposition", "X-Next-Cursor"],
 )
 
 from routers import job, resume, matching, application
@@ -71,7 +74,33 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/health/parser")
+async def parser_health():
+    """Resume parser pool state and per-format parse-time metrics (this process)."""
+    return resume.parsing_service.stats()
+
 @app.get("/jobs", response_model=List[JobSchema])
-async def get_jobs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    jobs = db.query(Job).offset(skip).limit(limit).all()
+async def get_jobs(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Legacy listing. The body stays a bare list, so the keyset cursor for the
+    next page travels in the X-Next-Cursor header; `skip` is ignored when a
+    cursor is given.
+    """
+    if cursor:
+        try:
+            jobs, next_cursor = fetch_page_after(db.query(Job), cursor, limit)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        jobs = db.query(Job).order_by(*JOB_LISTING_ORDER).offset(skip).limit(limit + 1).all()
+        next_cursor = encode_cursor(jobs[limit - 1]) if len(jobs) > limit else None
+        jobs = jobs[:limit]
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return jobs
@@ -1,7 +1,10 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, JSON, Enum as SQLEnum, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, ForeignKey, DateTime, Text, JSON, LargeBinary, Enum as SQLEnum, Float, Computed, Index, event
+from sqlalchemy.dialects.postgresql import TSVECTOR, ARRAY
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from database import Base
+from services.jobs.location import location_columns
+from services.jobs.dedup import dedup_columns
 from pgvector.sqlalchemy import Vector
 import enum
 
@@ -35,15 +38,62 @@ class Job(Base):
     title = Column(String, index=True)
     company = Column(String, index=True)
     location = Column(String, index=True)
+    # Precomputed from `location` at ingest (see services/jobs/location.py)
+    location_is_worldwide = Column(Boolean, index=True)
+    location_remote_kind = Column(String, index=True)  # worldwide, remote, remote_restricted, onsite, unspecified
+    location_regions = Column(ARRAY(String))  # normalized tokens, GIN-indexed
     description = Column(Text)
-    url = Column(String, unique=True)
+    url = Column(String, unique=True)  # canonicalized at ingest (services/jobs/dedup.py)
     source = Column(String)  # e.g., "linkedin", "indeed"
+    # Cross-source duplicate detection: bucket key + 64-bit content SimHash
+    dedup_key = Column(String(40), index=True)  # NULL for fallback company names
+    content_simhash = Column(BigInteger)  # NULL for placeholder descriptions
     posted_at = Column(DateTime(timezone=True))
     embedding = Column(Vector(1536))  # Semantic embedding of the job description
+    # Full-text search document, maintained by Postgres as a generated column.
+    # Title outranks company, which outranks the (long) description body.
+    # Deferred so plain listings don't drag the tsvector over the wire.
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(company, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'C')",
+            persisted=True,
+        ),
+    ))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     applications = relationship("Application", back_populates="job")
 
+    __table_args__ = (
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        # Serves keyset pagination: ORDER BY posted_at DESC NULLS LAST, id DESC
+        Index("ix_jobs_posted_at_id", posted_at.desc().nulls_last(), id.desc()),
+        Index("ix_jobs_location_regions", "location_regions", postgresql_using="gin"),
+        # ANN index for resume→job matching (cosine distance, <=>)
+        Index(
+            "ix_jobs_embedding_hnsw", "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+    )
+
+@event.listens_for(Job, "before_insert")
+@event.listens_for(Job, "before_update")
+def _classify_job_location(mapper, connection, target):
+    """Keeps the location_* columns in sync for ORM writes (core inserts set them explicitly)."""
+    for column, value in location_columns(target.location).items():
+        setattr(target, column, value)
+
+@event.listens_for(Job, "before_insert")
+@event.listens_for(Job, "before_update")
+def _fingerprint_job(mapper, connection, target):
+    """Keeps dedup_key / content_simhash in sync for ORM writes (core inserts set them explicitly)."""
+    for column, value in dedup_columns(target.title, target.company, target.description).items():
+        setattr(target, column, value)
+
 from pgvector.sqlalchemy import Vector
 
 class Resume(Base):
@@ -55,6 +105,11 @@ class Resume(Base):
     structured_data = Column(JSON, nullable=True) # JSON extraction of skills, exp, etc.
     embedding = Column(Vector(1536))  # 1536 dimensions for OpenAI text-embedding-3-small
     is_default = Column(Boolean, default=False)
+    # Ingestion: "processing" while tasks/resume_tasks.py works on an upload, then "ready" or "failed"
+    status = Column(String, default="ready", server_default="ready")
+    error = Column(Text, nullable=True)  # User-facing reason when status == "failed"
+    source_filename = Column(String, nullable=True)
+    source_file = deferred(Column(LargeBinary, nullable=True))  # Uploaded bytes, kept for (re)processing
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     user = relationship("User", back_populates="resumes")
@@ -78,3 +133,37 @@ class Application(Base):
     user = relationship("User", back_populates="applications")
     job = relationship("Job", back_populates="applications")
     resume = relationship("Resume", back_populates="applications")
+
+class EmbeddingCacheEntry(Base):
+    """Embeddings keyed by (model, hash of normalized text) — see services/resume/embedding_cache.py"""
+    __tablename__ = "embedding_cache"
+
+    model = Column(String, primary_key=True)
+    text_hash = Column(String(64), primary_key=True)
+    embedding = Column(Vector(1536), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+class ScrapeState(Base):
+    """Per-(source, query) high-water marks for incremental scraping — see services/browser/scrape_state.py"""
+    __tablename__ = "scrape_state"
+
+    source = Column(String, primary_key=True)
+    query = Column(String, primary_key=True)  # search term / tag / category, "" when the source has none
+    newest_posted_at = Column(DateTime)  # naive UTC, as the scrapers parse it
+    newest_url = Column(String)
+    recent_urls = Column(ARRAY(String))  # canonical URLs from the top of the last listing
+    etag = Column(String)
+    last_modified = Column(String)
+    last_run_at = Column(DateTime(timezone=True))
+
+class AnalysisCacheEntry(Base):
+    """LLM resume analyses keyed by (model, prompt version, text hash) — see services/resume/analysis_cache.py"""
+    __tablename__ = "analysis_cache"
+
+    model = Column(String, primary_key=True)
+    prompt_version = Column(String, primary_key=True)
+    text_hash = Column(String(64), primary_key=True)
+    structured_data = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
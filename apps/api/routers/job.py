@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, or_
 from database import get_db
 from models import Job
-from typing import List, Optional
+from services.jobs.counting import CountResult, count_jobs
+from services.jobs.facets import facet_counts
+from services.jobs.filters_cache import etag_matches, load_filters, store_filters
+from services.jobs.location import location_tokens
+from services.jobs.pagination import (
+    JOB_LISTING_ORDER, InvalidCursorError, encode_cursor, fetch_page_after
+)
+from typing import Dict, List, Literal, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -22,12 +30,19 @@ class JobSchema(BaseModel):
     class Config:
         from_attributes = True
 
+class JobFacetsSchema(BaseModel):
+    sources: Dict[str, int]
+    location_buckets: Dict[str, int]  # worldwide, remote, remote_restricted, onsite, unspecified
+
 class JobListResponse(BaseModel):
     jobs: List[JobSchema]
     total: int
+    total_is_exact: bool = True  # False → `total` is a lower bound/estimate ("1000+")
     page: int
     limit: int
     total_pages: int
+    next_cursor: Optional[str] = None  # pass back as ?cursor= for the next page
+    facets: Optional[JobFacetsSchema] = None  # only with include_facets=true
 
 class FiltersResponse(BaseModel):
     categories: List[str]
@@ -35,36 +50,58 @@ class FiltersResponse(BaseModel):
     sources: List[str]
     total_jobs: int
 
-# Terms that mean "available from ANYWHERE in the world" — no country restriction
-# NOTE: "remote" is intentionally excluded because "Remote - US", "Remote: Spain"
-# etc. are country-restricted remote jobs. Only include purely global terms.
-WORLDWIDE_TERMS = [
-    "worldwide", "anywhere", "global", "international", "distributed"
-]
+# Text-search configuration used for both the stored Job.search_vector column
+# and the query side — they must match or the GIN index can't be used.
+SEARCH_CONFIG = "english"
+
+def search_tsquery(search: str):
+    """
+    Builds a tsquery from free-form user input. websearch_to_tsquery never
+    raises on odd punctuation and understands "quoted phrases", OR and -negation.
+    """
+    return func.websearch_to_tsquery(SEARCH_CONFIG, search)
 
-def is_worldwide_term(location: str) -> bool:
-    """Returns True if the location query itself means worldwide/remote."""
-    loc_lower = location.lower()
-    return any(wt in loc_lower for wt in WORLDWIDE_TERMS)
+def _filter_key(search, search_mode, location, source) -> tuple:
+    """Normalized filter tuple — equivalent requests share cached counts and facets."""
+    def norm(value):
+        return " ".join(value.lower().split()) if value else ""
+    return (norm(search), search_mode if search else "", norm(location), source or "")
 
 @router.get("/", response_model=JobListResponse)
 def get_jobs(
     search: Optional[str] = Query(None, description="Search in title, company, description"),
+    search_mode: Literal["ranked", "substring"] = Query(
+        "ranked",
+        description="'ranked' uses the full-text index; 'substring' keeps the legacy ILIKE matching"
+    ),
     location: Optional[str] = Query(None, description="Filter by location"),
     source: Optional[str] = Query(None, description="Filter by source"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Jobs per page"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor"),
+    include_facets: bool = Query(False, description="Add per-source and per-location-bucket counts"),
     db: Session = Depends(get_db)
 ):
     """
     Get jobs with intelligent filtering and pagination.
     Location filter uses smart OR logic — specific location queries also include
     worldwide/remote/anywhere jobs since those are available from any country.
+    Chronological listings return a next_cursor; following it instead of
+    bumping `page` keeps deep pages as cheap as the first. Ranked search
+    results are ordered by relevance and paged by `page` only.
     """
     query = db.query(Job)
+    search = search.strip() if search else None
+    rank = None
     
     # ── Search filter ──────────────────────────────────────────────────────────
-    if search:
+    # ranked:    GIN-indexed full-text match on Job.search_vector, best matches first
+    # substring: legacy '%term%' ILIKE across title/company/description (seq scan)
+    if search and search_mode == "ranked":
+        tsquery = search_tsquery(search)
+        query = query.filter(Job.search_vector.op("@@")(tsquery))
+        rank = func.ts_rank_cd(Job.search_vector, tsquery)
+    elif search:
         search_filter = or_(
             Job.title.ilike(f"%{search}%"),
             Job.company.ilike(f"%{search}%"),
@@ -74,69 +111,80 @@ def get_jobs(
     
     # ── Location filter (INTELLIGENT) ─────────────────────────────────────────
     # Fallback logic:
-    #   a) Match jobs whose location field contains the search tokens (OR)
-    #   b) Include truly worldwide jobs:
+    #   a) Match jobs whose normalized location tokens overlap the query's (OR)
+    #   b) Include truly worldwide jobs (precomputed at ingest, see
+    #      services/jobs/location.py:classify_location):
     #      - NULL/empty location (scrapers often omit for worldwide remote roles)
     #      - location contains "worldwide", "anywhere", "global", "international"
     #      - location contains "remote" BUT has no country suffix
     #        (i.e. no separator like " - ", ", ", "/", ":" after "remote")
+    # Both branches are index lookups (GIN on location_regions, btree on the flag).
     if location:
-        loc_stripped = location.strip()
-        tokens = [t.strip() for t in loc_stripped.replace(',', ' ').split() if len(t.strip()) > 1]
-
-        conditions = []
-
-        # (a) Direct token matches — OR across tokens
-        for token in tokens:
-            conditions.append(Job.location.ilike(f"%{token}%"))
-
-        # (b) Worldwide fallback — truly unrestricted jobs
-        # 1. Pure global terms
-        for wt in WORLDWIDE_TERMS:
-            conditions.append(Job.location.ilike(f"%{wt}%"))
-
-        # 2. "Remote" ONLY if no country suffix separators
-        #    This includes "Remote" but excludes "Remote - US", "Remote, USA", "Remote: Spain"
-        from sqlalchemy import and_, not_
-        pure_remote = and_(
-            Job.location.ilike("%remote%"),
-            not_(Job.location.contains(" - ")),
-            not_(Job.location.contains(", ")),
-            not_(Job.location.contains("/")),
-            not_(Job.location.contains(":")),
-        )
-        conditions.append(pure_remote)
-
-        # 3. NULL/empty location (truly worldwide or untagged)
-        conditions.append(Job.location.is_(None))
-        conditions.append(Job.location == "")
-
+        conditions = [Job.location_is_worldwide.is_(True)]
+        tokens = location_tokens(location.strip())
+        if tokens:
+            conditions.append(Job.location_regions.overlap(tokens))
         query = query.filter(or_(*conditions))
 
-    
     # ── Source filter ─────────────────────────────────────────────────────────
     if source:
         query = query.filter(Job.source == source)
     
     # ── Pagination ────────────────────────────────────────────────────────────
-    total = query.count()
+    filter_key = _filter_key(search, search_mode, location, source)
+    facets = None
+    if include_facets:
+        # One GROUPING SETS pass; its source buckets sum to the exact total,
+        # so the separate count query is skipped.
+        facets = facet_counts(query, cache_key=filter_key)
+        count = CountResult(total=facets.total, exact=True)
+    else:
+        count = count_jobs(query, cache_key=filter_key)
+    total = count.total
     total_pages = (total + limit - 1) // limit
     skip = (page - 1) * limit
-    jobs = query.order_by(Job.posted_at.desc()).offset(skip).limit(limit).all()
+    next_cursor = None
+    if rank is not None:
+        jobs = query.order_by(rank.desc(), *JOB_LISTING_ORDER).offset(skip).limit(limit).all()
+    elif cursor:
+        try:
+            jobs, next_cursor = fetch_page_after(query, cursor, limit)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        jobs = query.order_by(*JOB_LISTING_ORDER).offset(skip).limit(limit).all()
+        has_more = skip + len(jobs) < total if count.exact else len(jobs) == limit
+        if jobs and has_more:
+            next_cursor = encode_cursor(jobs[-1])
     
     return JobListResponse(
         jobs=jobs,
         total=total,
+        total_is_exact=count.exact,
         page=page,
         limit=limit,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+        facets=JobFacetsSchema(**facets._asdict()) if facets else None
     )
 
 @router.get("/filters", response_model=FiltersResponse)
-def get_filters(db: Session = Depends(get_db)):
+def get_filters(request: Request, db: Session = Depends(get_db)):
     """
     Get available filter options and metadata.
+    Served from a shared cache that job ingestion invalidates; supports
+    If-None-Match so unchanged payloads cost a bodiless 304.
     """
+    entry = load_filters()
+    if entry is None:
+        entry = store_filters(_compute_filters(db).model_dump())
+
+    headers = {"ETag": entry["etag"], "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry["etag"]):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=entry["payload"], headers=headers)
+
+def _compute_filters(db: Session) -> FiltersResponse:
     # All unique non-empty locations
     locations = db.query(Job.location).filter(
         Job.location.isnot(None),
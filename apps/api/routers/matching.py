@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import text
 from sqlalchemy.orm import Session
+from config import settings
 from database import get_db
 from models import Resume, Job
 from typing import List, Any
@@ -21,11 +23,15 @@ class JobMatchSchema(BaseModel):
 from auth import get_current_user
 from models import Resume, Job, User
 
+# pgvector rejects hnsw.ef_search above this
+HNSW_MAX_EF_SEARCH = 1000
+
 @router.get("/{resume_id}/matches", response_model=List[JobMatchSchema])
 async def get_job_matches(
     resume_id: int, 
-    limit: int = 10, 
+    limit: int = Query(10, ge=1, le=HNSW_MAX_EF_SEARCH),
     min_similarity: float = 0.0, # Default to 0 to show all
+    ef_search: int | None = Query(None, ge=1, le=HNSW_MAX_EF_SEARCH, description="HNSW recall/latency knob; defaults to VECTOR_EF_SEARCH"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -44,9 +50,15 @@ async def get_job_matches(
     # Note: pgvector's cosine_distance operator is <=>
     # We want similarity, which is 1 - distance
     
+    # Served by the HNSW index (ix_jobs_embedding_hnsw). ef_search bounds the
+    # candidate list the index walks; it must be >= limit to fill the page.
+    # SET LOCAL scopes it to this request's transaction.
+    ef = min(max(ef_search or settings.VECTOR_EF_SEARCH, limit), HNSW_MAX_EF_SEARCH)
+    db.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef)}"))
+
     similarity_expr = (1 - Job.embedding.cosine_distance(resume.embedding)).label("similarity")
     
-    query = db.query(Job, similarity_expr)
+    query = db.query(Job, similarity_expr).filter(Job.embedding.isnot(None))
     
     # Filter by threshold if provided
     if min_similarity > 0:
@@ -1,19 +1,26 @@
+import asyncio
+import logging
 import os
 import uuid
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query
 from fastapi.responses import Response, FileResponse, JSONResponse
 from sqlalchemy.orm import Session
 from database import get_db
 from models import Resume, User, Job
-from services.resume.parser import ResumeParser
+from services.resume.parsing_service import ParserBusyError, ParsingService
 from services.resume.embedding import EmbeddingService
 from services.resume.analyst import ResumeAnalyst
-from services.resume.tailor import ResumeTailor
+from services.resume.ingestion import EMPTY_TEXT_MESSAGE, analyze_and_embed, has_meaningful_text
+from services.resume.tailor import TAILOR_PROMPT_VERSION, ResumeTailor
+from services.resume.tailor_cache import TailoredResumeCache, tailor_cache_key
+from config import settings
 from services.resume.pdf_generator import PDFGenerator
 from auth import get_current_user
+from tasks.resume_tasks import ingest_resume_task
 
 router = APIRouter()
-parser = ResumeParser()
+logger = logging.getLogger(__name__)
+parsing_service = ParsingService()
 embedding_service = EmbeddingService()
 analyst = ResumeAnalyst()
 tailor_service = ResumeTailor()
@@ -23,6 +30,12 @@ pdf_generator = PDFGenerator()
 TEMP_DOWNLOADS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "temp_downloads")
 os.makedirs(TEMP_DOWNLOADS_DIR, exist_ok=True)
 
+tailor_cache = TailoredResumeCache(
+    settings.TAILOR_CACHE_DIR,
+    max_entries=settings.TAILOR_CACHE_MAX_ENTRIES,
+    max_bytes=settings.TAILOR_CACHE_MAX_MB * 1024 * 1024,
+) if settings.TAILOR_CACHE_MAX_ENTRIES > 0 else None
+
 # Accepted MIME types → mapped to common extensions for display
 ACCEPTED_MIME_TYPES = {
     "application/pdf":                                                    "pdf",
@@ -56,11 +69,14 @@ def _get_extension(file: UploadFile) -> str:
 @router.post("/upload")
 async def upload_resume(
     file: UploadFile = File(...),
+    background: bool = Query(False, description="Store the file and process it in a worker; poll GET /{id}/status"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Upload a resume. Supported formats: PDF, DOCX, DOC, TXT, RTF.
+    With background=true, returns 202 with the resume id as soon as the file
+    is stored; parsing, analysis and embedding run in a Celery worker.
     """
     ext = _get_extension(file)
     if not ext:
@@ -78,24 +94,51 @@ async def upload_resume(
     if len(content) > 10 * 1024 * 1024:
         raise HTTPException(status_code=400, detail="File too large. Maximum size is 10 MB.")
 
-    # 1. Parse → plain text
     filename = file.filename or f"resume.{ext}"
+
+    if background:
+        resume = Resume(
+            user_id=current_user.id,
+            status="processing",
+            source_filename=filename,
+            source_file=content,
+            is_default=True
+        )
+        db.add(resume)
+        db.commit()
+        db.refresh(resume)
+        try:
+            ingest_resume_task.delay(resume.id)
+        except Exception as e:
+            # Nothing will ever pick the row up; drop it rather than leave it "processing"
+            logger.error(f"Failed to enqueue ingestion of resume {resume.id}: {e}")
+            db.delete(resume)
+            db.commit()
+            raise HTTPException(
+                status_code=503,
+                detail="Background processing is unavailable. Please retry, or upload without background=true.",
+                headers={"Retry-After": "30"},
+            )
+        return JSONResponse(status_code=202, content={
+            "id": resume.id,
+            "status": resume.status,
+            "message": f"Resume received ({ext.upper()}). Processing in the background."
+        })
+
+    # 1. Parse → plain text (in the parser process pool, off the event loop)
     try:
-        text = parser.extract_text(content, filename)
+        text = await parsing_service.parse(content, filename)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except ParserBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
 
-    if not text or len(text.strip()) < 50:
-        raise HTTPException(
-            status_code=400,
-            detail="Could not extract meaningful text from the file. Please check the file is not empty or image-only."
-        )
+    if not has_meaningful_text(text):
+        raise HTTPException(status_code=400, detail=EMPTY_TEXT_MESSAGE)
 
-    # 2. Analyze (structured data via GPT)
-    structured_data = await analyst.analyze(text)
-
-    # 3. Generate embedding for job matching
-    vector = embedding_service.generate_embedding(text)
+    # 2 + 3. Analyze (structured data via GPT) and embed for job matching,
+    # concurrently
+    structured_data, vector = await analyze_and_embed(analyst, embedding_service, text)
 
     # 4. Save to DB (mark as default)
     resume = Resume(
@@ -103,6 +146,7 @@ async def upload_resume(
         content=text,
         structured_data=structured_data,
         embedding=vector,
+        source_filename=filename,
         is_default=True
     )
     db.add(resume)
@@ -132,6 +176,7 @@ async def get_resumes(
         {
             "id": r.id,
             "is_default": r.is_default,
+            "status": r.status,
             "created_at": r.created_at,
             "has_structured_data": r.structured_data is not None
         }
@@ -139,6 +184,31 @@ async def get_resumes(
     ]
 
 
+@router.get("/{resume_id}/status")
+async def get_resume_status(
+    resume_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Ingestion status of a resume: "processing", "ready" or "failed".
+    Structured data is included once it is ready.
+    """
+    resume = db.query(Resume).filter(
+        Resume.id == resume_id,
+        Resume.user_id == current_user.id
+    ).first()
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+
+    return {
+        "id": resume.id,
+        "status": resume.status,
+        "error": resume.error,
+        "data": resume.structured_data if resume.status == "ready" else None
+    }
+
+
 from pydantic import BaseModel
 
 class TailorRequest(BaseModel):
@@ -154,6 +224,8 @@ async def tailor_resume(
 ):
     """
     Tailors a resume to a specific job description and returns a generated PDF.
+    Repeat requests for the same resume version and job description are
+    served from the tailored resume cache, skipping the LLM and ReportLab.
     """
     # 1. Fetch Resume
     resume = db.query(Resume).filter(
@@ -174,17 +246,29 @@ async def tailor_resume(
 
     job_description = f"{job.title} at {job.company}\n\n{job.description}"
 
-    # 3. Tailor Resume Data
-    tailored_data = await tailor_service.tailor(
-        base_resume_data=resume.structured_data, 
-        job_description=job_description
+    cache_key = tailor_cache_key(
+        resume.id, resume.structured_data, job.id, job_description, TAILOR_PROMPT_VERSION
     )
+    cached = await asyncio.to_thread(tailor_cache.get, cache_key) if tailor_cache else None
+    if cached:
+        tailored_data, pdf_bytes = cached
+    else:
+        # 3. Tailor Resume Data
+        tailored_data, tailored = await tailor_service.tailor(
+            base_resume_data=resume.structured_data, 
+            job_description=job_description
+        )
 
-    # 4. Generate PDF
-    try:
-        pdf_bytes = pdf_generator.generate_pdf(tailored_data)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {e}")
+        # 4. Generate PDF (ReportLab is synchronous; keep it off the event loop)
+        try:
+            pdf_bytes = await asyncio.to_thread(pdf_generator.generate_pdf, tailored_data)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {e}")
+
+        # Fallback output (the original data, LLM unavailable or failed) is
+        # not cached; only real tailoring results are worth keeping
+        if tailor_cache and tailored:
+            await asyncio.to_thread(tailor_cache.put, cache_key, tailored_data, pdf_bytes)
 
     # 5. Return PDF directly as raw bytes
     # Clean company name for filename
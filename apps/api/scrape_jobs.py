@@ -1,5 +1,5 @@
-from database import SessionLocal
-from services.browser.job_scraper import JobScraper
+from services.browser.scrape_orchestrator import SourcePlan, run_all_sources
+from tasks.scraping_tasks import SOURCE_PLANS
 import logging
 
 # Configure Logging
@@ -43,74 +43,42 @@ NAUKRI_SEARCHES = [
 ]
 
 
-def run_scraper():
-    db = SessionLocal()
-    scraper = JobScraper(db)
-    total = 0
+def build_plans():
+    """Same caps/politeness as the Celery task, with this script's term lists."""
+    calls = {
+        "WeWorkRemotely": [{"search_term": term} for term in WWR_TERMS],
+        "Wellfound": [{"role": role} for role in WELLFOUND_ROLES],
+        "Monster": [{"search_term": term, "location": loc} for term, loc in MONSTER_SEARCHES],
+        "Naukri": [{"search_term": term, "location": loc} for term, loc in NAUKRI_SEARCHES],
+    }
+    plans = []
+    for name, plan in SOURCE_PLANS.items():
+        plans.append(SourcePlan(
+            name=name,
+            method=plan.method,
+            calls=calls.get(name, plan.calls),
+            uses_browser=plan.uses_browser,
+            max_concurrency=plan.max_concurrency,
+            max_pages=plan.max_pages,
+            min_interval=plan.min_interval,
+        ))
+    return plans
+
 
+def run_scraper():
     print("\n" + "═" * 60)
     print("  AI Job Apply Portal — Multi-Source Job Scraper")
     print("═" * 60 + "\n")
 
-    # ── 1. WeWorkRemotely ───────────────────────────────────────
-    print("── WeWorkRemotely ──────────────────────────────────────")
-    for term in WWR_TERMS:
-        try:
-            count = scraper.scrape_weworkremotely(search_term=term)
-            print(f"  [{term}] → {count} new jobs")
-            total += count
-        except Exception as e:
-            print(f"  [{term}] ERROR: {e}")
-
-    # ── 2. Wellfound ────────────────────────────────────────────
-    print("\n── Wellfound ───────────────────────────────────────────")
-    for role in WELLFOUND_ROLES:
-        try:
-            count = scraper.scrape_wellfound(role=role)
-            print(f"  [{role}] → {count} new jobs")
-            total += count
-        except Exception as e:
-            print(f"  [{role}] ERROR: {e}")
+    # All sources run in parallel; each source respects its own domain cap
+    results = run_all_sources(build_plans())
 
-    # ── 3. Monster ──────────────────────────────────────────────
-    print("\n── Monster ─────────────────────────────────────────────")
-    for term, loc in MONSTER_SEARCHES:
-        try:
-            count = scraper.scrape_monster(search_term=term, location=loc)
-            print(f"  [{term} | {loc}] → {count} new jobs")
-            total += count
-        except Exception as e:
-            print(f"  [{term}] ERROR: {e}")
-
-    # ── 4. Naukri ───────────────────────────────────────────────
-    print("\n── Naukri ──────────────────────────────────────────────")
-    for term, loc in NAUKRI_SEARCHES:
-        try:
-            count = scraper.scrape_naukri(search_term=term, location=loc)
-            print(f"  [{term}] → {count} new jobs")
-            total += count
-        except Exception as e:
-            print(f"  [{term}] ERROR: {e}")
-
-    # ── 5. RemoteOK (Public API) ────────────────────────────────
-    print("\n── RemoteOK ─────────────────────────────────────────────")
-    try:
-        count = scraper.scrape_remoteok()
-        print(f"  [all tags] → {count} new jobs")
-        total += count
-    except Exception as e:
-        print(f"  ERROR: {e}")
-
-    # ── 6. Remotive (Public API) ────────────────────────────────
-    print("\n── Remotive ─────────────────────────────────────────────")
-    try:
-        count = scraper.scrape_remotive()
-        print(f"  [all categories] → {count} new jobs")
-        total += count
-    except Exception as e:
-        print(f"  ERROR: {e}")
+    total = 0
+    for name, result in results.items():
+        errors = f" ({result['errors']} errors)" if result["errors"] else ""
+        print(f"  {name:<16} → {result['added']} new jobs in {result['seconds']}s{errors}")
+        total += result["added"]
 
-    db.close()
     print("\n" + "═" * 60)
     print(f"  TOTAL NEW JOBS ADDED: {total}")
     print("═" * 60 + "\n")
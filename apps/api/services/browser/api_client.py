@@ -0,0 +1,76 @@
+"""
+Pooled async HTTP for the JSON API sources (RemoteOK, Remotive).
+
+One httpx.AsyncClient per source run: keep-alive connections (HTTP/2 when
+`h2` is installed, so every tag multiplexes over one connection), gzip'd
+responses, and the per-tag / per-category fetches issued concurrently —
+at most `max_concurrency` in flight, with starts spaced `min_interval`
+seconds apart so we stay polite to the public APIs.
+"""
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+import httpx
+
+try:
+    import h2  # noqa: F401 — enables httpx's HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+USER_AGENT = "Mozilla/5.0 (compatible; JobPortalBot/1.0)"
+DEFAULT_TIMEOUT = 15
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class AsyncRateLimiter:
+    """Spaces out request starts on one event loop (async DomainThrottle)."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self.min_interval
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+
+def make_client(max_concurrency: int = DEFAULT_MAX_CONCURRENCY, headers: Optional[dict] = None) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=DEFAULT_TIMEOUT,
+        limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        headers={"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate", **(headers or {})},
+        follow_redirects=True,
+    )
+
+
+async def fetch_all(
+    requests: List[Tuple[str, dict]],
+    min_interval: float = 0.0,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    headers: Optional[dict] = None,
+) -> list:
+    """
+    GETs every (url, per-request headers) pair over one pooled client.
+    Returns responses in request order; a failed request yields its exception.
+    """
+    limiter = AsyncRateLimiter(min_interval)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async with make_client(max_concurrency, headers) as client:
+        async def fetch(url: str, request_headers: dict):
+            async with semaphore:
+                await limiter.wait()
+                return await client.get(url, headers=request_headers)
+
+        return await asyncio.gather(
+            *(fetch(url, request_headers) for url, request_headers in requests),
+            return_exceptions=True,
+        )
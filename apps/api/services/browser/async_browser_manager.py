@@ -0,0 +1,105 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from playwright.async_api import async_playwright, Page, Error as PlaywrightError
+from services.browser.browser_manager import LAUNCH_ARGS, USER_AGENT, VIEWPORT, STEALTH_SCRIPT
+
+
+class AsyncBrowserPool:
+    """
+    One Chromium driving many pages concurrently from a single event loop.
+
+    `page()` hands out a page in a fresh isolated context; at most
+    `max_pages` are open at once (the semaphore), which bounds memory while
+    letting page loads and selector waits of different tasks overlap.
+    The browser is relaunched after `max_pages_per_browser` pages once no
+    page is in flight, or immediately if it disconnects. As with BrowserPool,
+    `page(resource_policy=...)` turns on request blocking for that page.
+
+    Usage:
+        async with AsyncBrowserPool(max_pages=4) as pool:
+            async with pool.page() as page:
+                await page.goto(url)
+    """
+
+    def __init__(self, headless: bool = True, max_pages: int = 4, max_pages_per_browser: int = 100):
+        self.headless = headless
+        self.max_pages_per_browser = max_pages_per_browser
+        self.logger = logging.getLogger(__name__)
+        self.playwright = None
+        self.browser = None
+        self.pages_served = 0
+        self._in_flight = 0
+        self._semaphore = asyncio.Semaphore(max_pages)
+        self._launch_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncBrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def start(self):
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+        await self._launch()
+
+    async def _launch(self):
+        self.logger.info(f"Launching async pooled browser (Headless={self.headless})...")
+        self.browser = await self.playwright.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+        self.pages_served = 0
+
+    async def _close_browser(self):
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing async pooled browser: {e}")
+            self.browser = None
+
+    async def _ensure_browser(self):
+        async with self._launch_lock:
+            if self.playwright is None:
+                await self.start()
+            elif self.browser is None or not self.browser.is_connected():
+                self.logger.warning("Async pooled browser missing or disconnected. Relaunching.")
+                await self._close_browser()
+                await self._launch()
+            elif self.pages_served >= self.max_pages_per_browser and self._in_flight == 0:
+                self.logger.info(f"Recycling async pooled browser after {self.pages_served} pages.")
+                await self._close_browser()
+                await self._launch()
+
+    @asynccontextmanager
+    async def page(self, resource_policy=None) -> AsyncIterator[Page]:
+        async with self._semaphore:
+            await self._ensure_browser()
+            context = await self.browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+            self.pages_served += 1
+            self._in_flight += 1
+            try:
+                if resource_policy:
+                    await context.route("**/*", resource_policy.route_async)
+                page = await context.new_page()
+                await page.add_init_script(STEALTH_SCRIPT)
+                yield page
+            except PlaywrightError:
+                # Crashed browser: the next page() relaunches it
+                if self.browser and not self.browser.is_connected():
+                    self.browser = None
+                raise
+            finally:
+                self._in_flight -= 1
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+
+    async def stop(self):
+        await self._close_browser()
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        self.logger.info("Async browser pool stopped.")
@@ -0,0 +1,145 @@
+"""
+Async Playwright engine for the browser-based job sources.
+
+The sync scraper drives one page per thread and blocks in page.goto /
+wait_for_selector. This engine drives many pages from one event loop
+through an AsyncBrowserPool: while one page waits on the network, others
+make progress. Only the page-driving steps are re-implemented with the
+async API; URL building and HTML parsing are JobScraper's own
+(_<source>_url / _parse_<source>), and rows are saved through the same
+JobScraper._save_parsed path, incremental state included. Parsing and the
+save run in worker threads so the DB round-trips don't stall the other
+pages; saves are serialized because they share JobScraper's Session.
+"""
+import asyncio
+import logging
+import random
+from typing import List
+
+from services.browser.async_browser_manager import AsyncBrowserPool
+from services.browser.job_scraper import JobScraper
+from services.browser.resource_blocking import policy_for_source
+
+
+class AsyncJobScraper:
+    def __init__(self, scraper: JobScraper, pool: AsyncBrowserPool):
+        self.scraper = scraper
+        self.pool = pool
+        self.logger = logging.getLogger(__name__)
+        self._save_lock = asyncio.Lock()  # one Session: one save at a time
+
+    async def _random_delay(self, min_s=1.5, max_s=3.5):
+        """Human-speed random delay that yields the loop to other pages."""
+        await asyncio.sleep(random.uniform(min_s, max_s))
+
+    async def _parse_and_save(self, parse, args: tuple, source: str, query: str) -> int:
+        """Runs JobScraper's parse + _save_parsed off the event loop."""
+        jobs = await asyncio.to_thread(parse, *args)
+        async with self._save_lock:
+            return await asyncio.to_thread(self.scraper._save_parsed, jobs, source, query)
+
+    async def run_many(self, method: str, calls: List[dict], min_interval: float = 0.0) -> dict:
+        """
+        Runs `method` (e.g. "scrape_monster") for every kwargs dict in `calls`
+        concurrently — bounded by the pool's page semaphore — with starts
+        spaced `min_interval` seconds apart. Returns {"added", "errors"}.
+        """
+        coroutine = getattr(self, method)
+
+        async def run_one(position: int, kwargs: dict):
+            await asyncio.sleep(position * min_interval)
+            return await coroutine(**kwargs)
+
+        results = await asyncio.gather(
+            *(run_one(i, kwargs) for i, kwargs in enumerate(calls)),
+            return_exceptions=True,
+        )
+        added = 0
+        errors = 0
+        for kwargs, result in zip(calls, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"[async {method}] Failed for {kwargs}: {result}")
+                errors += 1
+            else:
+                added += result
+        return {"added": added, "errors": errors}
+
+    # ── Sources ──────────────────────────────────────────────────────────────
+
+    async def scrape_weworkremotely(self, search_term: str = "python") -> int:
+        url = self.scraper._weworkremotely_url(search_term)
+        self.logger.info(f"[WeWorkRemotely] Scraping (async): {url}")
+        async with self.pool.page(resource_policy=policy_for_source("WeWorkRemotely")) as page:
+            await page.goto(url)
+            await page.wait_for_selector(".jobs-container", timeout=15000)
+            html = await page.content()
+        count = await self._parse_and_save(
+            self.scraper._parse_weworkremotely, (html, search_term), "WeWorkRemotely", search_term,
+        )
+        self.logger.info(f"[WeWorkRemotely] Done. Added {count} jobs for '{search_term}'.")
+        return count
+
+    async def scrape_wellfound(self, role: str = "software-engineer", location: str = "remote") -> int:
+        count = 0
+        for attempt_url in self.scraper._wellfound_urls(role):
+            try:
+                async with self.pool.page(resource_policy=policy_for_source("Wellfound")) as page:
+                    await page.goto(attempt_url, timeout=30000)
+                    await self._random_delay(3, 5)
+                    try:
+                        await page.keyboard.press("Escape")
+                    except Exception:
+                        pass
+                    if self.scraper._wellfound_is_walled(await page.content()):
+                        self.logger.warning(f"[Wellfound] Sign-up wall on {attempt_url}. Trying fallback...")
+                        continue
+                    try:
+                        await page.wait_for_selector(JobScraper.WELLFOUND_CARD_SELECTOR, timeout=10000)
+                    except Exception:
+                        self.logger.warning(f"[Wellfound] No card selector on {attempt_url}. Parsing anyway.")
+                    html = await page.content()
+                count = await self._parse_and_save(
+                    self.scraper._parse_wellfound, (html, role, attempt_url), "Wellfound", role,
+                )
+                break  # Success — no need to try fallback URL
+            except Exception as e:
+                self.logger.error(f"[Wellfound] Scraper error on {attempt_url}: {e}")
+        self.logger.info(f"[Wellfound] Done. Added {count} jobs for role '{role}'.")
+        return count
+
+    async def scrape_monster(self, search_term: str = "python developer", location: str = "remote") -> int:
+        url = self.scraper._monster_url(search_term, location)
+        self.logger.info(f"[Monster] Scraping (async): {url}")
+        async with self.pool.page(resource_policy=policy_for_source("Monster")) as page:
+            await page.goto(url, timeout=30000)
+            await self._random_delay(2, 4)
+            try:
+                await page.wait_for_selector(JobScraper.MONSTER_CARD_SELECTOR, timeout=15000)
+            except Exception:
+                self.logger.warning("[Monster] Job cards selector timed out. Attempting parse anyway.")
+            for _ in range(3):
+                await page.evaluate("window.scrollBy(0, 800)")
+                await self._random_delay(1, 2)
+            html = await page.content()
+        count = await self._parse_and_save(
+            self.scraper._parse_monster, (html, search_term, location), "Monster", f"{search_term}|{location}",
+        )
+        self.logger.info(f"[Monster] Done. Added {count} jobs for '{search_term}'.")
+        return count
+
+    async def scrape_naukri(self, search_term: str = "python developer", location: str = "") -> int:
+        url = self.scraper._naukri_url(search_term, location)
+        self.logger.info(f"[Naukri] Scraping (async): {url}")
+        async with self.pool.page(resource_policy=policy_for_source("Naukri")) as page:
+            await page.goto(url, timeout=30000)
+            await self._random_delay(2, 5)
+            try:
+                await page.wait_for_selector(JobScraper.NAUKRI_CARD_SELECTOR, timeout=15000)
+            except Exception:
+                self.logger.warning("[Naukri] Job tuple selector timed out. Attempting parse anyway.")
+            html = await page.content()
+        count = await self._parse_and_save(
+            self.scraper._parse_naukri, (html, search_term, location), "Naukri", f"{search_term}|{location}",
+        )
+        self.logger.info(f"[Naukri] Done. Added {count} jobs for '{search_term}'.")
+        return count
@@ -3,10 +3,24 @@ import random
 import os
 from playwright.sync_api import sync_playwright, Page, BrowserContext
 
+# Shared by BrowserManager and BrowserPool so every context looks the same
+LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-blink-features=AutomationControlled",
+]
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+VIEWPORT = {"width": 1280, "height": 720}
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+"""
+
 class BrowserManager:
-    def __init__(self, headless: bool = False, cookies_path: str = None):
+    def __init__(self, headless: bool = False, cookies_path: str = None, resource_policy=None):
         self.headless = headless
         self.cookies_path = cookies_path
+        self.resource_policy = resource_policy  # ResourcePolicy; None loads everything
         self.logger = logging.getLogger(__name__)
         self.playwright = None
         self.browser = None
@@ -32,10 +46,7 @@ class BrowserManager:
         # Launch options for "Stealth" (basic for now)
         self.browser = self.playwright.chromium.launch(
             headless=self.headless,
-            args=[
-                "--no-sandbox",
-                "--disable-blink-features=AutomationControlled",
-            ]
+            args=LAUNCH_ARGS
         )
         
         # Load cookies if exist
@@ -47,18 +58,16 @@ class BrowserManager:
         # Create Context
         self.context = self.browser.new_context(
             storage_state=storage_state,
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            viewport={"width": 1280, "height": 720}
+            user_agent=USER_AGENT,
+            viewport=VIEWPORT
         )
+        if self.resource_policy:
+            self.context.route("**/*", self.resource_policy.route)
         
         self.page = self.context.new_page()
         
         # Add basic stealth scripts
-        self.page.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        self.page.add_init_script(STEALTH_SCRIPT)
         
         self.logger.info("Browser started successfully.")
 
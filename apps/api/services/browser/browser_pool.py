@@ -0,0 +1,106 @@
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+from playwright.sync_api import sync_playwright, Page, Error as PlaywrightError
+from services.browser.browser_manager import LAUNCH_ARGS, USER_AGENT, VIEWPORT, STEALTH_SCRIPT
+
+
+class BrowserPool:
+    """
+    One long-lived Chromium shared by many scraping tasks.
+
+    BrowserManager launches Playwright + Chromium per use, which costs
+    seconds each time. The pool launches once per run and hands out a fresh,
+    isolated BrowserContext (own cookies/storage) per `page()` call.
+    Chromium is relaunched after `max_pages_per_browser` pages, to cap
+    memory growth, or as soon as it is found disconnected (crash).
+
+    `page(resource_policy=...)` installs a ResourcePolicy on that page's
+    context (see resource_blocking.py); without one, pages load in full.
+
+    Playwright's sync API is bound to the thread that started it, so a pool
+    must be used from a single thread.
+
+    Usage:
+        with BrowserPool(headless=True) as pool:
+            with pool.page() as page:
+                page.goto(url)
+    """
+
+    def __init__(self, headless: bool = True, max_pages_per_browser: int = 50):
+        self.headless = headless
+        self.max_pages_per_browser = max_pages_per_browser
+        self.logger = logging.getLogger(__name__)
+        self.playwright = None
+        self.browser = None
+        self.pages_served = 0
+        self.launches = 0
+
+    def __enter__(self) -> "BrowserPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        if self.playwright is None:
+            self.playwright = sync_playwright().start()
+        self._launch()
+
+    def _launch(self):
+        self.logger.info(f"Launching pooled browser (Headless={self.headless})...")
+        self.browser = self.playwright.chromium.launch(headless=self.headless, args=LAUNCH_ARGS)
+        self.pages_served = 0
+        self.launches += 1
+
+    def _close_browser(self):
+        if self.browser:
+            try:
+                self.browser.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing pooled browser: {e}")
+            self.browser = None
+
+    def _ensure_browser(self):
+        if self.playwright is None:
+            self.start()
+        elif self.browser is None or not self.browser.is_connected():
+            self.logger.warning("Pooled browser missing or disconnected. Relaunching.")
+            self._close_browser()
+            self._launch()
+        elif self.pages_served >= self.max_pages_per_browser:
+            self.logger.info(f"Recycling pooled browser after {self.pages_served} pages.")
+            self._close_browser()
+            self._launch()
+
+    @contextmanager
+    def page(self, resource_policy=None) -> Iterator[Page]:
+        """Yields a page in a new isolated context; the context is closed afterwards."""
+        self._ensure_browser()
+        context = self.browser.new_context(user_agent=USER_AGENT, viewport=VIEWPORT)
+        self.pages_served += 1
+        try:
+            if resource_policy:
+                context.route("**/*", resource_policy.route)
+            page = context.new_page()
+            page.add_init_script(STEALTH_SCRIPT)
+            yield page
+        except PlaywrightError:
+            # A crashed renderer or browser surfaces here; make sure the next
+            # page() gets a healthy browser.
+            if self.browser and not self.browser.is_connected():
+                self._close_browser()
+            raise
+        finally:
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    def stop(self):
+        self._close_browser()
+        if self.playwright:
+            self.playwright.stop()
+            self.playwright = None
+        self.logger.info(f"Browser pool stopped ({self.launches} launch(es)).")
@@ -0,0 +1,99 @@
+"""
+HTML parsing helpers shared by the scrapers.
+
+  - make_soup — BeautifulSoup on the lxml tree builder when lxml is
+    installed (several times faster than "html.parser" on full listing
+    pages), falling back to the stdlib parser otherwise.
+  - SelectorChain — an ordered list of fallback CSS selectors, compiled once
+    (soupsieve) when the scraper class is defined instead of re-parsed for
+    every card on every page.
+  - strip_html — plain text of an HTML fragment for job descriptions,
+    streamed through the stdlib HTMLParser without building a tree, and
+    stopped as soon as `limit` characters have been collected.
+
+bench_html_parsing.py times these against the fixture pages in
+tests/fixtures/.
+"""
+from html.parser import HTMLParser
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401
+    SOUP_FEATURES = "lxml"
+except ImportError:
+    SOUP_FEATURES = "html.parser"
+
+DESCRIPTION_MAX_CHARS = 2000
+_FEED_CHUNK = 4096
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, SOUP_FEATURES)
+
+
+class SelectorChain:
+    """Fallback CSS selectors, tried in order: `a or b or c`, compiled once."""
+
+    def __init__(self, *selectors: str):
+        self.selectors = selectors
+        self._compiled = [soupsieve.compile(selector) for selector in selectors]
+
+    def select(self, node) -> list:
+        """All matches of the first selector that matches anything."""
+        for compiled in self._compiled:
+            found = compiled.select(node)
+            if found:
+                return found
+        return []
+
+    def select_one(self, node):
+        """First match of the first selector that matches anything, or None."""
+        for compiled in self._compiled:
+            found = compiled.select_one(node)
+            if found is not None:
+                return found
+        return None
+
+
+class _TextExtractor(HTMLParser):
+    SKIPPED_TAGS = {"script", "style", "template"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.length = 0
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED_TAGS:
+            self._skipping += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED_TAGS and self._skipping:
+            self._skipping -= 1
+
+    def handle_data(self, data):
+        if self._skipping:
+            return
+        text = data.strip()
+        if text:
+            self.parts.append(text)
+            self.length += len(text) + 1
+
+
+def strip_html(html: str, limit: int = DESCRIPTION_MAX_CHARS) -> str:
+    """
+    Same text as BeautifulSoup(html).get_text(separator=" ", strip=True)[:limit],
+    without the tree. Input that contains no markup is returned unchanged.
+    """
+    if not html or "<" not in html:
+        return html
+    parser = _TextExtractor()
+    for start in range(0, len(html), _FEED_CHUNK):
+        parser.feed(html[start:start + _FEED_CHUNK])
+        if parser.length > limit:
+            break
+    parser.close()
+    return " ".join(parser.parts)[:limit]
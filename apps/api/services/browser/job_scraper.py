@@ -1,18 +1,45 @@
+import asyncio
 import logging
 import time
 import random
 from datetime import datetime
+from typing import Optional
 from services.browser.browser_manager import BrowserManager
+from services.browser.browser_pool import BrowserPool
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from models import Job
-from bs4 import BeautifulSoup
+from services.jobs.filters_cache import invalidate_filters_cache
+from services.jobs.location import location_columns
+from services.jobs.dedup import DEDUP_WINDOW, canonicalize_url, dedup_columns, is_same_posting
+from services.browser.scrape_state import ScrapeStateStore, is_seen, unseen_listing
+from services.browser.api_client import fetch_all
+from config import settings
+from sqlalchemy import select
+from services.browser.resource_blocking import policy_for_source
+from services.browser.html_parsing import SelectorChain, make_soup, strip_html
+
+# Rows per multi-row INSERT; keeps statements well under Postgres' 65535 bind-parameter cap
+FLUSH_CHUNK_SIZE = 500
 
 class JobScraper:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, browser_pool: BrowserPool = None):
         self.db = db
+        self.browser_pool = browser_pool
         self.logger = logging.getLogger(__name__)
-        self._pending = 0  # track staged rows
+        self._buffer = []  # staged rows, written in bulk by _commit
+        self.scrape_state = ScrapeStateStore(db, enabled=settings.SCRAPE_INCREMENTAL)
+
+    def _open_page(self, source: str):
+        """
+        Context manager yielding a Page for scraping `source`, with its
+        resource-blocking policy. Uses the shared pool when one was given
+        (one Chromium per run); otherwise launches a standalone browser.
+        """
+        policy = policy_for_source(source)
+        if self.browser_pool:
+            return self.browser_pool.page(resource_policy=policy)
+        return BrowserManager(headless=True, resource_policy=policy)
 
     def _random_delay(self, min_s=1.5, max_s=3.5):
         """Human-speed random delay between actions."""
@@ -20,96 +47,247 @@ class JobScraper:
 
     def _save_job(self, title, company, location, description, url, source, posted_at=None):
         """
-        Insert a Job row using ON CONFLICT (url) DO NOTHING — 100% safe to call
-        even if the URL already exists. Returns True if a new row was actually inserted.
+        Stage a Job row for the next bulk flush (see _commit). Returns True if
+        the row was staged; whether it is actually new is only known once
+        _commit runs the INSERT ... ON CONFLICT (url) DO NOTHING.
         """
         if not title or not url:
             return False
+        location = location or "Remote"
+        company = company or "Unknown"
+        description = description or f"Job scraped from {source}."
+        self._buffer.append(dict(
+            title=title,
+            company=company,
+            location=location,
+            description=description,
+            url=canonicalize_url(url),
+            source=source,
+            posted_at=posted_at or datetime.utcnow(),
+            **location_columns(location),
+            **dedup_columns(title, company, description),
+        ))
+        return True
+
+    def _flush(self) -> int:
+        """
+        Writes staged rows as multi-row INSERT ... ON CONFLICT (url) DO NOTHING
+        RETURNING url, FLUSH_CHUNK_SIZE rows per statement. RETURNING only
+        yields rows that were actually inserted, which keeps "added" counts
+        exact. A chunk that fails (e.g. one malformed row) is retried row by
+        row so the rest of it still lands.
+        """
+        # De-duplicate by URL within the batch (cross-tag/term repeats)
+        rows = list({row["url"]: row for row in reversed(self._buffer)}.values())[::-1]
+        self._buffer = []
+        rows = self._drop_near_duplicates(rows)
+        inserted = 0
+        for start in range(0, len(rows), FLUSH_CHUNK_SIZE):
+            chunk = rows[start:start + FLUSH_CHUNK_SIZE]
+            try:
+                with self.db.begin_nested():
+                    new_urls = set(self.db.execute(self._insert_stmt(chunk)).scalars())
+            except Exception as e:
+                self.logger.warning(f"Bulk insert of {len(chunk)} jobs failed ({e}); retrying row by row")
+                new_urls = set()
+                for row in chunk:
+                    try:
+                        with self.db.begin_nested():
+                            new_urls.update(self.db.execute(self._insert_stmt([row])).scalars())
+                    except Exception as row_error:
+                        self.logger.error(f"[{row['source']}] _save_job error for '{row['url']}': {row_error}")
+            for row in chunk:
+                if row["url"] in new_urls:
+                    self.logger.info(f"[{row['source']}] Added: {row['title']} @ {row['company']}")
+            inserted += len(new_urls)
+        return inserted
+
+    def _drop_near_duplicates(self, rows: list) -> list:
+        """
+        Drops rows that repeat a posting already stored (or already kept from
+        this batch) under a different URL: same dedup_key bucket, and
+        is_same_posting (content SimHash, location, posted within
+        DEDUP_WINDOW — see services/jobs/dedup.py). Rows without a bucket
+        key or with a NULL simhash are always kept.
+        """
+        candidates = [row for row in rows if row["dedup_key"] and row["content_simhash"] is not None]
+        keys = list({row["dedup_key"] for row in candidates})
+        seen = {}
+        if keys:
+            since = min(row["posted_at"] for row in candidates) - DEDUP_WINDOW
+            for start in range(0, len(keys), FLUSH_CHUNK_SIZE):
+                batch_keys = keys[start:start + FLUSH_CHUNK_SIZE]
+                existing = self.db.execute(
+                    select(
+                        Job.dedup_key, Job.url, Job.content_simhash,
+                        Job.location_is_worldwide, Job.location_regions, Job.posted_at,
+                    ).where(
+                        Job.dedup_key.in_(batch_keys),
+                        Job.content_simhash.is_not(None),
+                        Job.posted_at >= since,
+                    )
+                ).mappings().all()
+                for job in existing:
+                    seen.setdefault(job["dedup_key"], []).append(job)
+
+        kept = []
+        for row in rows:
+            if row["dedup_key"] is None or row["content_simhash"] is None:
+                kept.append(row)
+                continue
+            matches = seen.setdefault(row["dedup_key"], [])
+            duplicate_of = next(
+                (job["url"] for job in matches if job["url"] != row["url"] and is_same_posting(job, row)),
+                None,
+            )
+            if duplicate_of:
+                self.logger.debug(f"[{row['source']}] Skipping duplicate of {duplicate_of}: {row['url']}")
+                continue
+            matches.append(row)
+            kept.append(row)
+        if len(kept) < len(rows):
+            self.logger.info(f"Collapsed {len(rows) - len(kept)} cross-source duplicate job(s).")
+        return kept
+
+    def _insert_stmt(self, rows: list):
+        return (
+            pg_insert(Job.__table__)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["url"])
+            .returning(Job.__table__.c.url)
+        )
+
+    def _commit(self) -> Optional[int]:
+        """
+        Flushes staged jobs in bulk and commits. Returns how many were new,
+        or None if the commit failed and was rolled back — callers must not
+        advance scrape state past rows that never landed.
+        """
+        if not self._buffer:
+            return 0
         try:
-            stmt = pg_insert(Job.__table__).values(
-                title=title,
-                company=company or "Unknown",
-                location=location or "Remote",
-                description=description or f"Job scraped from {source}.",
-                url=url,
-                source=source,
-                posted_at=posted_at or datetime.utcnow(),
-            ).on_conflict_do_nothing(index_elements=["url"])
-            result = self.db.execute(stmt)
-            inserted = result.rowcount > 0
-            if inserted:
-                self.logger.info(f"[{source}] Added: {title} @ {company}")
-                self._pending += 1
-            return inserted
+            inserted = self._flush()
+            self.db.commit()
         except Exception as e:
-            self.logger.error(f"[{source}] _save_job error for '{url}': {e}")
             self.db.rollback()
-            return False
+            self.logger.error(f"DB commit failed: {e}")
+            return None
+        if inserted:
+            invalidate_filters_cache()
+        return inserted
 
-    def _commit(self):
-        if self._pending > 0:
-            try:
-                self.db.commit()
-                self._pending = 0
-            except Exception as e:
-                self.db.rollback()
-                self._pending = 0
-                self.logger.error(f"DB commit failed: {e}")
+    # ──────────────────────────────────────────────
+    # Browser-based sources
+    #
+    # Each source is split into three steps so the sync scraper here and the
+    # async engine (services/browser/async_job_scraper.py) share everything
+    # but the Playwright calls:
+    #   _<source>_url(s)   build the listing URL(s)
+    #   _fetch_<source>    drive the page, return its HTML (sync API)
+    #   _parse_<source>    turn the HTML into job dicts for _save_job
+    # ──────────────────────────────────────────────
+    def _save_parsed(self, jobs: list, source: str, query: str) -> int:
+        """
+        Stages the part of a parsed (newest-first) listing not seen on the
+        last run for (source, query), flushes it in bulk, records the new
+        high-water mark, and returns how many jobs were new. The mark is left
+        where it was if the flush failed, so the next run retries those jobs.
+        """
+        fresh = unseen_listing(jobs, self.scrape_state.get(source, query))
+        if len(fresh) < len(jobs):
+            self.logger.info(f"[{source}] {len(jobs) - len(fresh)} of {len(jobs)} listed jobs already seen for '{query}'.")
+        for job in fresh:
+            self._save_job(**job)
+        count = self._commit()
+        if count is None:
+            self.logger.warning(f"[{source}] Keeping previous scrape state for '{query}' after failed commit.")
+            return 0
+        self.scrape_state.record(
+            source, query,
+            urls=[job["url"] for job in jobs],
+            posted_ats=[job.get("posted_at") for job in jobs],
+        )
+        return count
 
     # ──────────────────────────────────────────────
     # 1. WeWorkRemotely (original)
     # ──────────────────────────────────────────────
     def scrape_weworkremotely(self, search_term: str = "python"):
         """Scrapes WeWorkRemotely for jobs matching search_term."""
-        url = f"https://weworkremotely.com/remote-jobs/search?term={search_term}"
+        url = self._weworkremotely_url(search_term)
         self.logger.info(f"[WeWorkRemotely] Scraping: {url}")
         count = 0
 
         try:
-            with BrowserManager(headless=True) as page:
-                page.goto(url)
-                page.wait_for_selector(".jobs-container", timeout=15000)
-                soup = BeautifulSoup(page.content(), "html.parser")
-
-                for item in soup.select("section.jobs article ul li"):
-                    if "view-all" in item.get("class", []):
-                        continue
-                    try:
-                        title_elem = item.select_one(".new-listing__header__title")
-                        company_elem = item.select_one(".new-listing__company-name")
-                        region_elem = item.select_one(".new-listing__company-headquarters")
-                        link_elem = item.select_one("a.listing-link--unlocked") or item.select_one("a")
-
-                        if not title_elem or not company_elem or not link_elem:
-                            continue
-
-                        href = link_elem["href"]
-                        if not href.startswith("http"):
-                            href = f"https://weworkremotely.com{href}"
-
-                        added = self._save_job(
-                            title=title_elem.get_text(strip=True),
-                            company=company_elem.get_text(strip=True),
-                            location=region_elem.get_text(strip=True) if region_elem else "Remote",
-                            description=f"Scraped from WeWorkRemotely. Search: {search_term}",
-                            url=href,
-                            source="WeWorkRemotely",
-                        )
-                        if added:
-                            count += 1
-                    except Exception as e:
-                        self.logger.error(f"[WeWorkRemotely] Item parse error: {e}")
-
-                self._commit()
+            with self._open_page("WeWorkRemotely") as page:
+                html = self._fetch_weworkremotely(page, url)
+                count = self._save_parsed(self._parse_weworkremotely(html, search_term), "WeWorkRemotely", search_term)
         except Exception as e:
             self.logger.error(f"[WeWorkRemotely] Scraper error: {e}")
 
         self.logger.info(f"[WeWorkRemotely] Done. Added {count} jobs for '{search_term}'.")
         return count
 
+    def _weworkremotely_url(self, search_term: str) -> str:
+        return f"https://weworkremotely.com/remote-jobs/search?term={search_term}"
+
+    def _fetch_weworkremotely(self, page, url: str) -> str:
+        page.goto(url)
+        page.wait_for_selector(".jobs-container", timeout=15000)
+        return page.content()
+
+    WWR_ITEMS = SelectorChain("section.jobs article ul li")
+    WWR_TITLE = SelectorChain(".new-listing__header__title")
+    WWR_COMPANY = SelectorChain(".new-listing__company-name")
+    WWR_REGION = SelectorChain(".new-listing__company-headquarters")
+    WWR_LINK = SelectorChain("a.listing-link--unlocked", "a")
+
+    def _parse_weworkremotely(self, html: str, search_term: str) -> list:
+        soup = make_soup(html)
+        jobs = []
+
+        for item in self.WWR_ITEMS.select(soup):
+            if "view-all" in item.get("class", []):
+                continue
+            try:
+                title_elem = self.WWR_TITLE.select_one(item)
+                company_elem = self.WWR_COMPANY.select_one(item)
+                region_elem = self.WWR_REGION.select_one(item)
+                link_elem = self.WWR_LINK.select_one(item)
+
+                if not title_elem or not company_elem or not link_elem:
+                    continue
+
+                href = link_elem["href"]
+                if not href.startswith("http"):
+                    href = f"https://weworkremotely.com{href}"
+
+                jobs.append(dict(
+                    title=title_elem.get_text(strip=True),
+                    company=company_elem.get_text(strip=True),
+                    location=region_elem.get_text(strip=True) if region_elem else "Remote",
+                    description=f"Scraped from WeWorkRemotely. Search: {search_term}",
+                    url=href,
+                    source="WeWorkRemotely",
+                ))
+            except Exception as e:
+                self.logger.error(f"[WeWorkRemotely] Item parse error: {e}")
+
+        return jobs
+
     # ──────────────────────────────────────────────
     # 2. Wellfound (formerly AngelList Talent)
     # ──────────────────────────────────────────────
+    WELLFOUND_CARD_SELECTOR = '[data-test="JobSearchResult"], div[class*="JobListing"], [data-test="StartupResult"]'
+    WELLFOUND_CARDS = SelectorChain(
+        '[data-test="JobSearchResult"]', "div[class*='JobListing']",
+        '[data-test="StartupResult"]', "div[class*='styles_result']",
+    )
+    WELLFOUND_TITLE = SelectorChain("a[class*='jobTitle']", "h2 a", "h3 a", "a[href*='/jobs/']")
+    WELLFOUND_COMPANY = SelectorChain("a[class*='startup']", "a[href*='/company/']", "span[class*='company']")
+    WELLFOUND_LOCATION = SelectorChain("span[class*='location']", "div[class*='location']")
+    WELLFOUND_LINK = SelectorChain("a[href*='/jobs/']", "a")
+
     def scrape_wellfound(self, role: str = "software-engineer", location: str = "remote"):
         """
         Scrapes Wellfound job listings.
@@ -117,289 +295,293 @@ class JobScraper:
         Fallback URL: https://wellfound.com/role/r/<role>
         Falls back gracefully on anti-bot / sign-up walls.
         """
+        urls = self._wellfound_urls(role)
+        self.logger.info(f"[Wellfound] Scraping: {urls[0]}")
+        count = 0
+
+        for attempt_url in urls:
+            try:
+                with self._open_page("Wellfound") as page:
+                    html = self._fetch_wellfound(page, attempt_url)
+                    if html is None:
+                        continue
+                    count = self._save_parsed(self._parse_wellfound(html, role, attempt_url), "Wellfound", role)
+                    break  # Success — no need to try fallback URL
+
+            except Exception as e:
+                self.logger.error(f"[Wellfound] Scraper error on {attempt_url}: {e}")
+
+        self.logger.info(f"[Wellfound] Done. Added {count} jobs for role '{role}'.")
+        return count
+
+    def _wellfound_urls(self, role: str) -> list:
         role_slug = role.lower().replace(" ", "-")
         # Use the jobs search page which has less aggressive gating
         primary_url = f"https://wellfound.com/jobs?role={role_slug}&remote=true"
         fallback_url = f"https://wellfound.com/role/r/{role_slug}"
-        self.logger.info(f"[Wellfound] Scraping: {primary_url}")
-        count = 0
+        return [primary_url, fallback_url]
 
-        for attempt_url in [primary_url, fallback_url]:
-            try:
-                with BrowserManager(headless=True) as page:
-                    page.goto(attempt_url, timeout=30000)
-                    self._random_delay(3, 5)
+    def _wellfound_is_walled(self, content: str) -> bool:
+        """Detect hard sign-up wall (no job cards, only auth prompt)."""
+        no_jobs = "job-listings" not in content and 'data-test="JobSearchResult"' not in content
+        return ("Create a free account" in content or "Sign up to see" in content) and no_jobs
 
-                    # Dismiss modals / cookie banners if present
-                    try:
-                        page.keyboard.press("Escape")
-                    except Exception:
-                        pass
+    def _fetch_wellfound(self, page, url: str):
+        """Returns the page HTML, or None when a sign-up wall blocks the listing."""
+        page.goto(url, timeout=30000)
+        self._random_delay(3, 5)
 
-                    content = page.content()
+        # Dismiss modals / cookie banners if present
+        try:
+            page.keyboard.press("Escape")
+        except Exception:
+            pass
 
-                    # Detect hard sign-up wall (no job cards, only auth prompt)
-                    no_jobs = "job-listings" not in content and 'data-test="JobSearchResult"' not in content
-                    hard_wall = ("Create a free account" in content or "Sign up to see" in content) and no_jobs
-                    if hard_wall:
-                        self.logger.warning(f"[Wellfound] Sign-up wall on {attempt_url}. Trying fallback...")
-                        continue
+        if self._wellfound_is_walled(page.content()):
+            self.logger.warning(f"[Wellfound] Sign-up wall on {url}. Trying fallback...")
+            return None
 
-                    # Wait for cards
-                    try:
-                        page.wait_for_selector(
-                            '[data-test="JobSearchResult"], div[class*="JobListing"], [data-test="StartupResult"]',
-                            timeout=10000
-                        )
-                    except Exception:
-                        self.logger.warning(f"[Wellfound] No card selector on {attempt_url}. Parsing anyway.")
+        # Wait for cards
+        try:
+            page.wait_for_selector(self.WELLFOUND_CARD_SELECTOR, timeout=10000)
+        except Exception:
+            self.logger.warning(f"[Wellfound] No card selector on {url}. Parsing anyway.")
 
-                    soup = BeautifulSoup(page.content(), "html.parser")
+        return page.content()
 
-                    job_cards = (
-                        soup.select('[data-test="JobSearchResult"]') or
-                        soup.select("div[class*='JobListing']") or
-                        soup.select('[data-test="StartupResult"]') or
-                        soup.select("div[class*='styles_result']")
-                    )
+    def _parse_wellfound(self, html: str, role: str, url: str) -> list:
+        soup = make_soup(html)
+        jobs = []
 
-                    self.logger.info(f"[Wellfound] Found {len(job_cards)} cards on {attempt_url}.")
-
-                    for card in job_cards:
-                        try:
-                            title_elem = (
-                                card.select_one("a[class*='jobTitle']") or
-                                card.select_one("h2 a") or
-                                card.select_one("h3 a") or
-                                card.select_one("a[href*='/jobs/']")
-                            )
-                            company_elem = (
-                                card.select_one("a[class*='startup']") or
-                                card.select_one("a[href*='/company/']") or
-                                card.select_one("span[class*='company']")
-                            )
-                            location_elem = (
-                                card.select_one("span[class*='location']") or
-                                card.select_one("div[class*='location']")
-                            )
-                            link_elem = card.select_one("a[href*='/jobs/']") or card.select_one("a")
-
-                            if not title_elem or not link_elem:
-                                continue
-
-                            href = link_elem.get("href", "")
-                            if not href.startswith("http"):
-                                href = f"https://wellfound.com{href}"
-
-                            added = self._save_job(
-                                title=title_elem.get_text(strip=True),
-                                company=company_elem.get_text(strip=True) if company_elem else "Startup",
-                                location=location_elem.get_text(strip=True) if location_elem else "Remote",
-                                description=f"Scraped from Wellfound. Role: {role}",
-                                url=href,
-                                source="Wellfound",
-                            )
-                            if added:
-                                count += 1
-                        except Exception as e:
-                            self.logger.error(f"[Wellfound] Card parse error: {e}")
-
-                    self._commit()
-                    break  # Success — no need to try fallback URL
+        job_cards = self.WELLFOUND_CARDS.select(soup)
+
+        self.logger.info(f"[Wellfound] Found {len(job_cards)} cards on {url}.")
 
+        for card in job_cards:
+            try:
+                title_elem = self.WELLFOUND_TITLE.select_one(card)
+                company_elem = self.WELLFOUND_COMPANY.select_one(card)
+                location_elem = self.WELLFOUND_LOCATION.select_one(card)
+                link_elem = self.WELLFOUND_LINK.select_one(card)
+
+                if not title_elem or not link_elem:
+                    continue
+
+                href = link_elem.get("href", "")
+                if not href.startswith("http"):
+                    href = f"https://wellfound.com{href}"
+
+                jobs.append(dict(
+                    title=title_elem.get_text(strip=True),
+                    company=company_elem.get_text(strip=True) if company_elem else "Startup",
+                    location=location_elem.get_text(strip=True) if location_elem else "Remote",
+                    description=f"Scraped from Wellfound. Role: {role}",
+                    url=href,
+                    source="Wellfound",
+                ))
             except Exception as e:
-                self.logger.error(f"[Wellfound] Scraper error on {attempt_url}: {e}")
+                self.logger.error(f"[Wellfound] Card parse error: {e}")
 
-        self.logger.info(f"[Wellfound] Done. Added {count} jobs for role '{role}'.")
-        return count
+        return jobs
 
     # ──────────────────────────────────────────────
     # 3. Monster
     # ──────────────────────────────────────────────
+    MONSTER_CARD_SELECTOR = "[data-testid='jobCard'], .job-cardstyle__JobCardComponent, .card-content"
+    MONSTER_CARDS = SelectorChain(
+        "[data-testid='jobCard']", ".job-cardstyle__JobCardComponent", "article.card", ".card-content",
+    )
+    MONSTER_TITLE = SelectorChain("[data-testid='jobTitle']", "h2.title", "a.job-title", "h2", "h3")
+    MONSTER_COMPANY = SelectorChain(
+        "[data-testid='company']", ".company", "div[class*='company']", "span[class*='company']",
+    )
+    MONSTER_LOCATION = SelectorChain("[data-testid='jobLocation']", ".location", "div[class*='location']")
+    MONSTER_LINK = SelectorChain("a[href*='/job-openings/']", "a")
+
     def scrape_monster(self, search_term: str = "python developer", location: str = "remote"):
         """
         Scrapes Monster.com for job listings.
         URL: https://www.monster.com/jobs/search?q=<term>&where=<location>
         """
-        query = search_term.replace(" ", "+")
-        loc = location.replace(" ", "+")
-        url = f"https://www.monster.com/jobs/search?q={query}&where={loc}"
+        url = self._monster_url(search_term, location)
         self.logger.info(f"[Monster] Scraping: {url}")
         count = 0
 
         try:
-            with BrowserManager(headless=True) as page:
-                page.goto(url, timeout=30000)
-                self._random_delay(2, 4)
-
-                # Monster loads cards via JS; wait for job card container
-                try:
-                    page.wait_for_selector("[data-testid='jobCard'], .job-cardstyle__JobCardComponent, .card-content", timeout=15000)
-                except Exception:
-                    self.logger.warning("[Monster] Job cards selector timed out. Attempting parse anyway.")
-
-                # Scroll to load more results
-                for _ in range(3):
-                    page.evaluate("window.scrollBy(0, 800)")
-                    self._random_delay(1, 2)
-
-                soup = BeautifulSoup(page.content(), "html.parser")
-
-                # Try multiple selector strategies for Monster
-                job_cards = (
-                    soup.select("[data-testid='jobCard']") or
-                    soup.select(".job-cardstyle__JobCardComponent") or
-                    soup.select("article.card") or
-                    soup.select(".card-content")
-                )
-
-                self.logger.info(f"[Monster] Found {len(job_cards)} potential job cards.")
-
-                for card in job_cards:
-                    try:
-                        # Title
-                        title_elem = (
-                            card.select_one("[data-testid='jobTitle']") or
-                            card.select_one("h2.title") or
-                            card.select_one("a.job-title") or
-                            card.select_one("h2") or
-                            card.select_one("h3")
-                        )
-                        # Company
-                        company_elem = (
-                            card.select_one("[data-testid='company']") or
-                            card.select_one(".company") or
-                            card.select_one("div[class*='company']") or
-                            card.select_one("span[class*='company']")
-                        )
-                        # Location
-                        location_elem = (
-                            card.select_one("[data-testid='jobLocation']") or
-                            card.select_one(".location") or
-                            card.select_one("div[class*='location']")
-                        )
-                        # Link
-                        link_elem = card.select_one("a[href*='/job-openings/']") or card.select_one("a")
+            with self._open_page("Monster") as page:
+                html = self._fetch_monster(page, url)
+                count = self._save_parsed(self._parse_monster(html, search_term, location), "Monster", f"{search_term}|{location}")
+        except Exception as e:
+            self.logger.error(f"[Monster] Scraper error: {e}")
 
-                        if not title_elem or not link_elem:
-                            continue
+        self.logger.info(f"[Monster] Done. Added {count} jobs for '{search_term}'.")
+        return count
 
-                        href = link_elem.get("href", "")
-                        if not href.startswith("http"):
-                            href = f"https://www.monster.com{href}"
+    def _monster_url(self, search_term: str, location: str) -> str:
+        query = search_term.replace(" ", "+")
+        loc = location.replace(" ", "+")
+        return f"https://www.monster.com/jobs/search?q={query}&where={loc}"
 
-                        # Filter out non-job links
-                        if "monster.com" not in href and not href.startswith("/"):
-                            continue
+    def _fetch_monster(self, page, url: str) -> str:
+        page.goto(url, timeout=30000)
+        self._random_delay(2, 4)
 
-                        added = self._save_job(
-                            title=title_elem.get_text(strip=True),
-                            company=company_elem.get_text(strip=True) if company_elem else "Company",
-                            location=location_elem.get_text(strip=True) if location_elem else location,
-                            description=f"Scraped from Monster. Search: {search_term}",
-                            url=href,
-                            source="Monster",
-                        )
-                        if added:
-                            count += 1
-                    except Exception as e:
-                        self.logger.error(f"[Monster] Card parse error: {e}")
+        # Monster loads cards via JS; wait for job card container
+        try:
+            page.wait_for_selector(self.MONSTER_CARD_SELECTOR, timeout=15000)
+        except Exception:
+            self.logger.warning("[Monster] Job cards selector timed out. Attempting parse anyway.")
 
-                self._commit()
-        except Exception as e:
-            self.logger.error(f"[Monster] Scraper error: {e}")
+        # Scroll to load more results
+        for _ in range(3):
+            page.evaluate("window.scrollBy(0, 800)")
+            self._random_delay(1, 2)
 
-        self.logger.info(f"[Monster] Done. Added {count} jobs for '{search_term}'.")
-        return count
+        return page.content()
+
+    def _parse_monster(self, html: str, search_term: str, location: str) -> list:
+        soup = make_soup(html)
+        jobs = []
+
+        # Try multiple selector strategies for Monster
+        job_cards = self.MONSTER_CARDS.select(soup)
+
+        self.logger.info(f"[Monster] Found {len(job_cards)} potential job cards.")
+
+        for card in job_cards:
+            try:
+                title_elem = self.MONSTER_TITLE.select_one(card)
+                company_elem = self.MONSTER_COMPANY.select_one(card)
+                location_elem = self.MONSTER_LOCATION.select_one(card)
+                link_elem = self.MONSTER_LINK.select_one(card)
+
+                if not title_elem or not link_elem:
+                    continue
+
+                href = link_elem.get("href", "")
+                if not href.startswith("http"):
+                    href = f"https://www.monster.com{href}"
+
+                # Filter out non-job links
+                if "monster.com" not in href and not href.startswith("/"):
+                    continue
+
+                jobs.append(dict(
+                    title=title_elem.get_text(strip=True),
+                    company=company_elem.get_text(strip=True) if company_elem else "Company",
+                    location=location_elem.get_text(strip=True) if location_elem else location,
+                    description=f"Scraped from Monster. Search: {search_term}",
+                    url=href,
+                    source="Monster",
+                ))
+            except Exception as e:
+                self.logger.error(f"[Monster] Card parse error: {e}")
+
+        return jobs
 
     # ──────────────────────────────────────────────
     # 4. Naukri
     # ──────────────────────────────────────────────
+    NAUKRI_CARD_SELECTOR = ".jobTupleHeader, article.jobTuple, .srp-jobtuple-wrapper"
+    NAUKRI_CARDS = SelectorChain("article.jobTuple", ".srp-jobtuple-wrapper", ".jobTupleHeader")
+    NAUKRI_TITLE = SelectorChain(".title a", "a.title", ".jobTitle a", "a[class*='title']")
+    NAUKRI_COMPANY = SelectorChain(".companyInfo a", "a.subTitle", ".comp-name")
+    NAUKRI_LOCATION = SelectorChain(".locWdth", ".location span", "li.location")
+
     def scrape_naukri(self, search_term: str = "python developer", location: str = ""):
         """
         Scrapes Naukri.com for tech job listings (India-focused).
         URL: https://www.naukri.com/<search-slug>-jobs[/<location>]
         """
+        url = self._naukri_url(search_term, location)
+        self.logger.info(f"[Naukri] Scraping: {url}")
+        count = 0
+
+        try:
+            with self._open_page("Naukri") as page:
+                html = self._fetch_naukri(page, url)
+                count = self._save_parsed(self._parse_naukri(html, search_term, location), "Naukri", f"{search_term}|{location}")
+        except Exception as e:
+            self.logger.error(f"[Naukri] Scraper error: {e}")
+
+        self.logger.info(f"[Naukri] Done. Added {count} jobs for '{search_term}'.")
+        return count
+
+    def _naukri_url(self, search_term: str, location: str) -> str:
         slug = search_term.lower().replace(" ", "-")
         loc_slug = location.lower().replace(" ", "-") if location else ""
         url = f"https://www.naukri.com/{slug}-jobs"
         if loc_slug:
             url += f"-in-{loc_slug}"
-        self.logger.info(f"[Naukri] Scraping: {url}")
-        count = 0
+        return url
 
-        try:
-            with BrowserManager(headless=True) as page:
-                page.goto(url, timeout=30000)
-                self._random_delay(2, 5)
-
-                # Naukri uses SSR; wait for article list
-                try:
-                    page.wait_for_selector(".jobTupleHeader, article.jobTuple, .srp-jobtuple-wrapper", timeout=15000)
-                except Exception:
-                    self.logger.warning("[Naukri] Job tuple selector timed out. Attempting parse anyway.")
+    def _fetch_naukri(self, page, url: str) -> str:
+        page.goto(url, timeout=30000)
+        self._random_delay(2, 5)
 
-                soup = BeautifulSoup(page.content(), "html.parser")
+        # Naukri uses SSR; wait for article list
+        try:
+            page.wait_for_selector(self.NAUKRI_CARD_SELECTOR, timeout=15000)
+        except Exception:
+            self.logger.warning("[Naukri] Job tuple selector timed out. Attempting parse anyway.")
 
-                # Naukri selectors (SSR rendered)
-                job_cards = (
-                    soup.select("article.jobTuple") or
-                    soup.select(".srp-jobtuple-wrapper") or
-                    soup.select(".jobTupleHeader")
-                )
+        return page.content()
 
-                self.logger.info(f"[Naukri] Found {len(job_cards)} potential job cards.")
+    def _parse_naukri(self, html: str, search_term: str, location: str) -> list:
+        soup = make_soup(html)
+        jobs = []
 
-                for card in job_cards:
-                    try:
-                        # Title
-                        title_elem = (
-                            card.select_one(".title a") or
-                            card.select_one("a.title") or
-                            card.select_one(".jobTitle a") or
-                            card.select_one("a[class*='title']")
-                        )
-                        # Company
-                        company_elem = (
-                            card.select_one(".companyInfo a") or
-                            card.select_one("a.subTitle") or
-                            card.select_one(".comp-name")
-                        )
-                        # Location
-                        location_elem = (
-                            card.select_one(".locWdth") or
-                            card.select_one(".location span") or
-                            card.select_one("li.location")
-                        )
+        # Naukri selectors (SSR rendered)
+        job_cards = self.NAUKRI_CARDS.select(soup)
 
-                        if not title_elem:
-                            continue
+        self.logger.info(f"[Naukri] Found {len(job_cards)} potential job cards.")
 
-                        href = title_elem.get("href", "")
-                        if not href:
-                            continue
-                        if not href.startswith("http"):
-                            href = f"https://www.naukri.com{href}"
-
-                        added = self._save_job(
-                            title=title_elem.get_text(strip=True),
-                            company=company_elem.get_text(strip=True) if company_elem else "Company",
-                            location=location_elem.get_text(strip=True) if location_elem else (location or "India"),
-                            description=f"Scraped from Naukri. Search: {search_term}",
-                            url=href,
-                            source="Naukri",
-                        )
-                        if added:
-                            count += 1
-                    except Exception as e:
-                        self.logger.error(f"[Naukri] Card parse error: {e}")
+        for card in job_cards:
+            try:
+                title_elem = self.NAUKRI_TITLE.select_one(card)
+                company_elem = self.NAUKRI_COMPANY.select_one(card)
+                location_elem = self.NAUKRI_LOCATION.select_one(card)
+
+                if not title_elem:
+                    continue
+
+                href = title_elem.get("href", "")
+                if not href:
+                    continue
+                if not href.startswith("http"):
+                    href = f"https://www.naukri.com{href}"
+
+                jobs.append(dict(
+                    title=title_elem.get_text(strip=True),
+                    company=company_elem.get_text(strip=True) if company_elem else "Company",
+                    location=location_elem.get_text(strip=True) if location_elem else (location or "India"),
+                    description=f"Scraped from Naukri. Search: {search_term}",
+                    url=href,
+                    source="Naukri",
+                ))
+            except Exception as e:
+                self.logger.error(f"[Naukri] Card parse error: {e}")
 
-                self._commit()
-        except Exception as e:
-            self.logger.error(f"[Naukri] Scraper error: {e}")
+        return jobs
 
-        self.logger.info(f"[Naukri] Done. Added {count} jobs for '{search_term}'.")
-        return count
+    # ──────────────────────────────────────────────
+    # JSON API sources
+    #   All tags / categories of a source are fetched concurrently over one
+    #   pooled async client (services/browser/api_client.py), then parsed and
+    #   saved here, one feed at a time.
+    # ──────────────────────────────────────────────
+    def _fetch_feeds(self, source: str, feeds: list, min_interval: float, headers: dict = None) -> list:
+        """
+        Fetches (query, url) feeds concurrently, each conditional on the
+        scrape state of (source, query). Returns (query, state, response)
+        triples in feed order; `response` is the exception if the fetch failed.
+        """
+        states = [self.scrape_state.get(source, query) for query, _ in feeds]
+        requests = [(url, self.scrape_state.conditional_headers(state)) for (_, url), state in zip(feeds, states)]
+        for _, url in feeds:
+            self.logger.info(f"[{source}] Fetching: {url}")
+        responses = asyncio.run(fetch_all(requests, min_interval=min_interval, headers=headers))
+        return [(query, state, response) for (query, _), state, response in zip(feeds, states, responses)]
 
     # ──────────────────────────────────────────────
     # 5. RemoteOK (Public JSON API — no auth needed)
@@ -409,23 +591,25 @@ class JobScraper:
         Fetches jobs from RemoteOK's public JSON API.
         API: https://remoteok.com/api?tags=<tag>
         No authentication required. Results include title, company, location, tags, URL.
+        Conditional per tag: an unchanged feed (304) or already-seen items are skipped.
+        The same job listed under several tags is only processed once.
         """
-        import httpx
-
         if tags is None:
             tags = ["python", "javascript", "react", "devops", "ai", "java", "golang"]
 
         count = 0
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; JobPortalBot/1.0)",
-            "Accept": "application/json",
-        }
-
-        for tag in tags:
-            url = f"https://remoteok.com/api?tags={tag}"
-            self.logger.info(f"[RemoteOK] Fetching: {url}")
+        collapsed = 0
+        staged_urls = set()  # cross-tag duplicates are collapsed before the DB
+        feeds = [(tag, f"https://remoteok.com/api?tags={tag}") for tag in tags]
+
+        for tag, state, response in self._fetch_feeds("RemoteOK", feeds, min_interval=1.0, headers={"Accept": "application/json"}):
             try:
-                response = httpx.get(url, headers=headers, timeout=15)
+                if isinstance(response, Exception):
+                    raise response
+                if response.status_code == 304:
+                    self.logger.info(f"[RemoteOK] Tag '{tag}' unchanged since last run.")
+                    self.scrape_state.record("RemoteOK", tag, response=response)
+                    continue
                 response.raise_for_status()
                 data = response.json()
 
@@ -434,33 +618,43 @@ class JobScraper:
 
                 self.logger.info(f"[RemoteOK] Found {len(jobs)} jobs for tag '{tag}'.")
 
+                listed_urls, listed_dates, seen = [], [], 0
                 for job in jobs:
                     try:
-                        title = job.get("position", "")
-                        company = job.get("company", "Unknown")
-                        location = job.get("location", "") or "Remote"
                         job_url = job.get("url", "")
                         if not job_url:
                             slug = job.get("slug", "")
                             job_url = f"https://remoteok.com/remote-jobs/{slug}" if slug else ""
-                        description = job.get("description", "") or f"Scraped from RemoteOK. Tags: {', '.join(job.get('tags', [tag]))}"
-
-                        # Strip HTML from description
-                        if "<" in description:
-                            soup = BeautifulSoup(description, "html.parser")
-                            description = soup.get_text(separator=" ", strip=True)[:2000]
 
                         # Parse date
                         posted_at = None
                         date_str = job.get("date", "")
                         if date_str:
                             try:
-                                from datetime import timezone
                                 posted_at = datetime.fromisoformat(date_str.replace("Z", "+00:00")).replace(tzinfo=None)
                             except Exception:
                                 posted_at = datetime.utcnow()
 
-                        added = self._save_job(
+                        listed_urls.append(job_url)
+                        listed_dates.append(posted_at)
+                        if is_seen(job_url, posted_at, state):
+                            seen += 1
+                            continue
+                        canonical_url = canonicalize_url(job_url)
+                        if canonical_url in staged_urls:
+                            collapsed += 1
+                            continue
+                        staged_urls.add(canonical_url)
+
+                        title = job.get("position", "")
+                        company = job.get("company", "Unknown")
+                        location = job.get("location", "") or "Remote"
+                        description = job.get("description", "") or f"Scraped from RemoteOK. Tags: {', '.join(job.get('tags', [tag]))}"
+
+                        # Strip HTML from description
+                        description = strip_html(description)
+
+                        self._save_job(
                             title=title,
                             company=company,
                             location=location,
@@ -469,17 +663,24 @@ class JobScraper:
                             source="RemoteOK",
                             posted_at=posted_at,
                         )
-                        if added:
-                            count += 1
                     except Exception as e:
                         self.logger.error(f"[RemoteOK] Job parse error: {e}")
 
-                self._commit()
-                self._random_delay(1, 2)  # Be polite to the API
+                if seen:
+                    self.logger.info(f"[RemoteOK] Skipped {seen} already-seen jobs for tag '{tag}'.")
+                inserted = self._commit()
+                if inserted is None:
+                    # Keep the old marks and validators so the next run refetches this feed
+                    self.logger.warning(f"[RemoteOK] Keeping previous scrape state for '{tag}' after failed commit.")
+                    continue
+                count += inserted
+                self.scrape_state.record("RemoteOK", tag, urls=listed_urls, posted_ats=listed_dates, response=response)
 
             except Exception as e:
                 self.logger.error(f"[RemoteOK] API error for tag '{tag}': {e}")
 
+        if collapsed:
+            self.logger.info(f"[RemoteOK] Collapsed {collapsed} jobs listed under more than one tag.")
         self.logger.info(f"[RemoteOK] Done. Added {count} total new jobs.")
         return count
 
@@ -491,9 +692,8 @@ class JobScraper:
         Fetches jobs from Remotive's public JSON API.
         API: https://remotive.com/api/remote-jobs?category=<category>
         No authentication required. Returns rich structured job data.
+        Conditional per category: an unchanged feed (304) or already-seen items are skipped.
         """
-        import httpx
-
         if categories is None:
             categories = [
                 "software-dev",
@@ -504,30 +704,26 @@ class JobScraper:
             ]
 
         count = 0
+        feeds = [(category, f"https://remotive.com/api/remote-jobs?category={category}&limit=50") for category in categories]
 
-        for category in categories:
-            url = f"https://remotive.com/api/remote-jobs?category={category}&limit=50"
-            self.logger.info(f"[Remotive] Fetching: {url}")
+        for category, state, response in self._fetch_feeds("Remotive", feeds, min_interval=0.5):
             try:
-                response = httpx.get(url, timeout=15)
+                if isinstance(response, Exception):
+                    raise response
+                if response.status_code == 304:
+                    self.logger.info(f"[Remotive] Category '{category}' unchanged since last run.")
+                    self.scrape_state.record("Remotive", category, response=response)
+                    continue
                 response.raise_for_status()
                 data = response.json()
                 jobs = data.get("jobs", [])
 
                 self.logger.info(f"[Remotive] Found {len(jobs)} jobs in category '{category}'.")
 
+                listed_urls, listed_dates, seen = [], [], 0
                 for job in jobs:
                     try:
-                        title = job.get("title", "")
-                        company = job.get("company_name", "Unknown")
-                        location = job.get("candidate_required_location", "Remote") or "Remote"
                         job_url = job.get("url", "")
-                        description = job.get("description", "") or f"Scraped from Remotive. Category: {category}"
-
-                        # Strip HTML from description
-                        if "<" in description:
-                            soup = BeautifulSoup(description, "html.parser")
-                            description = soup.get_text(separator=" ", strip=True)[:2000]
 
                         # Parse date
                         posted_at = None
@@ -538,7 +734,21 @@ class JobScraper:
                             except Exception:
                                 posted_at = datetime.utcnow()
 
-                        added = self._save_job(
+                        listed_urls.append(job_url)
+                        listed_dates.append(posted_at)
+                        if is_seen(job_url, posted_at, state):
+                            seen += 1
+                            continue
+
+                        title = job.get("title", "")
+                        company = job.get("company_name", "Unknown")
+                        location = job.get("candidate_required_location", "Remote") or "Remote"
+                        description = job.get("description", "") or f"Scraped from Remotive. Category: {category}"
+
+                        # Strip HTML from description
+                        description = strip_html(description)
+
+                        self._save_job(
                             title=title,
                             company=company,
                             location=location,
@@ -547,13 +757,18 @@ class JobScraper:
                             source="Remotive",
                             posted_at=posted_at,
                         )
-                        if added:
-                            count += 1
                     except Exception as e:
                         self.logger.error(f"[Remotive] Job parse error: {e}")
 
-                self._commit()
-                self._random_delay(0.5, 1)
+                if seen:
+                    self.logger.info(f"[Remotive] Skipped {seen} already-seen jobs in category '{category}'.")
+                inserted = self._commit()
+                if inserted is None:
+                    # Keep the old marks and validators so the next run refetches this feed
+                    self.logger.warning(f"[Remotive] Keeping previous scrape state for '{category}' after failed commit.")
+                    continue
+                count += inserted
+                self.scrape_state.record("Remotive", category, urls=listed_urls, posted_ats=listed_dates, response=response)
 
             except Exception as e:
                 self.logger.error(f"[Remotive] API error for category '{category}': {e}")
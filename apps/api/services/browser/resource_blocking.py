@@ -0,0 +1,72 @@
+"""
+Request blocking for scraping browser contexts.
+
+The scrapers only read DOM text, yet a plain context downloads every image,
+font, video, analytics script and ad on the listing pages. A ResourcePolicy
+is installed as a context route: requests for blocked resource types are
+aborted, and so is anything served from a host outside the source's
+allowlist (when it has one). The top-level document is always loaded.
+
+Only scraping uses this. BrowserManager / BrowserPool default to no policy,
+so the application execution path (agents/execution_agent.py) still loads
+pages in full.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit
+
+from config import settings
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+# Hosts every source may need: bot challenges must be able to run
+COMMON_ALLOWED_DOMAINS = ("cloudflare.com",)
+
+# First-party hosts per source (domain suffixes). Scripts and XHR from these
+# are what render the job cards; everything else is analytics and ads.
+SOURCE_ALLOWED_DOMAINS: Dict[str, Tuple[str, ...]] = {
+    "WeWorkRemotely": ("weworkremotely.com",),
+    "Wellfound": ("wellfound.com", "angel.co"),
+    "Monster": ("monster.com", "monster.io"),
+    "Naukri": ("naukri.com", "naukimg.com"),
+}
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    blocked_types: FrozenSet[str] = BLOCKED_RESOURCE_TYPES
+    allowed_domains: Tuple[str, ...] = field(default=())  # empty: any host
+
+    def allows(self, resource_type: str, url: str) -> bool:
+        if resource_type == "document":
+            return True
+        if resource_type in self.blocked_types:
+            return False
+        if not self.allowed_domains:
+            return True
+        host = (urlsplit(url).hostname or "").lower()
+        return any(host == domain or host.endswith("." + domain) for domain in self.allowed_domains)
+
+    def route(self, route):
+        """Sync Playwright route handler (BrowserContext.route)."""
+        request = route.request
+        if self.allows(request.resource_type, request.url):
+            route.continue_()
+        else:
+            route.abort()
+
+    async def route_async(self, route):
+        """Async Playwright route handler."""
+        request = route.request
+        if self.allows(request.resource_type, request.url):
+            await route.continue_()
+        else:
+            await route.abort()
+
+
+def policy_for_source(source: str) -> Optional[ResourcePolicy]:
+    """Blocking policy for a scraping source, or None when blocking is disabled."""
+    if not settings.SCRAPER_BLOCK_RESOURCES:
+        return None
+    domains = SOURCE_ALLOWED_DOMAINS.get(source)
+    return ResourcePolicy(allowed_domains=domains + COMMON_ALLOWED_DOMAINS if domains else ())
@@ -0,0 +1,145 @@
+"""
+Concurrent scraping orchestration.
+
+A run is a set of SourcePlans — one per job board — each listing the
+JobScraper method to call and the kwargs for every search term. Sources run
+in parallel, so a run's wall time is bounded by the slowest source rather
+than the sum of all of them. Within a source, at most `max_concurrency`
+terms are in flight (the per-domain cap) and term starts are spaced by
+`min_interval` seconds (politeness), on top of the scrapers' own in-page
+delays.
+
+Each worker thread owns its own DB session, JobScraper and — for browser
+sources — BrowserPool, since neither SQLAlchemy sessions nor Playwright's
+sync API may be shared across threads.
+
+With SCRAPER_ENGINE=async, browser sources instead run on one event loop
+with one Chromium (AsyncJobScraper), keeping up to `max_pages` pages of that
+source in flight.
+"""
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+from config import settings
+from database import SessionLocal
+from services.browser.async_browser_manager import AsyncBrowserPool
+from services.browser.async_job_scraper import AsyncJobScraper
+from services.browser.browser_pool import BrowserPool
+from services.browser.job_scraper import JobScraper
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SourcePlan:
+    name: str
+    method: str  # JobScraper method, e.g. "scrape_monster"
+    calls: List[dict] = field(default_factory=lambda: [{}])
+    uses_browser: bool = False
+    max_concurrency: int = 1  # sync engine: terms in flight (each with its own Chromium)
+    max_pages: int = 1  # async engine: pages in flight, sharing one Chromium
+    min_interval: float = 0.0
+
+
+class DomainThrottle:
+    """Spaces out request starts against one domain across threads."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self.min_interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+def run_source(plan: SourcePlan, session_factory: Callable = SessionLocal) -> dict:
+    """Runs every call of one source under its concurrency cap; never raises."""
+    if plan.uses_browser and settings.SCRAPER_ENGINE == "async":
+        return _run_source_async(plan, session_factory)
+
+    started = time.monotonic()
+    calls: "queue.Queue[dict]" = queue.Queue()
+    for kwargs in plan.calls:
+        calls.put(kwargs)
+
+    throttle = DomainThrottle(plan.min_interval)
+    lock = threading.Lock()
+    totals = {"added": 0, "errors": 0}
+
+    def worker():
+        db = session_factory()
+        pool = BrowserPool(headless=True) if plan.uses_browser else None
+        scraper = JobScraper(db, browser_pool=pool)
+        try:
+            while True:
+                try:
+                    kwargs = calls.get_nowait()
+                except queue.Empty:
+                    return
+                throttle.wait()
+                try:
+                    added = getattr(scraper, plan.method)(**kwargs)
+                    with lock:
+                        totals["added"] += added
+                except Exception as e:
+                    logger.error(f"[{plan.name}] Failed for {kwargs}: {e}")
+                    with lock:
+                        totals["errors"] += 1
+        finally:
+            if pool:
+                pool.stop()
+            db.close()
+
+    workers = max(1, min(plan.max_concurrency, len(plan.calls)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"scrape-{plan.name}") as executor:
+        for future in [executor.submit(worker) for _ in range(workers)]:
+            try:
+                future.result()
+            except Exception as e:  # session/browser setup failure
+                logger.error(f"[{plan.name}] Worker crashed: {e}")
+                totals["errors"] += 1
+
+    seconds = round(time.monotonic() - started, 1)
+    logger.info(f"[{plan.name}] Source done: {totals['added']} new jobs, {totals['errors']} errors, {seconds}s")
+    return {"source": plan.name, "added": totals["added"], "errors": totals["errors"], "seconds": seconds}
+
+
+def _run_source_async(plan: SourcePlan, session_factory: Callable) -> dict:
+    started = time.monotonic()
+
+    async def run():
+        async with AsyncBrowserPool(headless=True, max_pages=plan.max_pages) as pool:
+            engine = AsyncJobScraper(JobScraper(db), pool)
+            return await engine.run_many(plan.method, plan.calls, min_interval=plan.min_interval)
+
+    db = session_factory()
+    try:
+        totals = asyncio.run(run())
+    except Exception as e:
+        logger.error(f"[{plan.name}] Async engine failed: {e}")
+        totals = {"added": 0, "errors": 1}
+    finally:
+        db.close()
+
+    seconds = round(time.monotonic() - started, 1)
+    logger.info(f"[{plan.name}] Source done (async): {totals['added']} new jobs, {totals['errors']} errors, {seconds}s")
+    return {"source": plan.name, "added": totals["added"], "errors": totals["errors"], "seconds": seconds}
+
+
+def run_all_sources(plans: List[SourcePlan]) -> Dict[str, dict]:
+    """Runs all sources in parallel in this process; returns results by source name."""
+    with ThreadPoolExecutor(max_workers=max(1, len(plans)), thread_name_prefix="scrape-source") as executor:
+        results = list(executor.map(run_source, plans))
+    return {result["source"]: result for result in results}
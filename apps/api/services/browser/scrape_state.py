@@ -0,0 +1,128 @@
+"""
+Incremental scraping state.
+
+Every run used to re-fetch and re-parse every listing for every term, with
+`ON CONFLICT DO NOTHING` as the only thing stopping re-inserts — after all
+the work was done. The scrape_state table keeps, per (source, query):
+
+  - newest_posted_at / newest_url — the high-water mark of the last run
+  - recent_urls — canonical URLs from the top of the last listing
+  - etag / last_modified — validators for conditional requests (JSON APIs)
+  - last_run_at
+
+Listings are newest-first, so a scraper walks them until it hits a run of
+KNOWN_RUN_TO_STOP already-seen items and drops the rest. A single known item
+doesn't stop the walk: boards pin featured posts to the top, and those stay
+"known" run after run while fresh posts appear below them.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from models import ScrapeState
+from services.jobs.dedup import canonicalize_url
+
+RECENT_URLS_KEPT = 50
+KNOWN_RUN_TO_STOP = 3
+# Feed items dated this far before the high-water mark are treated as seen.
+# Boards back-date or re-sort a little, so the mark isn't a hard cut-off.
+WATERMARK_GRACE = timedelta(hours=6)
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeStateStore:
+    def __init__(self, db: Session, enabled: bool = True):
+        self.db = db
+        self.enabled = enabled
+
+    def get(self, source: str, query: str) -> Optional[ScrapeState]:
+        if not self.enabled:
+            return None
+        return self.db.execute(
+            select(ScrapeState)
+            .where(ScrapeState.source == source, ScrapeState.query == query)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+
+    def conditional_headers(self, state: Optional[ScrapeState]) -> dict:
+        """If-None-Match / If-Modified-Since from the last run's response."""
+        headers = {}
+        if state is not None and state.etag:
+            headers["If-None-Match"] = state.etag
+        if state is not None and state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+        return headers
+
+    def record(
+        self,
+        source: str,
+        query: str,
+        urls: Iterable[str] = (),
+        posted_ats: Iterable[Optional[datetime]] = (),
+        response=None,
+    ):
+        """
+        Upserts the state for (source, query) after a run. `urls` is the
+        listing in page order (newest first); marks are only moved when the
+        run actually saw items, so a failed or 304 run keeps the old ones.
+        """
+        if not self.enabled:
+            return
+        values = {"last_run_at": func.now()}
+        recent = [canonicalize_url(url) for url in urls if url][:RECENT_URLS_KEPT]
+        if recent:
+            values["newest_url"] = recent[0]
+            values["recent_urls"] = recent
+        dated = [posted_at for posted_at in posted_ats if posted_at]
+        if dated:
+            values["newest_posted_at"] = max(dated)
+        if response is not None and response.status_code != 304:
+            values["etag"] = response.headers.get("etag")
+            values["last_modified"] = response.headers.get("last-modified")
+
+        stmt = pg_insert(ScrapeState).values(source=source, query=query, **values)
+        try:
+            self.db.execute(stmt.on_conflict_do_update(
+                index_elements=[ScrapeState.source, ScrapeState.query],
+                set_=values,
+            ))
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"[{source}] Failed to record scrape state for '{query}': {e}")
+
+
+def unseen_listing(jobs: list, state: Optional[ScrapeState]) -> list:
+    """
+    The part of a newest-first listing (job dicts) that is new since the last
+    run: walks it until KNOWN_RUN_TO_STOP consecutive known items, skipping
+    the known ones along the way.
+    """
+    if state is None or not state.recent_urls:
+        return jobs
+    known = set(state.recent_urls)
+    fresh = []
+    run = 0
+    for job in jobs:
+        if canonicalize_url(job["url"]) in known:
+            run += 1
+            if run >= KNOWN_RUN_TO_STOP:
+                break
+            continue
+        run = 0
+        fresh.append(job)
+    return fresh
+
+
+def is_seen(url: str, posted_at: Optional[datetime], state: Optional[ScrapeState]) -> bool:
+    """For feed items: already on the last listing, or older than the high-water mark."""
+    if state is None:
+        return False
+    if url and state.recent_urls and canonicalize_url(url) in state.recent_urls:
+        return True
+    return bool(posted_at and state.newest_posted_at and posted_at < state.newest_posted_at - WATERMARK_GRACE)
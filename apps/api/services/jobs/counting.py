@@ -0,0 +1,82 @@
+"""
+Count strategy for filtered job listings.
+
+An exact COUNT(*) over the filtered set costs as much as the page query itself
+and is paid on every request. Instead:
+
+  1. A bounded probe counts at most COUNT_EXACT_CAP + 1 matching rows. Small
+     result sets get their exact total from it.
+  2. Larger result sets fall back to the planner's row estimate (EXPLAIN, no
+     execution), floored at the cap, and are flagged as inexact so the UI can
+     render "1000+".
+  3. Results are memoised briefly per normalized filter tuple, so hot listing
+     pages (page 2, 3, ... of the same search) pay for the count once.
+"""
+import json
+import logging
+from typing import Hashable, NamedTuple
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.orm import Query
+
+from services.jobs.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+COUNT_EXACT_CAP = 1000
+COUNT_CACHE_TTL_SECONDS = 60
+
+_count_cache = TTLCache(ttl_seconds=COUNT_CACHE_TTL_SECONDS, max_entries=2048)
+
+
+class CountResult(NamedTuple):
+    total: int
+    exact: bool
+
+
+def count_jobs(query: Query, cache_key: Hashable) -> CountResult:
+    """Counts rows matched by `query` using the cheapest adequate strategy."""
+    cached = _count_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    session = query.session
+    probe = (
+        query.order_by(None)
+        .with_entities(literal_column("1"))
+        .limit(COUNT_EXACT_CAP + 1)
+        .subquery()
+    )
+    bounded = session.query(func.count()).select_from(probe).scalar() or 0
+
+    if bounded <= COUNT_EXACT_CAP:
+        result = CountResult(total=bounded, exact=True)
+    else:
+        estimate = _planner_estimate(query)
+        result = CountResult(total=max(estimate, COUNT_EXACT_CAP + 1), exact=False)
+
+    _count_cache.set(cache_key, result)
+    return result
+
+
+def invalidate_counts() -> None:
+    """Drops memoised counts, e.g. after new jobs were ingested in-process."""
+    _count_cache.clear()
+
+
+def _planner_estimate(query: Query) -> int:
+    """Row estimate from EXPLAIN — the query is planned, never executed."""
+    try:
+        # SAVEPOINT so a failed EXPLAIN doesn't abort the request's transaction
+        with query.session.begin_nested():
+            conn = query.session.connection()
+            compiled = query.order_by(None).statement.compile(dialect=conn.dialect)
+            plan = conn.exec_driver_sql(
+                "EXPLAIN (FORMAT JSON) " + str(compiled), compiled.params
+            ).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.warning(f"Planner row estimate failed, using count cap: {e}")
+        return COUNT_EXACT_CAP + 1
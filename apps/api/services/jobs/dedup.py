@@ -0,0 +1,180 @@
+"""
+Cross-source duplicate detection for scraped jobs.
+
+The same posting reaches us from RemoteOK, Remotive, WeWorkRemotely, ... under
+different URLs, often with tracking query strings appended. `Job.url` being
+unique only catches byte-identical URLs, so ingest also:
+
+  - canonicalizes URLs (lowercase host, no "www.", no default port, no
+    fragment, no tracking parameters, sorted query, no trailing slash)
+  - computes `dedup_key` — a hash of the normalized title + company. This is
+    the indexed bucket that candidate duplicates are looked up by.
+  - computes `content_simhash` — a 64-bit SimHash of title + company +
+    normalized description.
+
+Two jobs in the same bucket are the same posting (is_same_posting) when
+their SimHashes are within SIMHASH_MAX_DISTANCE bits, their locations agree
+and they were posted within DEDUP_WINDOW of each other — the same role
+re-opened in another city, or months later, is a new posting.
+
+Nothing identifying is known about some rows, and those are never collapsed:
+placeholder descriptions ("Job scraped from RemoteOK.") get a NULL simhash,
+and fallback company names ("Unknown", "Startup", ...) a NULL dedup_key.
+"""
+import hashlib
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only identify the referrer / campaign, never the job
+TRACKING_PARAMS = {
+    "ref", "referrer", "source", "src", "campaign", "gclid", "fbclid",
+    "mc_cid", "mc_eid", "igshid", "trk", "trackingid", "refid", "from",
+}
+TRACKING_PARAM_PREFIXES = ("utm_",)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Legal suffixes dropped when comparing company names ("Acme, Inc." == "Acme")
+COMPANY_SUFFIXES = {
+    "inc", "incorporated", "llc", "ltd", "limited", "gmbh", "corp",
+    "corporation", "co", "plc", "sa", "ag", "bv", "srl", "pty",
+}
+
+# Prefixes of the descriptions scrapers fill in when the source has none
+PLACEHOLDER_PREFIXES = ("job scraped from ", "scraped from ")
+# Company names scrapers fill in when the card has none (normalized)
+PLACEHOLDER_COMPANIES = {"", "unknown", "company", "startup"}
+
+# Same-bucket jobs posted further apart than this are separate postings
+DEDUP_WINDOW = timedelta(days=30)
+
+SIMHASH_BITS = 64
+# Same-bucket jobs only, so this can be looser than for whole-corpus SimHash
+SIMHASH_MAX_DISTANCE = 6
+SHINGLE_SIZE = 3
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def canonicalize_url(url: str) -> str:
+    """Returns a canonical form of `url` so tracking variants collapse onto one row."""
+    if not url:
+        return url
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "https").lower()
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    netloc = host
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{parts.port}"
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def _words(text: Optional[str]) -> list:
+    return _WORD_RE.findall(_TAG_RE.sub(" ", text or "").lower())
+
+
+def normalize_company(company: Optional[str]) -> str:
+    words = _words(company)
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def dedup_key(title: Optional[str], company: Optional[str]) -> Optional[str]:
+    """Bucket key: sha1 of normalized title + company. None for fallback company names."""
+    company = normalize_company(company)
+    if company in PLACEHOLDER_COMPANIES:
+        return None
+    basis = f"{' '.join(_words(title))}|{company}"
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()
+
+
+def is_placeholder_description(description: Optional[str]) -> bool:
+    text = (description or "").strip().lower()
+    return not text or text.startswith(PLACEHOLDER_PREFIXES)
+
+
+def _hash64(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def content_simhash(title: Optional[str], company: Optional[str], description: Optional[str]) -> Optional[int]:
+    """
+    64-bit SimHash over word shingles of title + company + description, as a
+    signed integer (fits a BIGINT column). None for placeholder descriptions.
+    """
+    if is_placeholder_description(description):
+        return None
+    words = _words(title) + _words(normalize_company(company)) + _words(description)
+    if len(words) < SHINGLE_SIZE:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        h = _hash64(shingle)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    value = sum(1 << bit for bit in range(SIMHASH_BITS) if weights[bit] > 0)
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & ((1 << SIMHASH_BITS) - 1)).count("1")
+
+
+def is_near_duplicate(simhash_a: Optional[int], simhash_b: Optional[int]) -> bool:
+    """Both descriptions have real content, and it is (nearly) the same."""
+    if simhash_a is None or simhash_b is None:
+        return False
+    return hamming_distance(simhash_a, simhash_b) <= SIMHASH_MAX_DISTANCE
+
+
+def location_signature(is_worldwide: Optional[bool], regions: Optional[Sequence[str]]) -> tuple:
+    """Comparable form of Job.location_is_worldwide / location_regions."""
+    if is_worldwide:
+        return ("*",)
+    return tuple(sorted(regions or ()))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+
+
+def posted_within_window(a: Optional[datetime], b: Optional[datetime]) -> bool:
+    if a is None or b is None:
+        return False
+    return abs(_as_utc(a) - _as_utc(b)) <= DEDUP_WINDOW
+
+
+def is_same_posting(a, b) -> bool:
+    """
+    `a` and `b` are same-bucket jobs as mappings of the Job columns
+    content_simhash, location_is_worldwide, location_regions and posted_at.
+    """
+    return (
+        is_near_duplicate(a["content_simhash"], b["content_simhash"])
+        and location_signature(a["location_is_worldwide"], a["location_regions"])
+        == location_signature(b["location_is_worldwide"], b["location_regions"])
+        and posted_within_window(a["posted_at"], b["posted_at"])
+    )
+
+
+def dedup_columns(title, company, description) -> dict:
+    """Column values for Job.dedup_key / Job.content_simhash."""
+    return {
+        "dedup_key": dedup_key(title, company),
+        "content_simhash": content_simhash(title, company, description),
+    }
@@ -0,0 +1,58 @@
+"""
+Per-facet counts for the active job search.
+
+All facets come from a single GROUP BY GROUPING SETS pass over the filtered
+set, so asking for them costs one aggregate scan rather than one COUNT per
+facet value. The per-source counts also add up to the exact total, which lets
+the listing skip its separate count query when facets are requested.
+"""
+from typing import Dict, Hashable, NamedTuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query
+
+from models import Job
+from services.jobs.ttl_cache import TTLCache
+
+FACET_CACHE_TTL_SECONDS = 60
+
+_facet_cache = TTLCache(ttl_seconds=FACET_CACHE_TTL_SECONDS, max_entries=1024)
+
+
+class FacetCounts(NamedTuple):
+    sources: Dict[str, int]
+    location_buckets: Dict[str, int]  # keyed by Job.location_remote_kind
+
+    @property
+    def total(self) -> int:
+        return sum(self.sources.values())
+
+
+def facet_counts(query: Query, cache_key: Hashable) -> FacetCounts:
+    cached = _facet_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    rows = (
+        query.order_by(None)
+        .with_entities(
+            Job.source,
+            Job.location_remote_kind,
+            func.grouping(Job.source).label("source_rolled_up"),
+            func.count().label("n"),
+        )
+        .group_by(func.grouping_sets(Job.source, Job.location_remote_kind))
+        .all()
+    )
+
+    sources: Dict[str, int] = {}
+    buckets: Dict[str, int] = {}
+    for source, remote_kind, source_rolled_up, n in rows:
+        if source_rolled_up:
+            buckets[remote_kind or "unknown"] = n
+        else:
+            sources[source or "unknown"] = n
+
+    result = FacetCounts(sources=sources, location_buckets=buckets)
+    _facet_cache.set(cache_key, result)
+    return result
@@ -0,0 +1,104 @@
+"""
+Shared cache for the /api/jobs/filters payload.
+
+The payload (distinct locations, sources, total job count) only changes when
+the scrapers ingest new jobs, yet it used to be recomputed with full-table
+DISTINCT scans on every portal page load. It now lives in Redis so the API
+processes share it and the scraping pipeline — which runs in a different
+process — can invalidate it right after committing new rows.
+
+If Redis is unreachable, a short-lived process-local copy is used instead.
+Each entry carries an ETag derived from the payload so browsers can
+revalidate with If-None-Match and get a bodiless 304.
+"""
+import hashlib
+import json
+import logging
+import time
+from typing import Optional
+
+import redis
+
+from config import settings
+from services.jobs.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+FILTERS_CACHE_KEY = "jobs:filters:v1"
+# Safety net only — ingest invalidates explicitly.
+FILTERS_CACHE_TTL_SECONDS = 6 * 60 * 60
+# Without Redis there is no cross-process invalidation, so keep this short.
+LOCAL_FALLBACK_TTL_SECONDS = 60
+# After a connection failure, don't retry Redis on every request.
+REDIS_RETRY_AFTER_SECONDS = 30
+
+_local_cache = TTLCache(ttl_seconds=LOCAL_FALLBACK_TTL_SECONDS, max_entries=1)
+_redis_client = None
+_redis_down_until = 0.0
+
+
+def _redis() -> Optional[redis.Redis]:
+    global _redis_client
+    if time.monotonic() < _redis_down_until:
+        return None
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5
+        )
+    return _redis_client
+
+
+def _mark_redis_down(e: Exception) -> None:
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_RETRY_AFTER_SECONDS
+    logger.warning(f"Filters cache: Redis unavailable, using local fallback: {e}")
+
+
+def make_etag(payload: dict) -> str:
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return '"' + hashlib.sha1(body).hexdigest()[:20] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 7232 weak comparison against an If-None-Match header value."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or any(c.removeprefix("W/") == etag for c in candidates)
+
+
+def load_filters() -> Optional[dict]:
+    """Returns {"etag": ..., "payload": ...} or None on a miss."""
+    client = _redis()
+    if client is not None:
+        try:
+            raw = client.get(FILTERS_CACHE_KEY)
+            return json.loads(raw) if raw else None
+        except redis.RedisError as e:
+            _mark_redis_down(e)
+    return _local_cache.get(FILTERS_CACHE_KEY)
+
+
+def store_filters(payload: dict) -> dict:
+    entry = {"etag": make_etag(payload), "payload": payload}
+    client = _redis()
+    if client is not None:
+        try:
+            client.set(FILTERS_CACHE_KEY, json.dumps(entry), ex=FILTERS_CACHE_TTL_SECONDS)
+            return entry
+        except redis.RedisError as e:
+            _mark_redis_down(e)
+    _local_cache.set(FILTERS_CACHE_KEY, entry)
+    return entry
+
+
+def invalidate_filters_cache() -> None:
+    """Called by the ingest pipeline after new jobs are committed."""
+    _local_cache.clear()
+    client = _redis()
+    if client is None:
+        return
+    try:
+        client.delete(FILTERS_CACHE_KEY)
+    except redis.RedisError as e:
+        _mark_redis_down(e)
@@ -0,0 +1,112 @@
+"""
+Normalized location classification for jobs.
+
+Job.location is free text ("Remote - US", "Berlin, Germany", "Anywhere").
+Instead of re-deriving its meaning with a dozen ILIKE predicates on every
+listing request, each job is classified once at ingest time into:
+
+  - location_is_worldwide  — available from any country (same rule the
+                             listing filter has always used, see below)
+  - location_remote_kind   — worldwide / remote / remote_restricted /
+                             onsite / unspecified
+  - location_regions       — normalized location tokens, with a few
+                             country aliases folded together ("USA",
+                             "United States", "U.S." → "usa")
+
+Listing filters then become an indexed boolean check plus a GIN-indexed
+array overlap.
+"""
+import re
+from typing import List, NamedTuple, Optional
+
+# Terms that mean "available from ANYWHERE in the world" — no country restriction
+# NOTE: "remote" is intentionally excluded because "Remote - US", "Remote: Spain"
+# etc. are country-restricted remote jobs. Only include purely global terms.
+WORLDWIDE_TERMS = [
+    "worldwide", "anywhere", "global", "international", "distributed"
+]
+
+# "Remote" followed by one of these is country-restricted ("Remote - US")
+RESTRICTION_SEPARATORS = [" - ", ", ", "/", ":"]
+
+REMOTE_KIND_WORLDWIDE = "worldwide"
+REMOTE_KIND_REMOTE = "remote"
+REMOTE_KIND_RESTRICTED = "remote_restricted"
+REMOTE_KIND_ONSITE = "onsite"
+REMOTE_KIND_UNSPECIFIED = "unspecified"
+
+# Multi-word and dotted spellings are folded before tokenizing, longest first.
+REGION_ALIASES = {
+    "united states of america": "usa",
+    "united states": "usa",
+    "u.s.a.": "usa",
+    "u.s.": "usa",
+    "us": "usa",
+    "united kingdom": "uk",
+    "great britain": "uk",
+    "gb": "uk",
+    "united arab emirates": "uae",
+    "european union": "eu",
+}
+
+_ALIAS_PATTERN = re.compile(
+    r"(?<![\w.])(" + "|".join(
+        re.escape(alias) for alias in sorted(REGION_ALIASES, key=len, reverse=True)
+    ) + r")(?![\w])"
+)
+_TOKEN_SPLIT = re.compile(r"[^\w]+")
+
+
+class LocationClass(NamedTuple):
+    is_worldwide: bool
+    remote_kind: str
+    regions: List[str]
+
+
+def is_worldwide_term(location: str) -> bool:
+    """Returns True if the location query itself means worldwide/remote."""
+    loc_lower = location.lower()
+    return any(wt in loc_lower for wt in WORLDWIDE_TERMS)
+
+
+def location_tokens(location: Optional[str]) -> List[str]:
+    """
+    Normalized, de-duplicated tokens for a location string. Used on both the
+    stored side (Job.location_regions) and the query side so they line up.
+    """
+    if not location:
+        return []
+    text = _ALIAS_PATTERN.sub(lambda m: REGION_ALIASES[m.group(1)], location.lower())
+    tokens = {t for t in _TOKEN_SPLIT.split(text) if len(t) > 1}
+    return sorted(tokens)
+
+
+def classify_location(location: Optional[str]) -> LocationClass:
+    """
+    Classifies a raw Job.location. A job counts as worldwide when:
+      - its location is NULL/empty (scrapers often omit it for global roles)
+      - it contains one of WORLDWIDE_TERMS
+      - it contains "remote" with no country suffix separator
+        ("Remote" yes; "Remote - US", "Remote, USA", "Remote: Spain" no)
+    """
+    if location is None or location == "":
+        return LocationClass(True, REMOTE_KIND_UNSPECIFIED, [])
+
+    regions = location_tokens(location)
+    if is_worldwide_term(location):
+        return LocationClass(True, REMOTE_KIND_WORLDWIDE, regions)
+    if "remote" in location.lower():
+        if any(sep in location for sep in RESTRICTION_SEPARATORS):
+            return LocationClass(False, REMOTE_KIND_RESTRICTED, regions)
+        return LocationClass(True, REMOTE_KIND_REMOTE, regions)
+    return LocationClass(False, REMOTE_KIND_ONSITE, regions)
+
+
+def location_columns(location: Optional[str]) -> dict:
+    """Job column values for `location`, ready for an INSERT ... VALUES."""
+    cls = classify_location(location)
+    return {
+        "location_is_worldwide": cls.is_worldwide,
+        "location_remote_kind": cls.remote_kind,
+        "location_regions": cls.regions,
+    }
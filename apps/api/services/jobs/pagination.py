@@ -0,0 +1,85 @@
+"""
+Keyset (cursor) pagination for job listings.
+
+Listings are ordered newest-first by (posted_at DESC NULLS LAST, id DESC), the
+exact shape of the ix_jobs_posted_at_id index. Instead of OFFSET — which makes
+Postgres walk and discard every earlier row — a cursor remembers the sort key
+of the last row served and the next page starts strictly after it. Deep pages
+cost the same as the first one, and rows inserted by the scrapers mid-browse
+no longer shift results between pages.
+"""
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+from models import Job
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client-supplied cursor can't be decoded."""
+
+
+@dataclass(frozen=True)
+class JobCursor:
+    posted_at: Optional[datetime]
+    id: int
+
+
+# Newest first; rows without a posted_at sink to the end.
+JOB_LISTING_ORDER = (Job.posted_at.desc().nulls_last(), Job.id.desc())
+
+
+def encode_cursor(job: Job) -> str:
+    """Opaque, URL-safe token pointing just past `job` in listing order."""
+    payload = {
+        "p": job.posted_at.isoformat() if job.posted_at else None,
+        "i": job.id,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> JobCursor:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        posted_at = datetime.fromisoformat(payload["p"]) if payload["p"] else None
+        return JobCursor(posted_at=posted_at, id=int(payload["i"]))
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}")
+
+
+def fetch_page_after(query: Query, cursor: Optional[str], limit: int) -> Tuple[List[Job], Optional[str]]:
+    """
+    Returns up to `limit` jobs from `query` that follow `cursor` (or the first
+    page when cursor is None), plus the cursor for the page after that —
+    None once the listing is exhausted.
+
+    Dated rows are served first through a row-value comparison the composite
+    index can seek to directly. Undated rows (rare; scrapers always stamp
+    posted_at) are only queried once the dated part has run out.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    rows: List[Job] = []
+
+    if after is None or after.posted_at is not None:
+        dated = query.filter(Job.posted_at.isnot(None))
+        if after is not None:
+            dated = dated.filter(tuple_(Job.posted_at, Job.id) < tuple_(after.posted_at, after.id))
+        rows = dated.order_by(*JOB_LISTING_ORDER).limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        undated = query.filter(Job.posted_at.is_(None))
+        if after is not None and after.posted_at is None:
+            undated = undated.filter(Job.id < after.id)
+        rows += undated.order_by(Job.id.desc()).limit(limit + 1 - len(rows)).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1]) if has_more and rows else None
+    return rows, next_cursor
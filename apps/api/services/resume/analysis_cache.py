@@ -0,0 +1,90 @@
+"""
+Persistent cache of LLM resume analyses keyed by (model, prompt version,
+hash of normalized text).
+
+Users re-upload the same file, or a revision that differs only in spacing,
+and each upload used to cost a full GPT-4 completion. A hit here returns the
+stored structured_data from one indexed SELECT. Bump the analyst's
+PROMPT_VERSION whenever the prompt or the ResumeData schema changes so old
+entries stop matching.
+
+Entries expire `ttl_days` after they were written, and once the table grows
+past `max_entries` the least recently used rows are evicted (checked every
+100 writes, together with the expired ones; see db_cache.py).
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from config import settings
+from database import SessionLocal
+from models import AnalysisCacheEntry
+from services.resume.db_cache import DbLruCache
+
+
+class AnalysisCache(DbLruCache):
+    entry_model = AnalysisCacheEntry
+    name = "Analysis cache"
+    eviction_check_interval = 100
+
+    def __init__(self, max_entries: int = None, ttl_days: int = None, session_factory=SessionLocal):
+        super().__init__(
+            settings.ANALYSIS_CACHE_MAX_ENTRIES if max_entries is None else max_entries,
+            session_factory,
+        )
+        self.ttl = timedelta(days=settings.ANALYSIS_CACHE_TTL_DAYS if ttl_days is None else ttl_days)
+
+    def _key(self, model: str, prompt_version: str, text_hash: str):
+        return (
+            AnalysisCacheEntry.model == model,
+            AnalysisCacheEntry.prompt_version == prompt_version,
+            AnalysisCacheEntry.text_hash == text_hash,
+        )
+
+    def get(self, model: str, prompt_version: str, text_hash: str) -> Optional[dict]:
+        """The cached structured_data, or None on a miss (or an expired entry)."""
+        found = None
+        try:
+            with self.session_factory() as db:
+                found = db.scalar(
+                    select(AnalysisCacheEntry.structured_data).where(
+                        *self._key(model, prompt_version, text_hash),
+                        AnalysisCacheEntry.created_at > datetime.now(timezone.utc) - self.ttl,
+                    )
+                )
+                if found is not None:
+                    db.execute(
+                        update(AnalysisCacheEntry)
+                        .where(*self._key(model, prompt_version, text_hash))
+                        .values(last_used_at=func.now())
+                    )
+                    db.commit()
+        except Exception as e:
+            self.logger.warning(f"Analysis cache lookup failed, treating as miss: {e}")
+        self._record_lookups(int(found is not None), int(found is None))
+        return found
+
+    def put(self, model: str, prompt_version: str, text_hash: str, structured_data: dict) -> None:
+        try:
+            with self.session_factory() as db:
+                stmt = pg_insert(AnalysisCacheEntry).values(
+                    model=model, prompt_version=prompt_version, text_hash=text_hash,
+                    structured_data=structured_data,
+                ).on_conflict_do_update(
+                    index_elements=["model", "prompt_version", "text_hash"],
+                    set_={"structured_data": structured_data, "created_at": func.now(), "last_used_at": func.now()},
+                )
+                db.execute(stmt)
+                db.commit()
+                self._record_writes(db, 1)
+        except Exception as e:
+            self.logger.warning(f"Analysis cache write failed: {e}")
+
+    def _expire(self, db) -> int:
+        expired = db.execute(
+            delete(AnalysisCacheEntry).where(AnalysisCacheEntry.created_at <= datetime.now(timezone.utc) - self.ttl)
+        ).rowcount
+        db.commit()
+        return expired
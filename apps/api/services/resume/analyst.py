@@ -4,9 +4,16 @@ from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
 from config import settings
+from services.resume.analysis_cache import AnalysisCache
+from services.resume.content_hash import content_hash
+import asyncio
 import logging
 import json
 
+ANALYSIS_MODEL = "gpt-4-turbo-preview"
+# Part of the analysis cache key: bump when the prompt or ResumeData changes
+PROMPT_VERSION = "resume-data-v1"
+
 # --- Data Models ---
 class WorkExperience(BaseModel):
     title: str = Field(description="Job title")
@@ -28,22 +35,41 @@ class ResumeData(BaseModel):
     education: List[Education] = Field(description="List of educational background")
     summary: Optional[str] = Field(description="Brief professional summary")
 
+class AnalysisUnavailableError(Exception):
+    """No real analysis (LLM missing or failed) and the caller refused the mock fallback."""
+
 # --- Service ---
 class ResumeAnalyst:
-    def __init__(self):
+    def __init__(self, cache: Optional[AnalysisCache] = None):
         self.logger = logging.getLogger(__name__)
         if settings.OPENAI_API_KEY:
-            self.llm = ChatOpenAI(model="gpt-4-turbo-preview", temperature=0, openai_api_key=settings.OPENAI_API_KEY)
+            self.llm = ChatOpenAI(model=ANALYSIS_MODEL, temperature=0, openai_api_key=settings.OPENAI_API_KEY)
         else:
             self.llm = None
+        if cache is None and settings.ANALYSIS_CACHE_MAX_ENTRIES > 0:
+            cache = AnalysisCache()
+        self.cache = cache
             
-    async def analyze(self, text: str) -> dict:
+    async def analyze(self, text: str, fallback: bool = True) -> dict:
         """
         Analyzes resume text and returns structured data.
+        Results are cached by (model, PROMPT_VERSION, normalized text hash), so
+        re-uploads of the same resume skip the completion. Mock/fallback data
+        is never cached. With fallback=False, raises AnalysisUnavailableError
+        instead of returning mock data.
         """
         if not self.llm:
+            if not fallback:
+                raise AnalysisUnavailableError("OPENAI_API_KEY missing")
             self.logger.warning("OPENAI_API_KEY missing. Returning mock structured data.")
             return self._get_mock_data()
+
+        text_hash = content_hash(text)
+        if self.cache:
+            cached = await asyncio.to_thread(self.cache.get, ANALYSIS_MODEL, PROMPT_VERSION, text_hash)
+            if cached is not None:
+                self.logger.info("Resume analysis served from cache.")
+                return cached
             
         try:
             parser = PydanticOutputParser(pydantic_object=ResumeData)
@@ -55,15 +81,20 @@ class ResumeAnalyst:
             
             chain = prompt | self.llm | parser
             
-            result = chain.invoke({
+            result = await chain.ainvoke({
                 "format_instructions": parser.get_format_instructions(),
                 "text": text
             })
             
-            return result.model_dump()
+            structured_data = result.model_dump()
+            if self.cache:
+                await asyncio.to_thread(self.cache.put, ANALYSIS_MODEL, PROMPT_VERSION, text_hash, structured_data)
+            return structured_data
             
         except Exception as e:
             self.logger.error(f"Error analyzing resume: {e}")
+            if not fallback:
+                raise AnalysisUnavailableError(f"Resume analysis failed: {e}") from e
             return self._get_mock_data() # Fallback
 
     def _get_mock_data(self) -> dict:
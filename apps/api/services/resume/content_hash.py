@@ -0,0 +1,11 @@
+import hashlib
+
+
+def normalize_text(text: str) -> str:
+    """Collapses all whitespace runs (incl. newlines) so cosmetic edits hash the same."""
+    return " ".join(text.split())
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest of the normalized text."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
@@ -0,0 +1,73 @@
+"""
+Shared plumbing for the Postgres-backed caches (embedding_cache.py,
+analysis_cache.py): hit/miss counters and least-recently-used eviction.
+
+Entries carry a last_used_at column that reads refresh. Writes are counted,
+and every `eviction_check_interval` written rows the table is trimmed back
+to `max_entries`: expired rows first (for caches with a TTL), then exactly
+the overflow, oldest last_used_at first with the primary key breaking ties.
+"""
+import logging
+import threading
+
+from sqlalchemy import delete, func, select, tuple_
+
+
+class DbLruCache:
+    entry_model = None  # mapped class with a last_used_at column
+    name = "Cache"  # for log lines
+    eviction_check_interval = 500
+
+    def __init__(self, max_entries: int, session_factory):
+        self.logger = logging.getLogger(type(self).__module__)
+        self.max_entries = max_entries
+        self.session_factory = session_factory
+        self.hits = 0
+        self.misses = 0
+        self._writes_since_check = 0
+        self._lock = threading.Lock()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+    def _record_lookups(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def _record_writes(self, db, count: int) -> None:
+        """Counts `count` written rows and evicts on `db` once a check is due."""
+        with self._lock:
+            self._writes_since_check += count
+            due = self._writes_since_check >= self.eviction_check_interval
+            if due:
+                self._writes_since_check = 0
+        if due:
+            self._evict(db)
+
+    def _expire(self, db) -> int:
+        """Deletes expired entries; returns how many. No TTL by default."""
+        return 0
+
+    def _evict(self, db) -> None:
+        """Drops expired entries, then trims back to max_entries, least recently used first."""
+        expired = self._expire(db)
+        model = self.entry_model
+        size = db.scalar(select(func.count()).select_from(model))
+        overflow = size - self.max_entries
+        if overflow > 0:
+            # Exactly `overflow` keys: one write stamps a whole batch with the
+            # same now(), so a last_used_at cutoff would take all of its ties
+            key_columns = list(model.__table__.primary_key.columns)
+            oldest = select(*key_columns).order_by(model.last_used_at, *key_columns).limit(overflow)
+            db.execute(delete(model).where(tuple_(*key_columns).in_(oldest)))
+            db.commit()
+        if expired or overflow > 0:
+            self.logger.info(
+                f"{self.name} eviction: {expired} expired, {max(overflow, 0)} over the {self.max_entries} cap"
+            )
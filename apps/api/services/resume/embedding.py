@@ -1,38 +1,202 @@
-from typing import List
-from langchain_openai import OpenAIEmbeddings
+import asyncio
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from config import settings
+from services.resume.content_hash import content_hash, normalize_text
+from services.resume.embedding_backends import (
+    EmbeddingBackend, HashingEmbeddingBackend, OpenAIEmbeddingBackend
+)
+from services.resume.embedding_cache import EmbeddingCache
 import logging
+import random
+import time
+
+import openai
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# OpenAI limits: 8191 tokens per input, 2048 inputs and 300k tokens per request.
+# The per-request token budget is kept well under the hard cap.
+MAX_TOKENS_PER_INPUT = 8191
+MAX_INPUTS_PER_REQUEST = 2048
+DEFAULT_TOKEN_BUDGET = 100_000
+DEFAULT_MAX_CONCURRENCY = 4
+MAX_ATTEMPTS = 3
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken missing or encoding files unavailable offline
+    _encoding = None
+
+
+def _truncate_and_count(text: str) -> tuple[str, int]:
+    """Clips `text` to the per-input token limit; returns (text, token_count)."""
+    if _encoding is not None:
+        tokens = _encoding.encode(text, disallowed_special=())
+        if len(tokens) > MAX_TOKENS_PER_INPUT:
+            tokens = tokens[:MAX_TOKENS_PER_INPUT]
+            text = _encoding.decode(tokens)
+        return text, len(tokens)
+    # Rough fallback: ~3 chars per token errs on the safe side for English
+    text = text[:MAX_TOKENS_PER_INPUT * 3]
+    return text, len(text) // 3 + 1
+
 
 class EmbeddingService:
-    def __init__(self):
+    def __init__(self, cache: Optional[EmbeddingCache] = None, backend: Optional[EmbeddingBackend] = None):
         self.logger = logging.getLogger(__name__)
-        # LangChain's OpenAIEmbeddings handles the OPENAI_API_KEY from env or passed arg.
-        # We target the new efficient model: text-embedding-3-small
-        if not settings.OPENAI_API_KEY:
-            self.logger.warning("OPENAI_API_KEY not set. Using mock embeddings.")
-            self.embeddings = None
-        else:
-            self.embeddings = OpenAIEmbeddings(
-                model="text-embedding-3-small",
-                openai_api_key=settings.OPENAI_API_KEY
-            )
-
-    def generate_embedding(self, text: str) -> List[float]:
-        """
-        Generates a vector embedding for the given text using OpenAI.
-        Falls back to mock if API key is missing.
-        """
-        if self.embeddings:
+        self.local_backend = HashingEmbeddingBackend()
+        self.backend = backend or self._default_backend()
+        self.model_name = self.backend.name
+        if cache is None and settings.EMBEDDING_CACHE_MAX_ENTRIES > 0:
+            cache = EmbeddingCache()
+        self.cache = cache
+
+    def _default_backend(self) -> EmbeddingBackend:
+        """
+        EMBEDDING_BACKEND picks the backend: "openai", "local", or "auto"
+        (OpenAI text-embedding-3-small when OPENAI_API_KEY is set, otherwise
+        the deterministic local backend).
+        """
+        choice = settings.EMBEDDING_BACKEND.lower()
+        if choice == "openai" or (choice == "auto" and settings.OPENAI_API_KEY):
+            return OpenAIEmbeddingBackend(api_key=settings.OPENAI_API_KEY, model=EMBEDDING_MODEL)
+        if choice == "auto":
+            self.logger.warning("OPENAI_API_KEY not set. Using local hashing embeddings.")
+        return self.local_backend
+
+    def generate_embedding(self, text: str) -> Optional[List[float]]:
+        """
+        Generates a vector embedding for the given text with the configured
+        backend, or None if it could not be embedded. There is deliberately
+        no fallback to another backend: its vectors live in a different
+        space and would be ranked against this one's by matching.
+        """
+        vector = self.generate_embeddings([text])[0]
+        if vector is None:
+            self.logger.error("Error generating embedding; leaving it unset.")
+        return vector
+
+    async def agenerate_embedding(self, text: str) -> Optional[List[float]]:
+        """
+        Async generate_embedding for request handlers: the backend call is
+        awaited natively and cache lookups run in a thread, so the event loop
+        is never blocked. Same cache and retry behaviour; None on failure.
+        """
+        normalized = normalize_text(text)
+        h = content_hash(normalized)
+        if self.cache:
+            cached = await asyncio.to_thread(self.cache.get_many, self.model_name, [h])
+            if h in cached:
+                return cached[h]
+
+        clean_text, _ = _truncate_and_count(normalized or " ")
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                vector = (await self.backend.aembed_documents([clean_text]))[0]
+                break
+            except openai.BadRequestError as e:
+                self.logger.error(f"Embedding input rejected: {e}")
+            except Exception as e:
+                if attempt < MAX_ATTEMPTS:
+                    delay = 2 ** attempt + random.uniform(0, 1)
+                    self.logger.warning(f"Embedding failed ({e}); retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+                self.logger.error(f"Embedding failed after {attempt} attempts: {e}")
+            self.logger.error("Error generating embedding; leaving it unset.")
+            return None
+
+        if self.cache:
+            await asyncio.to_thread(self.cache.put_many, self.model_name, [(h, vector)])
+        return vector
+
+    def generate_embeddings(
+        self,
+        texts: List[str],
+        token_budget: int = DEFAULT_TOKEN_BUDGET,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Optional[List[float]]]:
+        """
+        Embeds many texts. Input is split into request-sized chunks by token
+        budget, chunks are sent concurrently (at most `max_concurrency` in
+        flight), and results come back in input order.
+
+        A failing chunk is retried on its own with backoff; a chunk the API
+        rejects as invalid is bisected to isolate the offending input. An
+        entry is None if it could not be embedded, so bulk callers can leave
+        it for a later run instead of storing a stand-in vector.
+
+        Texts already in the content-hash cache (same model, same normalized
+        text) are served from it and never sent; duplicates within one call
+        are sent once.
+        """
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        if not texts:
+            return results
+
+        # remove newlines/whitespace runs to reduce token usage/noise
+        normalized = [normalize_text(text) for text in texts]
+        hashes = [content_hash(text) for text in normalized]
+        cached = self.cache.get_many(self.model_name, hashes) if self.cache else {}
+
+        # First occurrence of each uncached hash goes to the API
+        pending: dict[str, int] = {}
+        for i, h in enumerate(hashes):
+            if h not in cached and h not in pending:
+                pending[h] = i
+        fresh: dict[str, Optional[List[float]]] = {}
+        if pending:
+            miss_hashes = list(pending)
+            miss_texts = [normalized[pending[h]] for h in miss_hashes]
+            chunks = self._chunk(miss_texts, token_budget)
+            workers = max(1, min(max_concurrency, len(chunks)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="embed") as pool:
+                futures = [(indices, pool.submit(self._embed_chunk, batch)) for indices, batch in chunks]
+                for indices, future in futures:
+                    for index, vector in zip(indices, future.result()):
+                        fresh[miss_hashes[index]] = vector
+            if self.cache:
+                self.cache.put_many(self.model_name, list(fresh.items()))
+
+        for i, h in enumerate(hashes):
+            results[i] = cached.get(h) or fresh.get(h)
+        return results
+
+    def _chunk(self, texts: List[str], token_budget: int) -> List[tuple[List[int], List[str]]]:
+        """Groups inputs into (original indices, clipped texts) per API request."""
+        chunks = []
+        indices: List[int] = []
+        batch: List[str] = []
+        batch_tokens = 0
+        for i, text in enumerate(texts):
+            clean_text, n_tokens = _truncate_and_count(text or " ")
+            if batch and (batch_tokens + n_tokens > token_budget or len(batch) >= MAX_INPUTS_PER_REQUEST):
+                chunks.append((indices, batch))
+                indices, batch, batch_tokens = [], [], 0
+            indices.append(i)
+            batch.append(clean_text)
+            batch_tokens += n_tokens
+        if batch:
+            chunks.append((indices, batch))
+        return chunks
+
+    def _embed_chunk(self, batch: List[str]) -> List[Optional[List[float]]]:
+        for attempt in range(1, MAX_ATTEMPTS + 1):
             try:
-                # remove newlines to reduce token usage/noise
-                clean_text = text.replace("\n", " ")
-                return self.embeddings.embed_query(clean_text)
+                return self.backend.embed_documents(batch)
+            except openai.BadRequestError as e:
+                if len(batch) == 1:
+                    self.logger.error(f"Embedding input rejected: {e}")
+                    return [None]
+                # One bad input shouldn't sink its neighbours — split and retry halves
+                mid = len(batch) // 2
+                return self._embed_chunk(batch[:mid]) + self._embed_chunk(batch[mid:])
             except Exception as e:
-                self.logger.error(f"Error generating embedding: {e}. Falling back to mock.")
-                # Fallback to mock behavior
-                import random
-                return [random.uniform(-1.0, 1.0) for _ in range(1536)]
-        
-        # Mock Fallback (for testing without costs)
-        import random
-        return [random.uniform(-1.0, 1.0) for _ in range(1536)]
+                if attempt == MAX_ATTEMPTS:
+                    self.logger.error(f"Embedding chunk of {len(batch)} failed after {attempt} attempts: {e}")
+                    return [None] * len(batch)
+                delay = 2 ** attempt + random.uniform(0, 1)
+                self.logger.warning(f"Embedding chunk of {len(batch)} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
@@ -0,0 +1,87 @@
+"""
+Embedding backends behind EmbeddingService.
+
+Every backend produces EMBEDDING_DIMENSIONS-d vectors so its output fits the
+Vector(1536) columns on Job and Resume. Vectors from different backends live
+in different spaces, though — don't mix them in one table without
+re-embedding (the cache keys entries by backend name for that reason).
+"""
+import asyncio
+import re
+import zlib
+from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
+from langchain_openai import OpenAIEmbeddings
+
+EMBEDDING_DIMENSIONS = 1536
+
+
+class EmbeddingBackend(ABC):
+    """Interface: a stable `name` plus batched document embedding."""
+    name: str = ""
+    dimensions: int = EMBEDDING_DIMENSIONS
+
+    @abstractmethod
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """One EMBEDDING_DIMENSIONS-d vector per text, in order."""
+        pass
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Async variant; backends without a native one run embed_documents in a thread."""
+        return await asyncio.to_thread(self.embed_documents, texts)
+
+
+class OpenAIEmbeddingBackend(EmbeddingBackend):
+    def __init__(self, api_key: str, model: str = "text-embedding-3-small"):
+        self.name = model
+        self.client = OpenAIEmbeddings(model=model, openai_api_key=api_key)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.client.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.client.aembed_documents(texts)
+
+
+class HashingEmbeddingBackend(EmbeddingBackend):
+    """
+    Deterministic, offline embedding: a signed hashing-trick projection of
+    word unigrams and bigrams (sublinear term frequency), L2-normalised.
+
+    It has no notion of synonyms, but texts sharing vocabulary land close
+    together under cosine distance — enough for matching to return sensible
+    results in load tests and air-gapped runs, at CPU speed with no API
+    calls. CRC32 is used as the hash so vectors are identical across
+    processes and runs (Python's hash() is salted per process).
+    """
+    name = "local-hashing-v1"
+    _token_pattern = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            features = self._features(text)
+            if not features:
+                continue
+            hashes = np.fromiter(
+                (zlib.crc32(f.encode("utf-8")) for f in features),
+                dtype=np.uint32, count=len(features)
+            )
+            indices = (hashes % self.dimensions).astype(np.intp)
+            # Top hash bit picks the sign so collisions tend to cancel out
+            signs = np.where(hashes & 0x80000000, -1.0, 1.0).astype(np.float32)
+            np.add.at(matrix[row], indices, signs)
+
+        # Sublinear tf: 1 + log|x| keeps the sign and damps repeated terms
+        nonzero = matrix != 0
+        matrix[nonzero] = np.sign(matrix[nonzero]) * (1.0 + np.log(np.abs(matrix[nonzero])))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+        return matrix.tolist()
+
+    def _features(self, text: str) -> List[str]:
+        tokens = self._token_pattern.findall(text.lower())
+        bigrams = [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        return tokens + bigrams
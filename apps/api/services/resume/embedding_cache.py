@@ -0,0 +1,86 @@
+"""
+Persistent embedding cache keyed by (model name, hash of normalized text).
+
+Re-uploaded resumes, jobs re-posted under a new URL with the same description
+and retried batches all embed text we have embedded before. Looking the
+vector up here costs one indexed SELECT instead of an API round trip (and
+money). Entries live in the embedding_cache table so every API and worker
+process shares them; once the table grows past `max_entries` the least
+recently used rows are evicted.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from config import settings
+from database import SessionLocal
+from models import EmbeddingCacheEntry
+from services.resume.db_cache import DbLruCache
+
+
+class EmbeddingCache(DbLruCache):
+    entry_model = EmbeddingCacheEntry
+    name = "Embedding cache"
+    # Check the size bound every N inserted rows rather than on every write
+    eviction_check_interval = 500
+
+    def __init__(self, max_entries: int = None, session_factory=SessionLocal):
+        super().__init__(
+            settings.EMBEDDING_CACHE_MAX_ENTRIES if max_entries is None else max_entries,
+            session_factory,
+        )
+
+    def get_many(self, model: str, hashes: Sequence[str]) -> Dict[str, List[float]]:
+        """Returns {text_hash: vector} for the hashes present in the cache."""
+        unique = list(set(hashes))
+        if not unique:
+            return {}
+        found: Dict[str, List[float]] = {}
+        try:
+            with self.session_factory() as db:
+                rows = db.execute(
+                    select(EmbeddingCacheEntry.text_hash, EmbeddingCacheEntry.embedding).where(
+                        EmbeddingCacheEntry.model == model,
+                        EmbeddingCacheEntry.text_hash.in_(unique),
+                    )
+                ).all()
+                found = {h: _as_list(v) for h, v in rows}
+                if found:
+                    db.execute(
+                        update(EmbeddingCacheEntry)
+                        .where(
+                            EmbeddingCacheEntry.model == model,
+                            EmbeddingCacheEntry.text_hash.in_(list(found)),
+                        )
+                        .values(last_used_at=func.now())
+                    )
+                    db.commit()
+        except Exception as e:
+            self.logger.warning(f"Embedding cache lookup failed, treating as miss: {e}")
+        hit_count = sum(1 for h in hashes if h in found)
+        self._record_lookups(hit_count, len(hashes) - hit_count)
+        return found
+
+    def put_many(self, model: str, entries: Sequence[Tuple[str, List[float]]]) -> None:
+        rows = {h: vector for h, vector in entries if vector is not None}
+        if not rows:
+            return
+        try:
+            with self.session_factory() as db:
+                stmt = pg_insert(EmbeddingCacheEntry).values(
+                    [{"model": model, "text_hash": h, "embedding": v} for h, v in rows.items()]
+                ).on_conflict_do_update(
+                    index_elements=["model", "text_hash"],
+                    set_={"last_used_at": func.now()},
+                )
+                db.execute(stmt)
+                db.commit()
+                self._record_writes(db, len(rows))
+        except Exception as e:
+            self.logger.warning(f"Embedding cache write failed: {e}")
+
+
+def _as_list(vector) -> Optional[List[float]]:
+    # pgvector hands back numpy arrays; callers and JSON want plain lists
+    return vector.tolist() if hasattr(vector, "tolist") else list(vector)
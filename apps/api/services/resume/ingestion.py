@@ -0,0 +1,43 @@
+"""
+Resume ingestion steps shared by the synchronous upload endpoint and the
+background Celery task (tasks/resume_tasks.py): text → structured data +
+embedding.
+"""
+import asyncio
+from typing import List, Optional, Tuple
+
+from services.resume.analyst import ResumeAnalyst
+from services.resume.embedding import EmbeddingService
+
+MIN_TEXT_CHARS = 50
+EMPTY_TEXT_MESSAGE = (
+    "Could not extract meaningful text from the file. "
+    "Please check the file is not empty or image-only."
+)
+
+
+class EmbeddingUnavailableError(Exception):
+    """The embedding backend failed and the caller asked for strict ingestion."""
+
+
+def has_meaningful_text(text: str) -> bool:
+    return bool(text) and len(text.strip()) >= MIN_TEXT_CHARS
+
+
+async def analyze_and_embed(
+    analyst: ResumeAnalyst, embedding_service: EmbeddingService, text: str, strict: bool = False
+) -> Tuple[dict, Optional[List[float]]]:
+    """
+    Structured data (LLM) and embedding — independent calls, run
+    concurrently. By default the analysis may be the analyst's mock data and
+    the embedding None if the backend failed; with strict=True either of
+    those raises (AnalysisUnavailableError / EmbeddingUnavailableError)
+    instead, so callers that can retry don't finalize a degraded result.
+    """
+    structured_data, vector = await asyncio.gather(
+        analyst.analyze(text, fallback=not strict),
+        embedding_service.agenerate_embedding(text),
+    )
+    if strict and vector is None:
+        raise EmbeddingUnavailableError("Embedding backend failed")
+    return structured_data, vector
@@ -1,12 +1,21 @@
 import io
 from io import BytesIO
-from pdfminer.high_level import extract_text
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LTTextContainer
+
+# Limits on how much of a document is read. A resume is a few pages; past
+# these, extra pages only cost CPU (scanned or crafted files).
+MAX_PDF_PAGES = 20
+MAX_TEXT_CHARS = 50_000
 
 
 class ResumeParser:
     """
     Extracts plain text from resume files.
     Supported formats: PDF, DOCX, DOC, TXT, RTF
+
+    Runs in-process; request handlers go through ParsingService
+    (services/resume/parsing_service.py) for a process pool and timeouts.
     """
 
     def extract_text(self, file_content: bytes, filename: str) -> str:
@@ -34,9 +43,23 @@ class ResumeParser:
     # ── Individual parsers ────────────────────────────────────────────────────
 
     def _from_pdf(self, content: bytes) -> str:
+        """
+        Page by page via extract_pages (what extract_text does internally),
+        reading at most MAX_PDF_PAGES and stopping once MAX_TEXT_CHARS of
+        text have been collected.
+        """
         try:
-            text = extract_text(BytesIO(content))
-            return text.strip()
+            parts = []
+            collected = 0
+            for page_layout in extract_pages(BytesIO(content), maxpages=MAX_PDF_PAGES):
+                for element in page_layout:
+                    if isinstance(element, LTTextContainer):
+                        text = element.get_text()
+                        parts.append(text)
+                        collected += len(text)
+                if collected >= MAX_TEXT_CHARS:
+                    break
+            return "".join(parts).strip()[:MAX_TEXT_CHARS]
         except Exception as e:
             raise ValueError(f"Failed to parse PDF: {e}")
 
@@ -45,9 +68,13 @@ class ResumeParser:
             import docx  # python-docx
             doc = docx.Document(BytesIO(content))
             parts = []
+            collected = 0
             for para in doc.paragraphs:
                 if para.text.strip():
                     parts.append(para.text)
+                    collected += len(para.text)
+                    if collected >= MAX_TEXT_CHARS:
+                        break
             # Also extract tables
             for table in doc.tables:
                 for row in table.rows:
@@ -56,7 +83,7 @@ class ResumeParser:
                     )
                     if row_text:
                         parts.append(row_text)
-            return "\n".join(parts).strip()
+            return "\n".join(parts).strip()[:MAX_TEXT_CHARS]
         except ImportError:
             raise ValueError("python-docx not installed. Run: pip install python-docx")
         except Exception as e:
@@ -99,3 +126,4 @@ class ResumeParser:
     def extract_text_from_pdf(self, file_content: bytes) -> str:
         """Kept for backwards compatibility."""
         return self._from_pdf(file_content)
+
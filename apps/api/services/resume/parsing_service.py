@@ -0,0 +1,171 @@
+"""
+Resume parsing service: ResumeParser in a bounded process pool.
+
+pdfminer and the docx/doc/rtf parsers are pure-Python and CPU-bound. Run on
+the event loop they stall every other request on the worker; in a thread
+they still hold the GIL. ParsingService runs them in a small pool of worker
+processes with:
+
+  - a per-format wall-clock timeout (FORMAT_TIMEOUTS). A parse that overruns
+    can't be cancelled inside its worker, so the pool is torn down (its
+    processes killed) and rebuilt for the next request. Parses that were
+    sharing the killed pool are retried once on the new one.
+  - a bound on queued work (max_queued): past it, uploads are refused with
+    ParserBusyError rather than piling up behind a slow document.
+  - per-format metrics (count, failures, timeouts, mean/max seconds), see
+    stats() and GET /health/parser.
+
+Page and size limits live in ResumeParser itself (MAX_PDF_PAGES,
+MAX_TEXT_CHARS), so they apply wherever it runs.
+"""
+import asyncio
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from config import settings
+from services.resume.parser import ResumeParser
+
+# Wall-clock seconds allowed per document, by extension
+FORMAT_TIMEOUTS = {"pdf": 30.0, "docx": 15.0, "doc": 15.0, "rtf": 10.0, "txt": 5.0}
+DEFAULT_TIMEOUT = 15.0
+DEFAULT_MAX_QUEUED = 16
+
+
+class ParserBusyError(Exception):
+    """Too many documents already queued for parsing."""
+
+
+class ParseTimeoutError(ValueError):
+    """The document took longer than its format's time limit."""
+
+
+@dataclass
+class FormatStats:
+    count: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "mean_seconds": round(self.total_seconds / self.count, 3) if self.count else 0.0,
+            "max_seconds": round(self.max_seconds, 3),
+        }
+
+
+def _file_extension(filename: str) -> str:
+    return filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+
+def _extract_text(file_content: bytes, filename: str) -> str:
+    return ResumeParser().extract_text(file_content, filename)
+
+
+class ParsingService:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ):
+        self.max_workers = max_workers or settings.RESUME_PARSER_PROCESSES
+        self.timeouts = {**FORMAT_TIMEOUTS, **(timeouts or {})}
+        self.max_queued = max_queued
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._queued = 0
+        self._stats: Dict[str, FormatStats] = {}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn, not fork: the API process has running threads (DB
+                # pool, executors) a forked child would inherit mid-flight
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _restart_pool(self, pool: ProcessPoolExecutor):
+        """Kills `pool`'s workers (a stuck parse can't be cancelled any other way)."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        for process in list(getattr(pool, "_processes", {}).values()):
+            process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _record(self, ext: str, seconds: float, outcome: str):
+        with self._lock:
+            stats = self._stats.setdefault(ext or "unknown", FormatStats())
+            stats.count += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            if outcome == "failed":
+                stats.failures += 1
+            elif outcome == "timeout":
+                stats.timeouts += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": self._queued,
+                "formats": {ext: stats.as_dict() for ext, stats in self._stats.items()},
+            }
+
+    async def parse(self, file_content: bytes, filename: str) -> str:
+        """
+        ResumeParser.extract_text in the pool. Raises ValueError (unreadable
+        file), ParseTimeoutError (a ValueError) or ParserBusyError.
+        """
+        ext = _file_extension(filename)
+        timeout = self.timeouts.get(ext, DEFAULT_TIMEOUT)
+        with self._lock:
+            if self._queued >= self.max_queued:
+                raise ParserBusyError("Too many resumes are being processed. Please retry shortly.")
+            self._queued += 1
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            for attempt in range(2):
+                pool = self._get_pool()
+                try:
+                    return await asyncio.wait_for(
+                        loop.run_in_executor(pool, _extract_text, file_content, filename), timeout
+                    )
+                except asyncio.TimeoutError:
+                    outcome = "timeout"
+                    self.logger.warning(f"Parsing {filename!r} exceeded {timeout:.0f}s; restarting parser pool.")
+                    self._restart_pool(pool)
+                    raise ParseTimeoutError(
+                        f"The {ext.upper() or 'file'} took too long to read. Please upload a smaller or text-based file."
+                    )
+                except BrokenProcessPool:
+                    # Pool killed under us (another parse timed out) or a worker crashed
+                    self._restart_pool(pool)
+                    if attempt == 1:
+                        outcome = "failed"
+                        raise ValueError(f"Failed to parse {ext.upper() or 'file'}: parser process crashed")
+        except ValueError:
+            if outcome == "ok":
+                outcome = "failed"
+            raise
+        finally:
+            with self._lock:
+                self._queued -= 1
+            self._record(ext, time.perf_counter() - started, outcome)
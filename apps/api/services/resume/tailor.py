@@ -1,27 +1,38 @@
 import logging
-from typing import Optional
+from typing import NamedTuple, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
 from config import settings
 from .analyst import ResumeData
 
+TAILOR_MODEL = "gpt-4o-mini"
+# Part of the tailored resume cache key: bump when the prompt or model changes
+TAILOR_PROMPT_VERSION = f"tailor-v1:{TAILOR_MODEL}"
+
+
+class TailorResult(NamedTuple):
+    data: dict  # in the shape of ResumeData
+    tailored: bool  # False: the LLM was unavailable or failed and `data` is the original resume
+
+
 class ResumeTailor:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         if settings.OPENAI_API_KEY:
-            self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7, openai_api_key=settings.OPENAI_API_KEY)
+            self.llm = ChatOpenAI(model=TAILOR_MODEL, temperature=0.7, openai_api_key=settings.OPENAI_API_KEY)
         else:
             self.llm = None
 
-    async def tailor(self, base_resume_data: dict, job_description: str) -> dict:
+    async def tailor(self, base_resume_data: dict, job_description: str) -> TailorResult:
         """
         Tailors a resume's content to match a specific job description.
-        Returns a new dictionary in the shape of ResumeData.
+        Falls back to the original data (tailored=False) when the LLM is
+        unavailable or fails.
         """
         if not self.llm:
             self.logger.warning("OPENAI_API_KEY missing. Returning original resume data.")
-            return base_resume_data
+            return TailorResult(base_resume_data, tailored=False)
             
         try:
             parser = PydanticOutputParser(pydantic_object=ResumeData)
@@ -57,9 +68,9 @@ Candidate's Current Resume Data (JSON):
                 "format_instructions": parser.get_format_instructions()
             })
             
-            return result.model_dump()
+            return TailorResult(result.model_dump(), tailored=True)
             
         except Exception as e:
             self.logger.error(f"Error tailoring resume: {e}")
             # Fallback to the original data if LLM fails
-            return base_resume_data
+            return TailorResult(base_resume_data, tailored=False)
@@ -0,0 +1,112 @@
+"""
+On-disk cache of tailored resumes: the LLM's structured data plus the
+rendered PDF.
+
+POST /resumes/{id}/tailor costs a gpt-4o-mini completion and a ReportLab
+render on every click, and users re-download the same tailored resume for
+the same job. Entries are keyed by tailor_cache_key():
+
+  - resume id + version (hash of its structured_data, so edits miss)
+  - job id + hash of the job description (so re-scraped edits miss)
+  - the tailor prompt version
+
+Each entry is two files, <key>.json and <key>.pdf, written atomically. Hits
+refresh the files' mtime; past `max_entries` or `max_bytes` the least
+recently used entries are deleted.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Optional, Tuple
+
+from services.resume.content_hash import content_hash
+
+
+def tailor_cache_key(resume_id: int, resume_data: dict, job_id: int, job_description: str, prompt_version: str) -> str:
+    resume_version = hashlib.sha256(json.dumps(resume_data, sort_keys=True).encode("utf-8")).hexdigest()
+    parts = [str(resume_id), resume_version, str(job_id), content_hash(job_description), prompt_version]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class TailoredResumeCache:
+    def __init__(self, root_dir: str, max_entries: int = 500, max_bytes: int = 200 * 1024 * 1024):
+        self.root_dir = root_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.root_dir, key)
+        return f"{base}.json", f"{base}.pdf"
+
+    def get(self, key: str) -> Optional[Tuple[dict, bytes]]:
+        """(tailored data, PDF bytes), or None on a miss."""
+        json_path, pdf_path = self._paths(key)
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            with open(pdf_path, "rb") as f:
+                pdf_bytes = f.read()
+            for path in (json_path, pdf_path):
+                os.utime(path)  # LRU: mtime is the last use
+            return data, pdf_bytes
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Tailored resume cache read failed for {key}: {e}")
+            return None
+
+    def put(self, key: str, data: dict, pdf_bytes: bytes) -> None:
+        json_path, pdf_path = self._paths(key)
+        try:
+            # PDF first: an entry only counts as present once its JSON exists
+            self._write_atomic(pdf_path, pdf_bytes)
+            self._write_atomic(json_path, json.dumps(data).encode("utf-8"))
+        except Exception as e:
+            self.logger.warning(f"Tailored resume cache write failed for {key}: {e}")
+            return
+        self._evict()
+
+    def _write_atomic(self, path: str, payload: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def _evict(self):
+        """Deletes least recently used entries until both bounds hold."""
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.root_dir):
+                if not name.endswith(".json"):
+                    continue
+                key = name[:-len(".json")]
+                json_path, pdf_path = self._paths(key)
+                try:
+                    size = os.path.getsize(json_path) + os.path.getsize(pdf_path)
+                    entries.append((os.path.getmtime(json_path), size, key))
+                except OSError:
+                    continue
+            total_bytes = sum(size for _, size, _ in entries)
+            entries.sort()
+            evicted = 0
+            while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+                _, size, key = entries.pop(0)
+                for path in self._paths(key):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                total_bytes -= size
+                evicted += 1
+            if evicted:
+                self.logger.info(f"Tailored resume cache evicted {evicted} entries.")
@@ -0,0 +1,93 @@
+"""
+Celery embedding tasks — fill Job.embedding for scraped jobs.
+"""
+import logging
+import time
+from sqlalchemy import update
+from celery_app import celery_app
+from database import SessionLocal
+from models import Job
+from services.resume.embedding import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+EMBED_BATCH_SIZE = 256
+# Upper bound per run so one task can't monopolise a worker; the next run
+# picks up where this one stopped (it only ever selects NULL embeddings).
+EMBED_MAX_BATCHES_PER_RUN = 200
+
+
+def job_embedding_text(title, company, location, description) -> str:
+    """The text a job is embedded from — keep in sync with anything re-embedding jobs."""
+    header = " | ".join(part for part in (title, company, location) if part)
+    return f"{header}\n{description or ''}".strip()
+
+
+@celery_app.task(bind=True, name="tasks.embedding_tasks.embed_pending_jobs_task", max_retries=1)
+def embed_pending_jobs_task(self, batch_size: int = EMBED_BATCH_SIZE, max_batches: int = EMBED_MAX_BATCHES_PER_RUN):
+    """
+    Celery task: embed jobs whose embedding is NULL, in large batches.
+    Chained after scrape_all_jobs_task. Each batch is committed on its own,
+    so the task is safe to kill and re-run — it resumes from whatever is
+    still NULL. Jobs whose batch failed stay NULL and are retried next run.
+    """
+    service = EmbeddingService()
+
+    logger.info(f"=== [Celery] Starting job embedding task (backend: {service.model_name}) ===")
+    db = SessionLocal()
+    embedded = 0
+    failed = 0
+    last_id = 0
+    started = time.monotonic()
+
+    try:
+        for _ in range(max_batches):
+            # Keyset over id so rows that failed in this run aren't re-selected
+            rows = db.query(
+                Job.id, Job.title, Job.company, Job.location, Job.description
+            ).filter(
+                Job.embedding.is_(None),
+                Job.id > last_id
+            ).order_by(Job.id).limit(batch_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            batch_started = time.monotonic()
+            texts = [job_embedding_text(r.title, r.company, r.location, r.description) for r in rows]
+            vectors = service.generate_embeddings(texts)
+
+            updates = [
+                {"id": row.id, "embedding": vector}
+                for row, vector in zip(rows, vectors) if vector is not None
+            ]
+            if updates:
+                # ORM bulk UPDATE by primary key — one executemany per batch
+                db.execute(update(Job), updates)
+                db.commit()
+
+            embedded += len(updates)
+            failed += len(rows) - len(updates)
+            batch_secs = time.monotonic() - batch_started
+            logger.info(
+                f"[Embeddings] Batch of {len(rows)}: {len(updates)} embedded in {batch_secs:.1f}s "
+                f"({len(rows) / max(batch_secs, 1e-6):.1f} jobs/s)"
+            )
+    finally:
+        db.close()
+
+    elapsed = time.monotonic() - started
+    throughput = embedded / elapsed if elapsed else 0.0
+    cache_stats = service.cache.stats() if service.cache else None
+    logger.info(
+        f"=== [Celery] Job embedding complete. Embedded {embedded}, failed {failed} "
+        f"in {elapsed:.1f}s ({throughput:.1f} jobs/s). Cache: {cache_stats} ==="
+    )
+    return {
+        "status": "success",
+        "embedded": embedded,
+        "failed": failed,
+        "seconds": round(elapsed, 2),
+        "jobs_per_second": round(throughput, 2),
+        "cache": cache_stats,
+    }
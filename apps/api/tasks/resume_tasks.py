@@ -0,0 +1,99 @@
+"""
+Celery resume tasks — background ingestion of uploaded resumes.
+
+POST /resume/upload?background=true stores the file on a Resume row with
+status "processing" and queues ingest_resume_task, so the request returns as
+soon as the bytes are stored. The task parses, analyzes and embeds, then
+flips the row to "ready" (or "failed" with a user-facing error).
+GET /resume/{id}/status is what clients poll.
+"""
+import asyncio
+import logging
+from celery.exceptions import SoftTimeLimitExceeded
+from celery_app import celery_app
+from database import SessionLocal
+from models import Resume
+from services.resume.analyst import AnalysisUnavailableError, ResumeAnalyst
+from services.resume.embedding import EmbeddingService
+from services.resume.ingestion import (
+    EMPTY_TEXT_MESSAGE, EmbeddingUnavailableError, analyze_and_embed, has_meaningful_text,
+)
+from services.resume.parser import ResumeParser
+
+logger = logging.getLogger(__name__)
+
+FAILED_MESSAGE = "Processing failed. Please try uploading the resume again."
+TIMEOUT_MESSAGE = "The file took too long to read. Please upload a smaller or text-based file."
+UNAVAILABLE_MESSAGE = "Resume analysis is temporarily unavailable. Please try uploading again later."
+
+# Prefork workers are daemonic and can't host ParsingService's process pool,
+# so the worker parses in-process (still page/size-limited by ResumeParser)
+# and the wall-clock limit is Celery's soft time limit on the whole task.
+INGEST_SOFT_TIME_LIMIT = 120
+
+
+@celery_app.task(
+    bind=True, name="tasks.resume_tasks.ingest_resume_task", max_retries=2, default_retry_delay=30,
+    soft_time_limit=INGEST_SOFT_TIME_LIMIT, time_limit=INGEST_SOFT_TIME_LIMIT + 30,
+)
+def ingest_resume_task(self, resume_id: int):
+    """
+    Celery task: parse → analyze + embed one uploaded resume.
+    Unreadable files fail immediately; unexpected errors (API outage, DB
+    hiccup) are retried before the resume is marked failed. Ingestion is
+    strict: mock analysis or a missing embedding counts as an error, never
+    as a "ready" resume.
+    """
+    db = SessionLocal()
+    try:
+        resume = db.get(Resume, resume_id)
+        if resume is None or resume.status != "processing":
+            logger.info(f"[Resume] Ingestion of {resume_id} skipped (missing or already processed).")
+            return {"status": "skipped", "resume_id": resume_id}
+
+        try:
+            text = ResumeParser().extract_text(resume.source_file, resume.source_filename or "resume.pdf")
+            if not has_meaningful_text(text):
+                raise ValueError(EMPTY_TEXT_MESSAGE)
+        except ValueError as e:
+            return _mark_failed(db, resume, str(e))
+
+        structured_data, vector = asyncio.run(
+            analyze_and_embed(ResumeAnalyst(), EmbeddingService(), text, strict=True)
+        )
+        resume.content = text
+        resume.structured_data = structured_data
+        resume.embedding = vector
+        resume.status = "ready"
+        resume.error = None
+        db.commit()
+        logger.info(f"[Resume] Ingested resume {resume_id}.")
+        return {"status": "ready", "resume_id": resume_id}
+
+    except SoftTimeLimitExceeded:
+        db.rollback()
+        resume = db.get(Resume, resume_id)
+        if resume is not None:
+            return _mark_failed(db, resume, TIMEOUT_MESSAGE)
+        return {"status": "failed", "resume_id": resume_id}
+    except Exception as e:
+        db.rollback()
+        if self.request.retries < self.max_retries:
+            logger.warning(f"[Resume] Ingestion of {resume_id} failed ({e}); retrying.")
+            raise self.retry(exc=e)
+        logger.error(f"[Resume] Ingestion of {resume_id} failed: {e}")
+        resume = db.get(Resume, resume_id)
+        if resume is not None:
+            unavailable = isinstance(e, (AnalysisUnavailableError, EmbeddingUnavailableError))
+            return _mark_failed(db, resume, UNAVAILABLE_MESSAGE if unavailable else FAILED_MESSAGE)
+        return {"status": "failed", "resume_id": resume_id}
+    finally:
+        db.close()
+
+
+def _mark_failed(db, resume: Resume, error: str) -> dict:
+    resume.status = "failed"
+    resume.error = error
+    db.commit()
+    logger.info(f"[Resume] Resume {resume.id} failed: {error}")
+    return {"status": "failed", "resume_id": resume.id, "error": error}
@@ -1,10 +1,18 @@
 """
 Celery scraping tasks — daily job ingestion from all sources.
+
+scrape_all_jobs_task fans out one scrape_source_task per source as a Celery
+chord, so sources run in parallel across worker processes (start the worker
+with --concurrency >= number of sources to get full overlap).
+finalize_scraping_task aggregates the per-source results once all of them
+have finished, then hands new jobs to the embedding stage.
 """
 import logging
+from celery import chord, group
 from celery_app import celery_app
-from database import SessionLocal
-from services.browser.job_scraper import JobScraper
+from services.browser.scrape_orchestrator import SourcePlan, run_source
+from services.jobs.filters_cache import invalidate_filters_cache
+from tasks.embedding_tasks import embed_pending_jobs_task
 
 logger = logging.getLogger(__name__)
 
@@ -37,75 +45,77 @@ NAUKRI_SEARCHES = [
     ("data engineer", ""),
 ]
 
+# Per-domain concurrency caps and politeness spacing between term starts.
+# Under the sync engine browser sources run one term at a time, since each
+# concurrent term costs its own Chromium; the async engine shares one
+# Chromium per source and keeps up to max_pages pages in flight.
+SOURCE_PLANS = {
+    plan.name: plan for plan in [
+        SourcePlan(
+            name="WeWorkRemotely", method="scrape_weworkremotely",
+            calls=[{"search_term": term} for term in WWR_TERMS],
+            uses_browser=True, max_concurrency=1, max_pages=3, min_interval=2.0,
+        ),
+        SourcePlan(
+            name="Wellfound", method="scrape_wellfound",
+            calls=[{"role": role} for role in WELLFOUND_ROLES],
+            uses_browser=True, max_concurrency=1, max_pages=2, min_interval=5.0,
+        ),
+        SourcePlan(
+            name="Monster", method="scrape_monster",
+            calls=[{"search_term": term, "location": loc} for term, loc in MONSTER_SEARCHES],
+            uses_browser=True, max_concurrency=1, max_pages=3, min_interval=3.0,
+        ),
+        SourcePlan(
+            name="Naukri", method="scrape_naukri",
+            calls=[{"search_term": term, "location": loc} for term, loc in NAUKRI_SEARCHES],
+            uses_browser=True, max_concurrency=1, max_pages=3, min_interval=3.0,
+        ),
+        SourcePlan(name="RemoteOK", method="scrape_remoteok"),
+        SourcePlan(name="Remotive", method="scrape_remotive"),
+    ]
+}
+
 
 @celery_app.task(bind=True, name="tasks.scraping_tasks.scrape_all_jobs_task", max_retries=1)
 def scrape_all_jobs_task(self):
     """
     Celery task: scrape all job sources and persist to DB.
     Scheduled daily at 2 AM UTC via Celery Beat.
-    Each source is independent — one failure won't stop others.
+    Each source is an independent task — one failure won't stop others.
     """
     logger.info("=== [Celery] Starting daily job scraping task ===")
-    db = SessionLocal()
-    scraper = JobScraper(db)
-    results = {}
-
-    # ── WeWorkRemotely ─────────────────────────────────────────
-    wwr_total = 0
-    for term in WWR_TERMS:
-        try:
-            count = scraper.scrape_weworkremotely(search_term=term)
-            wwr_total += count
-        except Exception as e:
-            logger.error(f"[WeWorkRemotely] Failed for '{term}': {e}")
-    results["WeWorkRemotely"] = wwr_total
-
-    # ── Wellfound ──────────────────────────────────────────────
-    wf_total = 0
-    for role in WELLFOUND_ROLES:
-        try:
-            count = scraper.scrape_wellfound(role=role)
-            wf_total += count
-        except Exception as e:
-            logger.error(f"[Wellfound] Failed for '{role}': {e}")
-    results["Wellfound"] = wf_total
-
-    # ── Monster ────────────────────────────────────────────────
-    monster_total = 0
-    for term, loc in MONSTER_SEARCHES:
-        try:
-            count = scraper.scrape_monster(search_term=term, location=loc)
-            monster_total += count
-        except Exception as e:
-            logger.error(f"[Monster] Failed for '{term}': {e}")
-    results["Monster"] = monster_total
-
-    # ── Naukri ─────────────────────────────────────────────────
-    naukri_total = 0
-    for term, loc in NAUKRI_SEARCHES:
-        try:
-            count = scraper.scrape_naukri(search_term=term, location=loc)
-            naukri_total += count
-        except Exception as e:
-            logger.error(f"[Naukri] Failed for '{term}': {e}")
-    results["Naukri"] = naukri_total
-
-    # ── RemoteOK (Public API) ──────────────────────────────────
-    try:
-        results["RemoteOK"] = scraper.scrape_remoteok()
-    except Exception as e:
-        logger.error(f"[RemoteOK] Task failed: {e}")
-        results["RemoteOK"] = 0
-
-    # ── Remotive (Public API) ──────────────────────────────────
-    try:
-        results["Remotive"] = scraper.scrape_remotive()
-    except Exception as e:
-        logger.error(f"[Remotive] Task failed: {e}")
-        results["Remotive"] = 0
-
-    db.close()
+    workflow = chord(
+        group(scrape_source_task.s(name) for name in SOURCE_PLANS),
+        finalize_scraping_task.s(),
+    )
+    result = workflow.apply_async()
+    return {"status": "dispatched", "sources": list(SOURCE_PLANS), "chord_id": result.id}
+
+
+@celery_app.task(bind=True, name="tasks.scraping_tasks.scrape_source_task", max_retries=1)
+def scrape_source_task(self, source: str):
+    """Celery task: scrape every search term of one source."""
+    return run_source(SOURCE_PLANS[source])
+
+
+@celery_app.task(bind=True, name="tasks.scraping_tasks.finalize_scraping_task")
+def finalize_scraping_task(self, source_results: list):
+    """Chord callback: aggregate per-source results and kick off embedding."""
+    results = {r["source"]: r["added"] for r in source_results}
+    errors = {r["source"]: r["errors"] for r in source_results if r["errors"]}
+    timings = {r["source"]: r["seconds"] for r in source_results}
+
+    # Scrapers invalidate per commit; repeat once at the end in case one of
+    # those hit a Redis hiccup.
+    invalidate_filters_cache()
 
     grand_total = sum(results.values())
-    logger.info(f"=== [Celery] Daily scraping complete. Results: {results}. Grand total: {grand_total} new jobs ===")
-    return {"status": "success", "jobs_added": results, "total": grand_total}
+    logger.info(
+        f"=== [Celery] Daily scraping complete. Results: {results}. Errors: {errors}. "
+        f"Seconds per source: {timings}. Grand total: {grand_total} new jobs ==="
+    )
+
+    # New jobs have no embeddings yet — hand them to the embedding stage
+    embed_pending_jobs_task.delay()
+    return {"status": "success", "jobs_added": results, "errors": errors, "seconds": timings, "total": grand_total}
@@ -0,0 +1,56 @@
+import math
+
+from services.resume.embedding_backends import (
+    EMBEDDING_DIMENSIONS, EmbeddingBackend, HashingEmbeddingBackend,
+)
+
+TEXTS = [
+    "Senior Python engineer: Django, Postgres, Celery.",
+    "Python developer with Django and PostgreSQL experience.",
+    "Registered nurse for night shifts in a busy ward.",
+]
+
+def _cosine(a, b):
+    return sum(x * y for x, y in zip(a, b))
+
+def test_hashing_backend_shape():
+    print("Testing HashingEmbeddingBackend dimensions and norm...")
+    vectors = HashingEmbeddingBackend().embed_documents(TEXTS)
+    assert len(vectors) == len(TEXTS)
+    for vector in vectors:
+        assert len(vector) == EMBEDDING_DIMENSIONS == 1536
+        assert math.isclose(math.sqrt(sum(x * x for x in vector)), 1.0, rel_tol=1e-5)
+    print(f"✅ {EMBEDDING_DIMENSIONS}-d, unit norm")
+
+def test_hashing_backend_deterministic():
+    print("Testing HashingEmbeddingBackend determinism...")
+    first = HashingEmbeddingBackend().embed_documents(TEXTS)
+    second = HashingEmbeddingBackend().embed_documents(list(reversed(TEXTS)))[::-1]
+    assert first == second
+    print("✅ Same text, same vector, regardless of instance or batch position")
+
+    python, django, nurse = first
+    assert _cosine(python, django) > _cosine(python, nurse)
+    print("✅ Shared vocabulary lands closer")
+
+def test_hashing_backend_empty_text():
+    print("Testing HashingEmbeddingBackend on empty text...")
+    for text in ("", "   ", "!!!"):
+        vector = HashingEmbeddingBackend().embed_documents([text])[0]
+        assert len(vector) == EMBEDDING_DIMENSIONS and not any(vector)
+    print("✅ Empty text gives a zero vector (no NaNs)")
+
+def test_backend_is_abstract():
+    print("Testing EmbeddingBackend is abstract...")
+    try:
+        EmbeddingBackend()
+    except TypeError:
+        print("✅ EmbeddingBackend can't be instantiated")
+    else:
+        raise AssertionError("EmbeddingBackend() should raise TypeError")
+
+if __name__ == "__main__":
+    test_hashing_backend_shape()
+    test_hashing_backend_deterministic()
+    test_hashing_backend_empty_text()
+    test_backend_is_abstract()
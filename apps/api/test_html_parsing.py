@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from services.browser.html_parsing import DESCRIPTION_MAX_CHARS, SelectorChain, make_soup, strip_html
+
+FIXTURES = Path(__file__).parent / "tests" / "fixtures"
+
+EDGE_CASES = [
+    "<p>Salary: &pound;60k &amp; equity</p>",
+    "<div><p>Nested <b>bold</b> and <i>italic</i></p><ul><li>One</li><li>Two</li></ul></div>",
+    "<p>Before</p><script>var tracking = 1;</script><style>p { color: red }</style><p>After</p>",
+    "<p>   spaced   out   </p>\n\n<br/><p>\ttabs\t</p>",
+    "<p>Unclosed <b>tags",
+    "<p>" + "word " * 1000 + "</p>",  # longer than the limit
+    "<p>" + "x" * 4094 + "&amp;" + "y" * 10 + "</p>",  # entity across a feed chunk
+]
+
+def _get_text(html):
+    return BeautifulSoup(html, "html.parser").get_text(separator=" ", strip=True)[:DESCRIPTION_MAX_CHARS]
+
+def test_strip_html_matches_get_text():
+    print("Testing strip_html against BeautifulSoup.get_text...")
+    descriptions = json.loads((FIXTURES / "job_descriptions.json").read_text())
+    for html in descriptions + EDGE_CASES:
+        assert strip_html(html) == _get_text(html), html[:80]
+    print(f"✅ Identical on {len(descriptions)} fixture descriptions and {len(EDGE_CASES)} edge cases")
+
+def test_strip_html_limit_and_plain_text():
+    print("Testing strip_html limits...")
+    assert len(strip_html("<p>" + "word " * 1000 + "</p>")) == DESCRIPTION_MAX_CHARS
+    assert strip_html("<p>Python and Django</p>", limit=6) == "Python"
+    print("✅ Output is cut at the limit")
+
+    assert strip_html("Plain text, no markup") == "Plain text, no markup"
+    assert strip_html("") == "" and strip_html(None) is None
+    print("✅ Input without markup is returned unchanged")
+
+def test_selector_chain_fallback():
+    print("Testing SelectorChain...")
+    soup = make_soup('<div class="card"><h2 class="title">Engineer</h2></div><div class="card"></div>')
+    assert len(SelectorChain(".job", "div.card").select(soup)) == 2
+    assert SelectorChain("h3", "h2.title").select_one(soup).get_text() == "Engineer"
+    assert SelectorChain(".missing", "#absent").select(soup) == []
+    assert SelectorChain(".missing").select_one(soup) is None
+    print("✅ First selector that matches wins; none matching gives nothing")
+
+if __name__ == "__main__":
+    test_strip_html_matches_get_text()
+    test_strip_html_limit_and_plain_text()
+    test_selector_chain_fallback()
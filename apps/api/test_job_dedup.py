@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+from services.jobs.dedup import (
+    canonicalize_url, dedup_key, content_simhash, is_near_duplicate, is_same_posting,
+)
+
+# (raw URL, expected canonical URL)
+URL_CASES = [
+    ("https://remoteok.com/remote-jobs/123", "https://remoteok.com/remote-jobs/123"),
+    ("HTTPS://www.RemoteOK.com:443/remote-jobs/123/", "https://remoteok.com/remote-jobs/123"),
+    ("https://remotive.com/job/42?utm_source=feed&utm_medium=rss", "https://remotive.com/job/42"),
+    ("https://example.com/jobs?b=2&ref=abc&a=1#apply", "https://example.com/jobs?a=1&b=2"),
+]
+
+DESCRIPTION = (
+    "We are hiring a senior Python engineer to build data pipelines with "
+    "Postgres and Celery in a remote friendly team across Europe."
+)
+
+def test_canonical_urls():
+    print("Testing URL canonicalization...")
+    for raw, expected in URL_CASES:
+        assert canonicalize_url(raw) == expected, f"{raw!r} → {canonicalize_url(raw)!r}"
+        print(f"✅ {raw!r} → {expected!r}")
+
+def test_fingerprints():
+    print("Testing content fingerprints...")
+    assert dedup_key("Senior Python Engineer", "Acme, Inc.") == dedup_key("senior python engineer", "ACME")
+    assert dedup_key("Senior Python Engineer", "Acme") != dedup_key("Python Engineer", "Acme")
+
+    original = content_simhash("Senior Python Engineer", "Acme", DESCRIPTION)
+    reposted = content_simhash("Senior Python Engineer", "Acme Inc", f"<p>{DESCRIPTION}</p> Apply now.")
+    different = content_simhash("Senior Python Engineer", "Acme", "Own our React design system and marketing site.")
+    assert is_near_duplicate(original, reposted)
+    assert not is_near_duplicate(original, different)
+    print("✅ Reposted description collapses, different role does not")
+
+    # Placeholder descriptions and fallback company names never collapse
+    assert content_simhash("Senior Python Engineer", "Acme", "Job scraped from RemoteOK.") is None
+    assert not is_near_duplicate(None, original)
+    assert not is_near_duplicate(None, None)
+    for fallback in ("Startup", "Company", "Unknown", "", None):
+        assert dedup_key("Software Engineer", fallback) is None, fallback
+    print("✅ Placeholder descriptions and fallback companies are never bucketed together")
+
+def test_same_posting():
+    print("Testing same-posting window and location...")
+    simhash = content_simhash("Senior Python Engineer", "Acme", DESCRIPTION)
+    posted = datetime(2026, 10, 1, 12, 0)
+    job = {"content_simhash": simhash, "location_is_worldwide": True, "location_regions": ["remote"], "posted_at": posted}
+
+    assert is_same_posting(job, {**job, "location_regions": ["anywhere"], "posted_at": posted + timedelta(days=2)})
+    # Stored rows come back timezone-aware
+    assert is_same_posting(job, {**job, "posted_at": posted.replace(tzinfo=timezone.utc)})
+    print("✅ Repost within the window collapses")
+
+    berlin = {**job, "location_is_worldwide": False, "location_regions": ["berlin", "germany"]}
+    assert not is_same_posting(berlin, {**berlin, "location_regions": ["munich", "germany"]})
+    assert not is_same_posting(job, berlin)
+    print("✅ Same role in another city does not")
+
+    assert not is_same_posting(job, {**job, "posted_at": posted + timedelta(days=60)})
+    assert not is_same_posting(job, {**job, "posted_at": None})
+    print("✅ Re-opening months later does not")
+
+if __name__ == "__main__":
+    test_canonical_urls()
+    test_fingerprints()
+    test_same_posting()
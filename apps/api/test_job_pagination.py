@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+from database import SessionLocal
+from models import Job
+from services.jobs.pagination import (
+    InvalidCursorError, decode_cursor, encode_cursor, fetch_page_after,
+)
+
+def test_cursor_round_trip():
+    print("Testing cursor encoding...")
+    posted = datetime(2026, 10, 1, 9, 30)
+    cursor = decode_cursor(encode_cursor(Job(id=42, posted_at=posted)))
+    assert (cursor.posted_at, cursor.id) == (posted, 42)
+    print("✅ Dated cursor round-trips")
+
+    cursor = decode_cursor(encode_cursor(Job(id=7, posted_at=None)))
+    assert (cursor.posted_at, cursor.id) == (None, 7)
+    print("✅ Undated cursor round-trips")
+
+def test_invalid_cursor():
+    print("Testing invalid cursors...")
+    for bad in ("not-a-cursor", "e30", "eyJwIjpudWxsfQ"):  # garbage, {}, {"p":null}
+        try:
+            decode_cursor(bad)
+        except InvalidCursorError:
+            print(f"✅ {bad!r} rejected")
+        else:
+            raise AssertionError(f"{bad!r} was accepted")
+
+def test_fetch_pages():
+    """Walks a listing of dated and undated jobs page by page (rolled back afterwards)."""
+    print("Testing keyset pagination against the database...")
+    db = SessionLocal()
+    try:
+        marker = "pagination-test-job"
+        start = datetime(2026, 1, 1)
+        dated = [
+            Job(title=marker, company="Acme", url=f"https://example.com/{marker}/{i}", source="test",
+                posted_at=start + timedelta(hours=i // 2))  # pairs share posted_at: id breaks the tie
+            for i in range(5)
+        ]
+        undated = [
+            Job(title=marker, company="Acme", url=f"https://example.com/{marker}/undated-{i}", source="test")
+            for i in range(3)
+        ]
+        db.add_all(dated + undated)
+        db.flush()
+
+        query = db.query(Job).filter(Job.title == marker)
+        expected = [job.id for job in query.order_by(Job.posted_at.desc().nulls_last(), Job.id.desc())]
+        assert len(expected) == 8
+
+        served, cursor, pages = [], None, 0
+        while True:
+            rows, cursor = fetch_page_after(query, cursor, limit=3)
+            served += [job.id for job in rows]
+            pages += 1
+            if cursor is None:
+                break
+        assert served == expected, f"{served} != {expected}"
+        assert pages == 3
+        print("✅ Every job served once, in listing order, across dated and undated rows")
+
+        rows, cursor = fetch_page_after(query, None, limit=8)
+        assert len(rows) == 8 and cursor is None
+        print("✅ No cursor once the listing is exhausted")
+    finally:
+        db.rollback()
+        db.close()
+
+if __name__ == "__main__":
+    test_cursor_round_trip()
+    test_invalid_cursor()
+    test_fetch_pages()
@@ -0,0 +1,37 @@
+from services.jobs.location import (
+    classify_location, location_tokens,
+    REMOTE_KIND_WORLDWIDE, REMOTE_KIND_REMOTE, REMOTE_KIND_RESTRICTED,
+    REMOTE_KIND_ONSITE, REMOTE_KIND_UNSPECIFIED,
+)
+
+# (raw Job.location, expected is_worldwide, expected remote_kind)
+CASES = [
+    (None, True, REMOTE_KIND_UNSPECIFIED),
+    ("", True, REMOTE_KIND_UNSPECIFIED),
+    ("Remote", True, REMOTE_KIND_REMOTE),
+    ("Worldwide", True, REMOTE_KIND_WORLDWIDE),
+    ("Anywhere in the World", True, REMOTE_KIND_WORLDWIDE),
+    ("Remote - US", False, REMOTE_KIND_RESTRICTED),
+    ("Remote, USA", False, REMOTE_KIND_RESTRICTED),
+    ("Remote: Spain", False, REMOTE_KIND_RESTRICTED),
+    ("Berlin, Germany", False, REMOTE_KIND_ONSITE),
+]
+
+def test_location_classification():
+    print("Testing location classification...")
+    for raw, worldwide, kind in CASES:
+        cls = classify_location(raw)
+        assert cls.is_worldwide == worldwide, f"{raw!r}: is_worldwide={cls.is_worldwide}"
+        assert cls.remote_kind == kind, f"{raw!r}: remote_kind={cls.remote_kind}"
+        print(f"✅ {raw!r} → {cls.remote_kind}")
+
+def test_region_aliases():
+    print("Testing region aliases...")
+    assert location_tokens("United States") == ["usa"]
+    assert location_tokens("Remote - U.S.") == ["remote", "usa"]
+    assert "usa" in location_tokens("New York, US")
+    print("✅ Aliases fold to the same token")
+
+if __name__ == "__main__":
+    test_location_classification()
+    test_region_aliases()
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+
+from models import ScrapeState
+from services.browser.scrape_state import (
+    KNOWN_RUN_TO_STOP, WATERMARK_GRACE, is_seen, unseen_listing,
+)
+
+def _job(n):
+    return {"title": f"Job {n}", "url": f"https://example.com/jobs/{n}"}
+
+def _state(known, newest_posted_at=None):
+    return ScrapeState(
+        source="Test", query="python",
+        recent_urls=[f"https://example.com/jobs/{n}" for n in known],
+        newest_posted_at=newest_posted_at,
+    )
+
+def test_unseen_listing():
+    print("Testing unseen_listing...")
+    listing = [_job(n) for n in range(1, 9)]
+    assert unseen_listing(listing, None) == listing
+    print("✅ No state: the whole listing is new")
+
+    # New jobs 1-2 above the known 3, 4, 5...: stops at the third known in a row
+    state = _state([3, 4, 5, 6, 7, 8])
+    assert unseen_listing(listing, state) == [_job(1), _job(2)]
+    print(f"✅ Stops after {KNOWN_RUN_TO_STOP} known items in a row")
+
+    # A pinned (known) post on top, then fresh ones: a short known run doesn't stop the walk
+    state = _state([1, 2, 6, 7, 8])
+    assert unseen_listing(listing, state) == [_job(3), _job(4), _job(5)]
+    print("✅ Pinned known posts are skipped, not treated as the end")
+
+    # Tracking parameters don't make a known URL look new
+    tracked = [{**job, "url": job["url"] + "?utm_source=feed"} for job in listing[:3]]
+    assert unseen_listing(tracked, _state([1, 2, 3])) == []
+    print("✅ URLs compared in canonical form")
+
+def test_is_seen():
+    print("Testing is_seen...")
+    mark = datetime(2026, 10, 1, 12, 0)
+    state = _state([1], newest_posted_at=mark)
+
+    assert not is_seen("https://example.com/jobs/2", mark, None)
+    assert is_seen("https://example.com/jobs/1", None, state)
+    print("✅ Listed on the last run → seen")
+
+    assert not is_seen("https://example.com/jobs/2", mark + timedelta(minutes=1), state)
+    assert not is_seen("https://example.com/jobs/2", mark - WATERMARK_GRACE + timedelta(minutes=1), state)
+    print(f"✅ Within {WATERMARK_GRACE} of the high-water mark → not seen (back-dated posts)")
+
+    assert is_seen("https://example.com/jobs/2", mark - WATERMARK_GRACE - timedelta(minutes=1), state)
+    print("✅ Older than the grace window → seen")
+
+    assert not is_seen("https://example.com/jobs/2", None, state)
+    print("✅ Undated unknown item → not seen")
+
+if __name__ == "__main__":
+    test_unseen_listing()
+    test_is_seen()